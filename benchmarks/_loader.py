@@ -0,0 +1,24 @@
+"""
+ベンチマーク用に mensetsu.py を一時ディレクトリへコピーして import する。
+保存先（BASE_DIR）が一時ディレクトリになるので、実データの JSON には触れない。
+"""
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_mensetsu(path: str = os.path.join(ROOT, "mensetsu.py"), name: str = "mensetsu"):
+    os.environ.setdefault("GENAI_API_KEY", "bench")
+    os.environ["GENAI_FAKE"] = "1"
+    workdir = tempfile.mkdtemp(prefix=f"{name}-")
+    os.chdir(workdir)
+    shutil.copy(path, os.path.join(workdir, "mensetsu.py"))
+    spec = importlib.util.spec_from_file_location(name, os.path.join(workdir, "mensetsu.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
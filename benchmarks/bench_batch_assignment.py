@@ -0,0 +1,95 @@
+"""
+面接官割り当ての before / after 比較。
+
+before: 候補者ごとに到着順で「今いちばん安い面接官」を選ぶ（従来の 1 件ずつの推薦と同じ貪欲法）
+after : solve_assignments で全員まとめて最小費用流を解く
+
+    python benchmarks/bench_batch_assignment.py [候補者数] [面接官数]
+"""
+import random
+import sys
+import time
+from collections import Counter
+
+from _loader import load_mensetsu
+
+m = load_mensetsu()
+
+
+def random_timeline(rng: random.Random):
+    out = []
+    for day in range(14):
+        if rng.random() < 0.5:
+            start = day * 1440 + rng.choice([600, 780, 1140])
+            out.append((start, start + rng.choice([60, 120, 180])))
+    return out
+
+
+def greedy(candidates, interviewers, capacity=m.ASSIGN_MAX_OPEN_PER_INTERVIEWER):
+    load = {iv.user_id: iv.open_load for iv in interviewers}
+    assigned, unassigned = {}, []
+    for c in candidates:
+        best = None
+        for iv in interviewers:
+            cost = m._assignment_edge_cost(c, iv)
+            if cost is None or load[iv.user_id] >= capacity:
+                continue
+            total = cost + m.ASSIGN_LOAD_COST * (iv.month_count + load[iv.user_id])
+            if best is None or total < best[0]:
+                best = (total, iv.user_id)
+        if best is None:
+            unassigned.append(c.key)
+            continue
+        assigned[c.key] = best[1]
+        load[best[1]] += 1
+    return assigned, unassigned
+
+
+def total_cost(assigned, candidates, interviewers):
+    by_key = {c.key: c for c in candidates}
+    by_id = {iv.user_id: iv for iv in interviewers}
+    per_iv = Counter()
+    cost = 0
+    for key, uid in assigned.items():
+        iv = by_id[uid]
+        cost += m._assignment_edge_cost(by_key[key], iv)
+        cost += m.ASSIGN_LOAD_COST * (iv.month_count + iv.open_load + per_iv[uid])
+        per_iv[uid] += 1
+    return cost
+
+
+def main(n_candidates: int = 200, n_interviewers: int = 40, seed: int = 1) -> None:
+    rng = random.Random(seed)
+    interviewers = [
+        m.AssignmentInterviewer(
+            1000 + i, random_timeline(rng) if rng.random() < 0.8 else None,
+            rng.randint(0, 8), rng.randint(0, 3),
+        )
+        for i in range(n_interviewers)
+    ]
+    candidates = [
+        m.AssignmentCandidate(f"c{i}", random_timeline(rng) if rng.random() < 0.9 else None)
+        for i in range(n_candidates)
+    ]
+
+    t = time.perf_counter()
+    g_assigned, g_unassigned = greedy(candidates, interviewers)
+    g_ms = (time.perf_counter() - t) * 1000
+
+    t = time.perf_counter()
+    result = m.solve_assignments(candidates, interviewers)
+    s_ms = (time.perf_counter() - t) * 1000
+
+    for label, assigned, unassigned, ms in (
+        ("before (greedy)", g_assigned, g_unassigned, g_ms),
+        ("after  (mcf)   ", result.assigned, result.unassigned, s_ms),
+    ):
+        load = Counter(assigned.values())
+        print(
+            f"{label}: {ms:7.1f} ms  assigned={len(assigned):4d}  unassigned={len(unassigned):4d}  "
+            f"max_load={max(load.values(), default=0)}  cost={total_cost(assigned, candidates, interviewers)}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
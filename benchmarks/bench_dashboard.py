@@ -0,0 +1,132 @@
+"""
+ダッシュボードの負荷試験（候補者 1000 名）。
+
+Discord の上限（説明文 4096 文字 / 1 メッセージの埋め込み合計 6000 文字・10 個）を
+超えたら HTTPException を投げる偽チャンネルに対して update_dashboard を回し、
+初回・変化なし・1 名だけ変化・大幅減少・ページ消失時の API 呼び出し数と所要時間を出す。
+
+    python benchmarks/bench_dashboard.py [候補者数]
+"""
+import asyncio
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from _loader import load_mensetsu
+
+m = load_mensetsu()
+discord = m.discord
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.messages = {}
+        self.next_id = 1
+        self.calls = {"send": 0, "edit": 0, "delete": 0}
+
+    def reset(self):
+        self.calls = {k: 0 for k in self.calls}
+
+    @staticmethod
+    def check(embeds):
+        if len(embeds) > 10:
+            raise discord.HTTPException(SimpleNamespace(status=400, reason="Bad Request"), "too many embeds")
+        total = 0
+        for e in embeds:
+            if len(e.description) > 4096:
+                raise discord.HTTPException(SimpleNamespace(status=400, reason="Bad Request"), "description > 4096")
+            total += len(e.title) + len(e.description) + len(e.footer.text or "")
+        if total > 6000:
+            raise discord.HTTPException(SimpleNamespace(status=400, reason="Bad Request"), f"embeds total {total} > 6000")
+
+
+http = FakeHTTP()
+
+
+class PartialMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+
+    async def edit(self, content=None, embeds=()):
+        if self.id not in http.messages:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+        http.check(embeds)
+        http.calls["edit"] += 1
+        http.messages[self.id] = embeds
+
+    async def delete(self):
+        http.calls["delete"] += 1
+        http.messages.pop(self.id, None)
+
+
+class DashboardChannel:
+    def get_partial_message(self, message_id):
+        return PartialMessage(message_id)
+
+    async def send(self, embeds=()):
+        http.check(embeds)
+        http.calls["send"] += 1
+        message_id, http.next_id = http.next_id, http.next_id + 1
+        http.messages[message_id] = embeds
+        return PartialMessage(message_id)
+
+
+class User:
+    def __init__(self, uid):
+        self.id = uid
+        self.mention = f"<#{uid}>"
+        self.display_name = f"候補者{uid % 100000:05d}"
+
+
+class Bot:
+    async def wait_until_ready(self):
+        pass
+
+    def get_channel(self, channel_id):
+        return DashboardChannel() if channel_id == m.DASHBOARD_CHANNEL_ID else User(channel_id)
+
+    def get_user(self, user_id):
+        return User(user_id)
+
+
+async def main(n_candidates: int) -> None:
+    saves = [0]
+
+    async def fake_save():
+        saves[0] += 1
+
+    m.data_manager.save_data = fake_save
+    progress = m.data_manager.candidate_progress
+    rng = random.Random(0)
+    statuses = ["プロフィール未記入", "記入済み", "担当者待ち", "日程調整済み", "面接済み"]
+    for i in range(n_candidates):
+        progress[f"k{i}"] = {
+            "status": rng.choice(statuses), "channel_id": 10**17 + i, "candidate_id": 10**17 + 50000 + i,
+            "interviewer_id": 10**17 + rng.randint(0, 39),
+            "interview_time": f"2026-{rng.randint(10, 12)}-{rng.randint(10, 28)}T20:00:00+09:00",
+        }
+    bot = Bot()
+
+    async def step(label):
+        http.reset()
+        t = time.perf_counter()
+        await m.update_dashboard(bot)
+        ms = (time.perf_counter() - t) * 1000
+        print(f"{label:10s} {ms:7.1f} ms  calls={http.calls}  pages={len(http.messages)}  saves={saves[0]}")
+
+    await step("initial")
+    await step("no-op")
+    key = next(k for k, v in progress.items() if v["status"] == "面接済み")
+    progress[key]["interviewer_id"] = 10**17 + 1
+    await step("1 change")
+    for key in list(progress)[50:]:
+        del progress[key]
+    await step("shrink")
+    http.messages.clear()
+    m.dashboard_model.sent_hashes = []
+    await step("recreate")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
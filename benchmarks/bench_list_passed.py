@@ -0,0 +1,184 @@
+"""
+/list_passed_candidates の所要時間（メンバー 1 万 / 候補者ロール約 3 千 / 進行中 2 千件 / 面接記録 2 万件）。
+
+discord.py と同じく Role.members・Member.roles を呼ぶたびに全走査するメンバー・ロールを使う。
+before: 索引化する前の全走査（候補者ごとに candidate_progress を総なめ、担当者確認のたびに
+        Role.members を作り直す）をこのファイル内で再現したもの
+after : 現行の /list_passed_candidates（候補者 ID の索引・最新担当者の表を引く）
+git のリビジョンを渡すと、その時点の mensetsu.py のコマンドも同じデータで測る。
+
+    python benchmarks/bench_list_passed.py            # before / after
+    python benchmarks/bench_list_passed.py 5d5abf0^   # ＋そのリビジョンのコマンド
+"""
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from unittest import mock
+
+import discord
+
+from _loader import ROOT, load_mensetsu
+
+
+class Role:
+    def __init__(self, role_id, guild):
+        self.id, self.guild = role_id, guild
+
+    @property
+    def members(self):
+        return [m for m in self.guild.all_members if self.id in m.role_ids]
+
+
+class Member:
+    def __init__(self, member_id, role_ids, guild):
+        self.id, self.role_ids, self.guild = member_id, set(role_ids), guild
+        self.display_name = f"m{member_id:05d}"
+
+    @property
+    def roles(self):
+        return sorted((self.guild.role_objs[r] for r in self.role_ids), key=lambda r: r.id)
+
+    def get_role(self, role_id):
+        return self.guild.role_objs.get(role_id) if role_id in self.role_ids else None
+
+
+class Guild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+        self.all_members, self.by_id, self.role_objs = [], {}, {}
+
+    @property
+    def members(self):
+        return list(self.all_members)
+
+    def get_member(self, member_id):
+        return self.by_id.get(member_id)
+
+    def get_role(self, role_id):
+        return self.role_objs.get(role_id)
+
+
+def populate(m):
+    rng = random.Random(3)
+    guild = Guild(m.MAIN_GUILD_ID)
+    candidate_roles = list(m.CANDIDATE_ROLE_IDS) if hasattr(m, "CANDIDATE_ROLE_IDS") else [
+        784723518402592803, 1289488152301539339,
+    ]
+    for role_id in candidate_roles + [m.INTERVIEWER_ROLE_ID, 5]:
+        guild.role_objs[role_id] = Role(role_id, guild)
+    for i in range(10000):
+        roles = [5]
+        if i < 40:
+            roles.append(m.INTERVIEWER_ROLE_ID)
+        elif rng.random() < 0.3:
+            roles.append(rng.choice(candidate_roles))
+        member = Member(i, roles, guild)
+        guild.all_members.append(member)
+        guild.by_id[i] = member
+    dm = m.data_manager
+    for _ in range(2000):
+        uid = rng.randint(40, 9999)
+        dm.candidate_progress[f"{guild.id}-{uid}"] = {
+            "candidate_id": uid, "source_guild_id": guild.id,
+            "interviewer_id": rng.choice([None, rng.randint(0, 39)]),
+        }
+    if hasattr(dm, "index"):
+        dm.index.rebuild(dm.candidate_progress, dm.interview_channel_mapping)
+    for _ in range(20000):
+        dm.interview_records.append({
+            "date": "2026-09-01T10:00:00+09:00", "interviewer_id": rng.randint(0, 45),
+            "interviewee_id": rng.randint(40, 9999), "result": "PASS",
+        })
+    return guild
+
+
+def full_scan(m, guild):
+    """索引化する前の /list_passed_candidates の集計と出力（全走査）"""
+    candidate_role_ids = set(m.CANDIDATE_ROLE_IDS)
+    interviewer_role = guild.get_role(m.INTERVIEWER_ROLE_ID)
+    dm = m.data_manager
+    mapping = defaultdict(list)
+    candidate_members = [
+        mem for mem in guild.members if any(r.id in candidate_role_ids for r in mem.roles)
+    ]
+    latest = {}
+    for rec in reversed(list(dm.interview_records)):
+        uid = rec.get("interviewee_id")
+        if uid is not None and uid not in latest:
+            latest[uid] = rec.get("interviewer_id")
+    for member in candidate_members:
+        iid = None
+        prog = next(
+            (cp for cp in dm.candidate_progress.values()
+             if cp.get("candidate_id") == member.id and cp.get("source_guild_id") == m.MAIN_GUILD_ID),
+            None,
+        )
+        if prog:
+            iid = prog.get("interviewer_id")
+        if iid is None:
+            iid = latest.get(member.id)
+        if iid is None or guild.get_member(iid) not in interviewer_role.members:
+            mapping["unknown"].append(member.display_name)
+        else:
+            mapping[iid].append(member.display_name)
+    lines = []
+    for interviewer in sorted(interviewer_role.members, key=lambda mem: mem.display_name):
+        cand_list = mapping.get(interviewer.id, [])
+        if cand_list:
+            lines.append(interviewer.display_name)
+            lines.extend(f"ー{n}" for n in sorted(cand_list))
+    return "\n".join(lines)
+
+
+def measure(m, guild=None):
+    guild = guild or populate(m)
+    out = []
+
+    async def send(text, **_kwargs):
+        out.append(text)
+
+    async def defer(**_kwargs):
+        pass
+
+    interaction = mock.Mock()
+    interaction.client.get_guild = lambda _id: guild
+    interaction.followup.send = send
+    interaction.response.defer = defer
+    cog = m.AdminCog.__new__(m.AdminCog)
+    t = time.perf_counter()
+    asyncio.run(m.AdminCog.list_passed_candidates.callback(cog, interaction))
+    return time.perf_counter() - t, out[0]
+
+
+def load_revision(rev):
+    source = subprocess.check_output(["git", "-C", ROOT, "show", f"{rev}:mensetsu.py"])
+    path = os.path.join(tempfile.mkdtemp(prefix="mensetsu-rev-"), "mensetsu.py")
+    with open(path, "wb") as f:
+        f.write(source)
+    # 古いリビジョンは import 時に bot.run() するので止めておく
+    with mock.patch.object(discord.Client, "run", lambda *args, **kwargs: None):
+        return load_mensetsu(path, name="mensetsu_before")
+
+
+def main(before_rev=None):
+    m = load_mensetsu()
+    guild = populate(m)
+    t = time.perf_counter()
+    before_out = full_scan(m, guild)
+    before_s = time.perf_counter() - t
+    after_s, after_out = measure(m, guild)
+    print(f"before (full scan): {before_s * 1000:7.1f} ms")
+    print(f"after  (indexed)  : {after_s * 1000:7.1f} ms  ({after_out.count(chr(10)) + 1} lines)")
+    print(f"speedup: {before_s / after_s:.0f}x  same output: {before_out == after_out}")
+    if before_rev:
+        rev_s, rev_out = measure(load_revision(before_rev))
+        print(f"{before_rev} command: {rev_s * 1000:7.1f} ms  same output: {rev_out == after_out}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
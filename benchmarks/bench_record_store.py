@@ -0,0 +1,81 @@
+"""
+面接記録 10 万件での list[dict] と InterviewRecordStore の比較。
+
+  ・メモリ（tracemalloc で計測した 1 件あたりのバイト数）
+  ・1 か月分の「面接官 × 結果」集計（list は全件走査、ストアは月バケット＋列）
+  ・月＋面接官での絞り込み
+
+    python benchmarks/bench_record_store.py [件数]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta
+
+from _loader import load_mensetsu
+
+m = load_mensetsu()
+
+
+def generate(n):
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1, tzinfo=m.JST)
+    return [
+        {
+            "date": (base + timedelta(seconds=rng.randint(0, 60_000_000))).isoformat(),
+            "interviewer_id": 10**17 + rng.randint(0, 30),
+            "interviewee_id": 10**17 + rng.randint(0, 10**6),
+            "result": rng.choice(["PASS", "FAIL", "BAN", "INTERVAL"]),
+        }
+        for _ in range(n)
+    ]
+
+
+def traced(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def best_of(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main(n: int = 100_000) -> None:
+    records, list_bytes = traced(lambda: generate(n))
+    store, store_bytes = traced(lambda: m.InterviewRecordStore(records))
+    ym, iid = "2025-03", 10**17 + 3
+
+    def list_month_cells():
+        return Counter(
+            (r["interviewer_id"], r["result"]) for r in records if m._record_year_month(r) == ym
+        )
+
+    def list_filter():
+        return [r for r in records if r["interviewer_id"] == iid and m._record_year_month(r) == ym]
+
+    assert list_month_cells() == store.month_cells(ym)
+    assert len(list_filter()) == len(store.rows(year_month=ym, interviewer_id=iid))
+
+    print(f"records={n}")
+    print(f"memory          : list {list_bytes / n:6.0f} B/rec   store {store_bytes / n:6.0f} B/rec   "
+          f"({list_bytes / store_bytes:.1f}x smaller)")
+    for label, before, after in (
+        ("month aggregate", list_month_cells, lambda: store.month_cells(ym)),
+        ("month+interviewer", list_filter, lambda: store.rows(year_month=ym, interviewer_id=iid)),
+    ):
+        b, a = best_of(before, 5), best_of(after)
+        print(f"{label:16s}: list {b * 1000:8.2f} ms   store {a * 1000:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
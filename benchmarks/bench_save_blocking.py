@@ -0,0 +1,99 @@
+"""
+save_data() がイベントループを止める時間の before / after 比較（面接記録 5 万件）。
+
+before: 従来どおりループ上で json.dump して書き込む
+after : DataManager.save_data()（スナップショットだけループ上で取り、直列化と書き込みはワーカースレッド）
+
+別タスクで 1 ms ごとに sleep し、予定より遅れた最大時間を「ループの停止時間」として測る。
+
+    python benchmarks/bench_save_blocking.py [件数]
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+os.environ["DATA_STORAGE_MODE"] = "json"
+os.environ["DATA_FLUSH_INTERVAL"] = "0"
+
+from _loader import load_mensetsu
+
+m = load_mensetsu()
+dm = m.data_manager
+
+
+def populate(n_records: int) -> None:
+    rng = random.Random(0)
+    dm.interview_records = [
+        {
+            "date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00+09:00",
+            "interviewer_id": rng.randint(10**17, 10**17 + 40),
+            "interviewee_id": rng.randint(10**17, 10**18),
+            "result": rng.choice(["PASS", "FAIL", "BAN"]),
+        }
+        for _ in range(n_records)
+    ]
+    dm.candidate_progress = {
+        f"1-{i}": {"candidate_id": i, "status": "記入済み", "channel_id": i, "interviewer_id": None}
+        for i in range(200)
+    }
+    dm.memo_history = {
+        str(i): [{
+            "guild_id": 1, "channel_id": 2, "message_id": i, "timestamp": "x",
+            "interviewer_id": 3, "result": "PASS", "memo_text": "あ" * 200,
+        }]
+        for i in range(5000)
+    }
+
+
+async def worst_loop_stall(save, repeat: int = 5) -> float:
+    worst = 0.0
+    for _ in range(repeat):
+        stop = False
+        lags = []
+
+        async def ticker():
+            while not stop:
+                t = time.perf_counter()
+                await asyncio.sleep(0.001)
+                lags.append(time.perf_counter() - t - 0.001)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0.01)
+        await save()
+        stop = True
+        await task
+        worst = max(worst, max(lags))
+    return worst
+
+
+def plain_state() -> dict:
+    """従来の DataManager が持っていた形（面接記録は list[dict]）"""
+    data = dict(dm._snapshot_state())
+    data["interview_records"] = dm.interview_records.to_list()
+    return data
+
+
+async def save_on_loop(data: dict) -> None:
+    with open(dm.file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+
+
+async def main(n_records: int) -> None:
+    populate(n_records)
+    data = plain_state()
+    before = await worst_loop_stall(lambda: save_on_loop(data))
+    after = await worst_loop_stall(dm.save_data)
+    t = time.perf_counter()
+    dm._snapshot_state(copy=True)
+    snapshot = time.perf_counter() - t
+    print(
+        f"records={n_records}  max loop stall: before={before * 1000:.1f} ms  "
+        f"after={after * 1000:.1f} ms  (snapshot on loop {snapshot * 1000:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000))
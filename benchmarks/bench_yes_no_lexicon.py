@@ -0,0 +1,40 @@
+"""
+YES/NO 辞書判定（classify_yes_no_local）の精度と、Gemini 呼び出しを省けた割合。
+
+tests/test_yes_no_lexicon.py のラベル付きコーパスを使う（None = 質問次第・曖昧で Gemini 行きが正解）。
+
+    python benchmarks/bench_yes_no_lexicon.py
+"""
+import os
+import sys
+import timeit
+
+from _loader import ROOT, load_mensetsu
+
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+from test_yes_no_lexicon import CORPUS  # noqa: E402
+
+m = load_mensetsu()
+
+
+def main() -> None:
+    decided = correct = 0
+    for text, label in CORPUS:
+        got = m.classify_yes_no_local(text)
+        if got is None:
+            continue
+        decided += 1
+        if got == label:
+            correct += 1
+        else:
+            print(f"WRONG {text!r}: {got} (expected {label})")
+    clear = sum(1 for _, label in CORPUS if label is not None)
+    per_call = timeit.timeit(lambda: m.classify_yes_no_local("はい、大丈夫です"), number=100_000) * 10
+    print(
+        f"corpus={len(CORPUS)}  decided locally={decided} ({decided / len(CORPUS):.0%} of calls avoided, "
+        f"{decided / clear:.0%} of clear answers)  precision={correct / decided:.1%}  {per_call:.2f} us/call"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -19,18 +19,32 @@ import json
 import re
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone, time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Iterable
+from datetime import datetime, date, timedelta, timezone, time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Iterable
 import uuid
-from collections import defaultdict
+from array import array
+import sqlite3
+import threading
+from collections import Counter, defaultdict
 import aiofiles
 import contextlib
+import heapq
+import random
+from bisect import bisect_left, insort
+from itertools import compress, repeat
+import operator
+import hashlib
+import unicodedata
+from collections import OrderedDict
+from types import SimpleNamespace
 
 
-# どこかグローバルで一度だけ
-SCHEDULE_CACHE_MIN = 60 * 5          # 5 分
-_schedule_cache = {"ts": 0.0, "text": ""}
+# 予定表メッセージ本文のキャッシュ（None は未取得）。
+# 取得後は on_raw_message_edit / on_raw_message_delete で即時に差し替える。
+# 見つからなかったときは retry_at（イベントループ時刻）までは探し直さない
+_schedule_cache: Dict[str, Any] = {"text": None, "retry_at": 0.0}
+SCHEDULE_MISS_RETRY_SEC: float = 300.0
 
 
 # ------------------------------------------------
@@ -45,6 +59,56 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE = os.path.join(BASE_DIR, 'monthly_counts_data.json')
 DATA_FILE_PATH = os.path.join(BASE_DIR, 'interview_records.json')
 BAN_DATA_FILE = os.path.join(BASE_DIR, 'ban_data.json')
+ROLE_CACHE_FILE = os.path.join(BASE_DIR, 'role_cache.json')   # サブサーバーの「名前 → ロール ID」
+# interview_records.json の保存方式
+#   "json"    … 従来どおり毎回全量書き込み
+#   "journal" … 変更分だけをジャーナルへ追記し、定期的にスナップショットへ畳み込む
+#   "sqlite"  … SQLITE_DATA_FILE のテーブルへ変更行だけを書き込む（初回起動時に JSON から移行）
+DATA_STORAGE_MODE: str = os.getenv("DATA_STORAGE_MODE", "json")
+SQLITE_DATA_FILE = os.path.join(BASE_DIR, 'interview_records.sqlite3')
+# save_data() の書き込みを遅延・集約する間隔（秒）。0 なら従来どおり呼ばれるたびに即保存
+DATA_FLUSH_INTERVAL: float = float(os.getenv("DATA_FLUSH_INTERVAL", "0"))
+JOURNAL_COMPACT_MINUTES: int = 10
+# Gemini 呼び出し設定（同時実行数の上限と 1 回あたりのタイムアウト秒）
+GEMINI_MODEL: str = "gemini-2.5-flash-preview-05-20"
+GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+GEMINI_TIMEOUT: float = float(os.getenv("GEMINI_TIMEOUT", "20"))
+# GENAI_FAKE=1 なら Gemini へ接続せず FakeGeminiClient で応答する（オフライン検証用）
+GENAI_FAKE: bool = os.getenv("GENAI_FAKE", "0") == "1"
+GENAI_FAKE_LATENCY: float = float(os.getenv("GENAI_FAKE_LATENCY", "0.5"))
+GENAI_FAKE_ERROR_RATE: float = float(os.getenv("GENAI_FAKE_ERROR_RATE", "0"))
+# 失敗時の再試行（指数バックオフ＋ジッター）とサーキットブレーカー
+GEMINI_RETRIES: int = int(os.getenv("GEMINI_RETRIES", "2"))
+GEMINI_BACKOFF_BASE: float = 0.5
+GEMINI_BACKOFF_MAX: float = 4.0
+# 再試行・待ち行列込みで 1 回の generate() に掛けてよい上限秒数（GEMINI_TIMEOUT は 1 回の試行ごと）
+GEMINI_DEADLINE: float = float(os.getenv("GEMINI_DEADLINE", "30"))
+GEMINI_BREAKER_THRESHOLD: int = 5       # 連続失敗がこの回数に達したら遮断
+GEMINI_BREAKER_COOLDOWN: float = 30.0   # 遮断してから試験的に 1 回通すまでの秒数
+# YES/NO 判定結果のキャッシュ（AI_CACHE_PERSIST=0 なら再起動で捨てる）
+AI_CACHE_FILE = os.path.join(BASE_DIR, 'ai_answer_cache.json')
+AI_CACHE_MAX_ENTRIES: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "2048"))
+AI_CACHE_TTL_HOURS: float = float(os.getenv("AI_CACHE_TTL_HOURS", "168"))
+AI_CACHE_PERSIST: bool = os.getenv("AI_CACHE_PERSIST", "1") == "1"
+# 追加があってからファイルへ書くまでの待ち（この間の追加は 1 回の書き込みにまとめる）
+AI_CACHE_FLUSH_SEC: float = float(os.getenv("AI_CACHE_FLUSH_SEC", "30"))
+# プロフィール評価の Gemini 出力形式
+#   "json" … ルールコード＋不備項目の JSON だけを返させ、返答文はボット側のテンプレで組み立てる
+#   "text" … 従来どおり候補者向けの返答文そのものを書かせる
+PROFILE_VERDICT_MODE: str = os.getenv("PROFILE_VERDICT_MODE", "json")
+# 面接官の自動割り当て
+#   "batch"     … 未割り当ての候補者をまとめて最小費用マッチングで割り当て、管理者へ 1 通で DM
+#   "immediate" … 従来どおりプロフィール OK のたびに 1 人ずつ推薦
+AUTO_ASSIGN_MODE: str = os.getenv("AUTO_ASSIGN_MODE", "batch")
+ASSIGN_BATCH_MINUTES: int = 10           # 定期的な一括割り当ての間隔
+ASSIGN_BATCH_DELAY: float = 60.0         # プロフィール OK から一括割り当てまでの待ち（同時期の候補者をまとめる）
+ASSIGN_MAX_OPEN_PER_INTERVIEWER: int = 5 # 1 人の面接官が同時に抱える未完了の候補者数の上限
+# プロフィール編集が止まってから再評価するまでの待ち時間（秒）
+PROFILE_EDIT_DEBOUNCE_SEC: float = float(os.getenv("PROFILE_EDIT_DEBOUNCE_SEC", "20"))
+# Gemini が使えずプロフィールを判定保留にしたとき、再評価するまでの待ち時間（秒）と回数
+#   回数を使い切ったら面接官チャンネルへ手動確認を依頼する
+PROFILE_DEFER_RETRY_SEC: float = float(os.getenv("PROFILE_DEFER_RETRY_SEC", "120"))
+PROFILE_DEFER_MAX_ATTEMPTS: int = int(os.getenv("PROFILE_DEFER_MAX_ATTEMPTS", "5"))
 LOG_CHANNEL_ID: int = 1306053871855996979
 # ★ 追記: 自動キックした際のログ出力先チャンネル
 AUTO_KICK_LOG_CHANNEL_ID: int = 1361465393587163166
@@ -124,29 +188,16 @@ async def update_stats(
     if target_months:
         ym_set = set(target_months)
     else:
-        ym_set = {current_ym}
-        for rec in data_manager.interview_records:
-            try:
-                dt = datetime.fromisoformat(rec.get("date"))
-                ym_set.add(f"{dt.year}-{dt.month:02d}")
-            except Exception:
-                continue
+        ym_set = {current_ym} | data_manager.stats_index.months()
 
     # ---------- 2) 月ごとに Embed を生成 ----------
     saved_current_msg_id: Optional[int] = None
 
     for year_month in sorted(ym_set):
-        year_i, month_i = map(int, year_month.split("-"))
-
-        # ---- 2-1. 回数集計 -------------------------
-        exec_counts: defaultdict[int, int] = defaultdict(int)
-        for rec in data_manager.interview_records:
-            try:
-                dt = datetime.fromisoformat(rec.get("date"))
-            except Exception:
-                continue
-            if dt.year == year_i and dt.month == month_i:
-                exec_counts[int(rec.get("interviewer_id"))] += 1
+        # ---- 2-1. 回数集計（集計インデックスから） ----
+        exec_counts: defaultdict[int, int] = defaultdict(
+            int, data_manager.stats_index.counts_for_month(year_month)
+        )
 
         # 面接担当ロール保持者は 0 回でも載せる
         interviewer_role: Optional[discord.Role] = guild_main.get_role(INTERVIEWER_ROLE_ID)
@@ -240,19 +291,11 @@ async def update_monthly_stats(bot: commands.Bot) -> None:
     pass_cnt = 0
     fail_cnt = 0   # 不合格/BAN/インターバル + 各遅延
 
-    for rec in data_manager.interview_records:
-        try:
-            dt = datetime.fromisoformat(rec.get("date"))
-        except Exception:
-            continue
-        if dt.year != now.year or dt.month != now.month:
-            continue
-
-        result = str(rec.get("result", "")).upper()
+    for result, cnt in data_manager.stats_index.result_counts(year_month).items():
         if result == "PASS":
-            pass_cnt += 1
+            pass_cnt += cnt
         elif result.startswith(("FAIL", "BAN", "INTERVAL")):
-            fail_cnt += 1
+            fail_cnt += cnt
 
     total     = pass_cnt + fail_cnt
     pass_rate = (pass_cnt / total) * 100 if total else 0.0
@@ -325,6 +368,133 @@ async def log_auto_kick(bot: commands.Bot, user: discord.abc.User, guild: discor
         logger.warning("自動キックのログ出力先チャンネルが見つかりませんでした。")
 
 
+# ------------------------------------------------
+# JSON 保存ヘルパー（イベントループを止めない）
+# ------------------------------------------------
+def _dump_streaming(fp: Any, data: Dict[str, Any], indent: int) -> None:
+    """
+    json.dump(indent=...) と同じ形で書くが、iter_json_rows() を持つ値（InterviewRecordStore）は
+    1 行ずつ JSON 化して書く。数万件の dict を一度に作らないので、ワーカースレッドで
+    世代別 GC が走ってイベントループ側が GIL 待ちで止まることがない。
+    """
+    pad = " " * indent
+    fp.write("{")
+    for i, (key, value) in enumerate(data.items()):
+        fp.write(("," if i else "") + "\n" + pad + json.dumps(str(key), ensure_ascii=False) + ": ")
+        if hasattr(value, "iter_json_rows"):
+            empty = True
+            fp.write("[")
+            for row in value.iter_json_rows():
+                fp.write(("\n" if empty else ",\n") + pad * 2 + row)
+                empty = False
+            fp.write("]" if empty else "\n" + pad + "]")
+            continue
+        text = json.dumps(value, ensure_ascii=False, indent=indent, default=_json_default)
+        fp.write(text.replace("\n", "\n" + pad))
+    fp.write("\n}" if data else "}")
+
+
+def write_json_atomic(file_path: str, data: Any, *, indent: Optional[int] = 4) -> None:
+    """テンポラリへ書き込んでからアトミック rename（DelayedActionManager._save と同方式）"""
+    tmp = file_path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fp:
+            if indent and isinstance(data, dict) and any(hasattr(v, "iter_json_rows") for v in data.values()):
+                _dump_streaming(fp, data, indent)
+            else:
+                json.dump(data, fp, ensure_ascii=False, indent=indent, default=_json_default)
+        os.replace(tmp, file_path)
+    except Exception:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp)
+        raise
+
+
+class BackgroundJsonWriter:
+    """
+    呼び出し側で取った軽量スナップショットを、ワーカースレッドで JSON 化して保存する。
+      ・書き込み中に次の要求が来たら、最新のスナップショットだけを書く
+      ・同期メソッドからは schedule()、コルーチンからは await write() を使う
+      ・頻繁に変わるものは defer() で delay 秒ぶんの変更を 1 回の書き込みにまとめる
+      ・イベントループが動いていない（起動前など）ときはその場で同期保存
+      ・Bot 終了時は drain_json_writers() で書きかけ・保留中の分を書き切る
+    """
+
+    def __init__(self, file_path: str, label: str) -> None:
+        self.file_path = file_path
+        self.label = label
+        self._lock = asyncio.Lock()
+        self._latest: Any = None
+        self._has_pending = False
+        self._tasks: set[asyncio.Task] = set()
+        self._snapshot: Optional[Callable[[], Any]] = None
+        self._deferred: Optional[asyncio.Task] = None
+        self._flush_now: Optional[asyncio.Event] = None
+        _json_writers.append(self)
+
+    def write_sync(self, data: Any) -> None:
+        try:
+            write_json_atomic(self.file_path, data)
+            logger.info(f"{self.label}保存成功")
+        except Exception as e:
+            logger.error(f"{self.label}保存失敗: {e}")
+
+    async def write(self, data: Any) -> None:
+        self._latest, self._has_pending = data, True
+        async with self._lock:
+            if not self._has_pending:
+                return                      # 待っている間に新しい方が書かれた
+            data, self._latest, self._has_pending = self._latest, None, False
+            await asyncio.to_thread(self.write_sync, data)
+
+    def schedule(self, data: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.write_sync(data)
+            return
+        task = loop.create_task(self.write(data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def defer(self, snapshot: Callable[[], Any], delay: float) -> None:
+        """delay 秒後に 1 回だけ書く。それまでの defer() はまとめ、データは書く直前に snapshot() で取る"""
+        self._snapshot = snapshot
+        if self._deferred is not None and not self._deferred.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._snapshot = None
+            self.write_sync(snapshot())
+            return
+        self._flush_now = asyncio.Event()
+        self._deferred = loop.create_task(self._write_later(delay, self._flush_now))
+
+    async def _write_later(self, delay: float, flush_now: asyncio.Event) -> None:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(flush_now.wait(), delay)
+        snapshot, self._snapshot, self._deferred = self._snapshot, None, None
+        if snapshot is not None:
+            await self.write(snapshot())
+
+    async def drain(self) -> None:
+        """defer() の待ちを打ち切り、schedule() 済みの分も含めて書き込みがすべて終わるまで待つ"""
+        if self._deferred is not None and not self._deferred.done():
+            deferred = self._deferred
+            self._flush_now.set()
+            await asyncio.gather(deferred, return_exceptions=True)
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+_json_writers: List[BackgroundJsonWriter] = []
+
+
+async def drain_json_writers() -> None:
+    await asyncio.gather(*(w.drain() for w in _json_writers))
+
+
 # ------------------------------------------------
 # BANデータ管理用クラス
 # ------------------------------------------------
@@ -332,6 +502,7 @@ class BanManager:
     def __init__(self, file_path: str = "ban_data.json"):
         self.file_path = file_path
         self.ban_records = {}  # {"ユーザーID": {"ban_origin": "main" or "sub", "ban_type": "BAN" or "INTERVAL", "ban_time": ISO文字列}}
+        self._writer = BackgroundJsonWriter(file_path, "Banデータ")
         self.load_data()
 
     def load_data(self):
@@ -346,12 +517,8 @@ class BanManager:
             logger.info("Banデータファイルなし。新規作成します。")
 
     def save_data(self):
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(self.ban_records, f, ensure_ascii=False, indent=4)
-            logger.info("Banデータ保存成功")
-        except Exception as e:
-            logger.error(f"Banデータ保存失敗: {e}")
+        # レコード単位でコピーしてから、書き込みはワーカースレッドで行う
+        self._writer.schedule({uid: dict(rec) for uid, rec in self.ban_records.items()})
 
     def add_ban(self, user_id: int, ban_origin: str, ban_type: str):
         self.ban_records[str(user_id)] = {
@@ -393,32 +560,120 @@ class BanManager:
 ban_manager = BanManager(BAN_DATA_FILE)
 
 # ------------------------------------------------
-# ダッシュボード更新のデバウンス処理
+# 描き直し要求の集約（ダッシュボード・統計・案内回数）
 # ------------------------------------------------
-_dashboard_update_lock = asyncio.Lock()
-_dashboard_update_task: Optional[asyncio.Task] = None
+class CoalescingRefresher:
+    """
+    「最新の状態で描き直して」という要求を 1 本の常駐ワーカーにまとめる。
+      ・request() は同期で O(1)。フラグを立ててワーカーを起こすだけ
+      ・最後の要求から delay 秒静かになったら描画（連打をまとめる）
+      ・ただし最初の未処理要求から max_staleness 秒以内には必ず描画する
+      ・描画と描画の間は min_interval 秒以上空ける
+      ・描画中に来た要求は、描画後の 1 回にまとめる
+    scope を渡すと描画範囲（統計の対象月など）を和集合でまとめる。None は全体。
+    """
 
+    def __init__(
+        self,
+        name: str,
+        render: Callable[[Any, Optional[frozenset]], Awaitable[None]],
+        *,
+        delay: float = 2.0,
+        min_interval: float = 2.0,
+        max_staleness: float = 10.0,
+    ) -> None:
+        self.name = name
+        self._render = render
+        self.delay = delay
+        self.min_interval = min_interval
+        self.max_staleness = max_staleness
+        self._context: Any = None
+        self._pending = False
+        self._scope: Optional[set] = None
+        self._first_request = 0.0
+        self._last_request = 0.0
+        self._last_render = float("-inf")
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {"requests": 0, "renders": 0, "failures": 0, "max_latency": 0.0}
+        _refreshers.append(self)
+
+    def request(self, context: Any, scope: Optional[Iterable[Any]] = None) -> None:
+        """描き直しを要求する（context は描画関数に渡す bot など）"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self.stats["requests"] += 1
+        self._context = context
+        if not self._pending:
+            self._pending = True
+            self._first_request = now
+            self._scope = None if scope is None else set(scope)
+        elif self._scope is not None:
+            if scope is None:
+                self._scope = None
+            else:
+                self._scope.update(scope)
+        self._last_request = now
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    def _due(self) -> float:
+        quiet = min(self._last_request + self.delay, self._first_request + self.max_staleness)
+        return max(quiet, self._last_render + self.min_interval)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            while self._pending and (wait := self._due() - loop.time()) > 0:
+                self._wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+            self._wakeup.clear()
+            if not self._pending:
+                continue
+            scope = None if self._scope is None else frozenset(self._scope)
+            latency = loop.time() - self._first_request
+            self._pending = False
+            self._scope = None
+            self.stats["renders"] += 1
+            self.stats["max_latency"] = max(self.stats["max_latency"], latency)
+            try:
+                await self._render(self._context, scope)
+            except Exception:
+                self.stats["failures"] += 1
+                logger.exception(f"[refresh:{self.name}] 描画で例外発生")
+            self._last_render = loop.time()
+
+    def describe(self) -> str:
+        st = self.stats
+        return (
+            f"`{self.name}` 要求 {st['requests']} 回 → 描画 **{st['renders']} 回** "
+            f"(集約 {st['requests'] - st['renders']} / 失敗 {st['failures']} / 最大遅延 {st['max_latency']:.1f}s)"
+        )
+
+
+_refreshers: List[CoalescingRefresher] = []
+
+dashboard_refresher = CoalescingRefresher(
+    "dashboard", lambda bot, _scope: update_dashboard(bot),
+    delay=2.0, min_interval=2.0, max_staleness=10.0,
+)
+stats_refresher = CoalescingRefresher(
+    "stats", lambda bot, months: update_stats(bot, target_months=months),
+    delay=5.0, min_interval=10.0, max_staleness=60.0,
+)
 
-def request_dashboard_update(bot: discord.Client, delay: float = 2.0):
-    async def update_after_delay():
-        try:
-            await asyncio.sleep(delay)
-            await update_dashboard(bot)
-        except asyncio.CancelledError:
-            pass
-        finally:
-            global _dashboard_update_task
-            _dashboard_update_task = None
 
-    async def wrapper():
-        global _dashboard_update_task
-        async with _dashboard_update_lock:
-            if _dashboard_update_task is not None:
-                _dashboard_update_task.cancel()
-            _dashboard_update_task = asyncio.create_task(update_after_delay())
+def request_dashboard_update(bot: discord.Client) -> None:
+    dashboard_refresher.request(bot)
 
-    # 同期関数内でバックグラウンドタスクとして wrapper() をスケジュールする
-    asyncio.create_task(wrapper())
+
+def request_stats_update(bot: discord.Client, target_months: Optional[Iterable[str]] = None) -> None:
+    stats_refresher.request(bot, target_months)
 
 # ------------------------------------------------
 # 共通ユーティリティ関数
@@ -429,43 +684,790 @@ def get_current_time_iso() -> str:
 
 def make_progress_key(guild_id: int, member_id: int) -> str:
     return f"{guild_id}-{member_id}"
+# ------------------------------------------------
+# Gemini 呼び出しゲートウェイ（イベントループを止めない）
+# ------------------------------------------------
+class FakeGeminiClient:
+    """
+    genai.Client の models / aio.models.generate_content だけを真似るローカル実装。
+    latency 秒待ってから responder(prompt) の文字列を返す。ネットワークには出ない。
+    error_rate の確率で例外を投げるので、再試行・遮断の挙動もオフラインで確かめられる。
+    同時実行数を観測できるよう in_flight / peak_in_flight を数える。
+    """
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[str], str]] = None,
+        *,
+        latency: float = GENAI_FAKE_LATENCY,
+        error_rate: float = GENAI_FAKE_ERROR_RATE,
+    ) -> None:
+        self.responder = responder or self._default_responder
+        self.latency = latency
+        self.error_rate = error_rate
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+        self.models = SimpleNamespace(generate_content=self._generate_sync)
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=self._generate_async))
+
+    @staticmethod
+    def _default_responder(prompt: str) -> str:
+        # YES/NO 系プロンプトには YES、それ以外（プロフィール評価など）には OK を返す
+        return "YES" if "YES" in prompt else "OK"
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _leave(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _response(self, prompt: str) -> Any:
+        if self.error_rate and random.random() < self.error_rate:
+            with self._lock:
+                self.errors += 1
+            raise RuntimeError("fake Gemini: injected error (503 UNAVAILABLE)")
+        part = SimpleNamespace(text=self.responder(prompt))
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+    def _generate_sync(self, *, model: str, contents: str, config: Any = None) -> Any:
+        self._enter()
+        try:
+            threading.Event().wait(self.latency)   # time は datetime.time と衝突するため
+            return self._response(contents)
+        finally:
+            self._leave()
+
+    async def _generate_async(self, *, model: str, contents: str, config: Any = None) -> Any:
+        self._enter()
+        try:
+            await asyncio.sleep(self.latency)
+            return self._response(contents)
+        finally:
+            self._leave()
+
+
+class GeminiUnavailable(Exception):
+    """サーキットブレーカーが開いている間は Gemini を呼ばずにこれを送出する"""
+
+
+class CircuitBreaker:
+    """
+    連続失敗が threshold 回に達したら open（即時失敗）にし、cooldown 秒後に
+    half_open として 1 回だけ試験的に通す。成功すれば closed に戻り、失敗すれば再び open。
+    """
+
+    def __init__(self, threshold: int = GEMINI_BREAKER_THRESHOLD, cooldown: float = GEMINI_BREAKER_COOLDOWN) -> None:
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._probing = False
+
+    def allow(self, now: float) -> bool:
+        if self.state == "open":
+            if now - self.opened_at < self.cooldown:
+                return False
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """試験呼び出しが成否を出さずに終わった（キャンセルされた）とき、次の試験を通せるようにする"""
+        if self.state == "half_open":
+            self._probing = False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._probing = False
+
+    def record_failure(self, now: float) -> None:
+        self.consecutive_failures += 1
+        if self.state == "half_open" or self.consecutive_failures >= self.threshold:
+            if self.state != "open":
+                self.trips += 1
+                logger.warning(
+                    f"[Gemini] 連続 {self.consecutive_failures} 回失敗のため {self.cooldown:g} 秒間遮断します"
+                )
+            self.state = "open"
+            self.opened_at = now
+        self._probing = False
+
+
+class CallMetrics:
+    """呼び出し元ごとのレイテンシ分布（呼び出し全体＝再試行込み）とエラー数"""
+
+    BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.fast_failures = 0
+        self.total_seconds = 0.0
+
+    def observe(self, seconds: float, *, ok: bool) -> None:
+        self.counts[bisect_left(self.BUCKETS, seconds)] += 1
+        self.calls += 1
+        self.total_seconds += seconds
+        if not ok:
+            self.errors += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """バケット上限で近似した q 分位点（最上位バケットは inf）"""
+        if not self.calls:
+            return None
+        rank, seen = q * self.calls, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.BUCKETS[i] if i < len(self.BUCKETS) else float("inf")
+        return float("inf")
+
+    def error_rate(self) -> float:
+        attempted = self.calls + self.fast_failures
+        return (self.errors + self.fast_failures) / attempted if attempted else 0.0
+
+    def histogram_line(self) -> str:
+        labels = [f"≤{b:g}s" for b in self.BUCKETS] + [f">{self.BUCKETS[-1]:g}s"]
+        return " ".join(f"{lab}:{n}" for lab, n in zip(labels, self.counts) if n)
+
+
+class GeminiGateway:
+    """
+    Gemini 呼び出しの共通窓口。
+      ・client.aio があればネイティブ非同期、無ければ asyncio.to_thread で実行
+      ・セマフォで同時実行数を max_concurrency までに制限
+      ・1 回ごとに timeout 秒で打ち切り（asyncio.TimeoutError を送出）
+      ・失敗したら指数バックオフ（フルジッター）で retries 回まで再試行
+      ・再試行・セマフォ待ちを含めた全体は deadline 秒で打ち切る
+      ・連続失敗でサーキットブレーカーが開いている間は GeminiUnavailable で即時失敗
+      ・label（呼び出し元）ごとにレイテンシ分布とエラー数を記録
+    例外はそのまま呼び出し元へ送るので、各ヘルパーの従来のフォールバック処理が生きる。
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        model: str = GEMINI_MODEL,
+        max_concurrency: int = GEMINI_MAX_CONCURRENCY,
+        timeout: float = GEMINI_TIMEOUT,
+        deadline: float = GEMINI_DEADLINE,
+        retries: int = GEMINI_RETRIES,
+        backoff_base: float = GEMINI_BACKOFF_BASE,
+        backoff_max: float = GEMINI_BACKOFF_MAX,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self.client = client
+        self.model = model
+        self.timeout = timeout
+        self.deadline = deadline
+        self.retries = max(0, retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.metrics: Dict[str, CallMetrics] = {}
+        self.calls = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def generate(self, prompt: str, *, max_output_tokens: int, label: str = "Gemini") -> str:
+        """プロンプトを投げて応答テキスト（strip 済み）を返す"""
+        config = GenerateContentConfig(
+            max_output_tokens=max_output_tokens,
+            temperature=0,
+            thinking_config=ThinkingConfig(thinking_budget=0),
+        )
+        metrics = self.metrics.setdefault(label, CallMetrics())
+        loop = asyncio.get_running_loop()
+        if not self.breaker.allow(loop.time()):
+            metrics.fast_failures += 1
+            raise GeminiUnavailable(f"Gemini 遮断中 ({label})")
+
+        started = loop.time()
+        deadline = started + self.deadline
+        attempt = 0
+        while True:
+            try:
+                resp = await self._attempt(prompt, config, label, min(self.timeout, deadline - loop.time()))
+            except asyncio.CancelledError:
+                # 試験呼び出し中にキャンセルされても half_open のまま詰まらないようにする
+                self.breaker.release_probe()
+                raise
+            except Exception as e:
+                self.breaker.record_failure(loop.time())
+                delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt + 1)))
+                if (
+                    attempt >= self.retries
+                    or loop.time() + delay >= deadline
+                    or not self.breaker.allow(loop.time())
+                ):
+                    metrics.observe(loop.time() - started, ok=False)
+                    raise
+                attempt += 1
+                metrics.retries += 1
+                logger.warning(
+                    f"[{label}] Gemini 呼び出し失敗、{delay:.2f}s 後に再試行 ({attempt}/{self.retries}): {e!r}"
+                )
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    self.breaker.release_probe()
+                    raise
+                continue
+            self.breaker.record_success()
+            metrics.observe(loop.time() - started, ok=True)
+            return "".join(
+                getattr(part, "text", "") or "" for part in resp.candidates[0].content.parts
+            ).strip()
+
+    async def _attempt(self, prompt: str, config: Any, label: str, timeout: float) -> Any:
+        # セマフォ待ちも含めて timeout 秒で打ち切る（全体の deadline を超えないように）
+        try:
+            return await asyncio.wait_for(self._guarded_call(prompt, config), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning(f"[{label}] Gemini 応答タイムアウト ({timeout:.3g}s)")
+            raise
+        except Exception:
+            self.failures += 1
+            raise
+
+    async def _guarded_call(self, prompt: str, config: Any) -> Any:
+        async with self._semaphore:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                return await self._call(prompt, config)
+            finally:
+                self.in_flight -= 1
+
+    async def _call(self, prompt: str, config: Any) -> Any:
+        aio = getattr(self.client, "aio", None)
+        if aio is not None:
+            return await aio.models.generate_content(model=self.model, contents=prompt, config=config)
+        # 同期クライアントしか無い場合はスレッドへ逃がす
+        # （タイムアウト時もスレッド自体は最後まで走るが、ループはすぐ解放される）
+        return await asyncio.to_thread(
+            self.client.models.generate_content, model=self.model, contents=prompt, config=config
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "max_concurrency": self.max_concurrency,
+            "breaker_state": self.breaker.state,
+            "breaker_trips": self.breaker.trips,
+        }
+
+
+ai_gateway = GeminiGateway(FakeGeminiClient() if GENAI_FAKE else genai_client)
+
+
+# ------------------------------------------------
+# YES/NO 判定結果の LRU + TTL キャッシュ
+# ------------------------------------------------
+def normalize_reply(text: str) -> str:
+    """NFKC → casefold → 空白・句読点・制御文字を除去（絵文字などの記号は残す）"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return "".join(
+        ch for ch in text
+        if not unicodedata.category(ch).startswith(("P", "Z", "C"))
+    )
+
+
+class AnswerCache:
+    """
+    (種別, 正規化テキスト) → AI の判定結果。
+      ・max_entries を超えたら最も使われていないものから捨てる
+      ・ttl 秒を過ぎたものはヒット扱いにしない
+      ・file_path を渡すと追加から flush_delay 秒後にまとめてバックグラウンドで保存し、起動時に読み戻す
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = AI_CACHE_MAX_ENTRIES,
+        ttl: float = AI_CACHE_TTL_HOURS * 3600,
+        file_path: Optional[str] = None,
+        flush_delay: float = AI_CACHE_FLUSH_SEC,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.flush_delay = flush_delay
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writer = BackgroundJsonWriter(file_path, "AI判定キャッシュ") if file_path else None
+        if file_path:
+            self._load(file_path)
+
+    @staticmethod
+    def _key(kind: str, text: str) -> str:
+        return f"{kind}:{normalize_reply(text)}"
+
+    @staticmethod
+    def _now() -> float:
+        return datetime.now(JST).timestamp()
+
+    def get(self, kind: str, text: str) -> Any:
+        """ヒットすれば値、無ければ None"""
+        key = self._key(kind, text)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._now():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, kind: str, text: str, value: Any) -> None:
+        key = self._key(kind, text)
+        self._entries[key] = (self._now() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        if self._writer:
+            self._writer.defer(self._rows, self.flush_delay)
+
+    def _rows(self) -> List[list]:
+        return [[k, exp, v] for k, (exp, v) in self._entries.items()]
+
+    def _load(self, file_path: str) -> None:
+        if not os.path.exists(file_path):
+            return
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+            now = self._now()
+            for key, expires_at, value in rows[-self.max_entries:]:
+                if expires_at > now:
+                    self._entries[key] = (expires_at, value)
+            logger.info(f"AI判定キャッシュロード成功 ({len(self._entries)} 件)")
+        except Exception as e:
+            logger.error(f"AI判定キャッシュロード失敗: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+ai_answer_cache = AnswerCache(file_path=AI_CACHE_FILE if AI_CACHE_PERSIST else None)
+
+
+# ------------------------------------------------
+# YES/NO の辞書判定（明らかな返答は Gemini に聞かない）
+# ------------------------------------------------
+# normalize_reply() 後の文字列と完全一致で判定する。
+# 「あります」「ありません」「ない」のような有無・否定だけの返答は、
+# 質問の向き（「予定はございますか？」か「問題はございませんでしょうか？」か）で
+# YES/NO が逆になるので辞書には入れず、必ず Gemini に回す
+YES_LEXICON: frozenset[str] = frozenset({
+    "はい", "はいです", "うん", "ええ", "もちろん", "もちろんです",
+    "大丈夫", "大丈夫です", "だいじょうぶ", "だいじょうぶです",
+    "問題ない", "問題ないです", "問題ありません", "問題ございません",
+    "可能", "可能です", "できます", "出来ます", "行けます", "いけます",
+    "予定しています", "その予定です",
+    "了解", "了解です", "了解しました", "承知しました", "かしこまりました",
+    "全然大丈夫", "全然大丈夫です",
+    "ok", "okです", "okay", "おけ", "おっけ", "オッケ", "オーケ",
+    "yes", "yep", "yeah", "sure", "ofcourse", "noproblem",
+    "👍", "⭕", "○", "〇", "🙆", "🙆‍♀️", "🙆‍♂️",
+})
+NO_LEXICON: frozenset[str] = frozenset({
+    "いいえ", "いえ", "いや", "ううん",
+    "無理", "無理です", "むり", "むりです",
+    "できません", "出来ません", "行けません", "いけません",
+    "no", "nope", "nah",
+    "👎", "❌", "✕", "×", "🙅", "🙅‍♀️", "🙅‍♂️",
+})
+# 先頭の相づちに続けて同じ向きの語が来る形（「はい、大丈夫です」など）を許す
+_YES_HEADS = ("はい", "うん", "ええ", "yes", "ok")
+_NO_HEADS = ("いいえ", "いえ", "いや", "no")
+# 含まれていたら条件付き・曖昧とみなして Gemini に回す
+_HEDGE_MARKERS = (
+    "?", "けど", "けれど", "でも", "ただ", "たぶん", "多分", "かも", "微妙",
+    "わから", "分から", "わかりません", "検討", "難し", "むずかし", "but", "maybe",
+)
+YES_NO_LEXICON_MAX_LEN = 20
+
+yes_no_lexicon_stats: Dict[str, int] = {"local": 0, "escalated": 0}
+
+
+# かなの後ろに続く伸ばし・笑い（「はいー」「大丈夫ですw」）。英字の後ろは落とさない（「now」→「no」を防ぐ）
+_TRAILING_STRETCH_RE = re.compile(r"(?<=[\u3041-\u3096\u30a1-\u30fa])[ーw]+$")
+_LEXICON_SUFFIXES = ("よね", "よ", "ね")
+
+
+def _lexicon_lookup(norm: str) -> Optional[str]:
+    norm = _TRAILING_STRETCH_RE.sub("", norm.replace("\ufe0f", ""))   # 絵文字の異体字セレクタも落とす
+    forms = [norm]
+    for suffix in _LEXICON_SUFFIXES:          # 「大丈夫ですよ」「はいね」など終助詞 1 つだけ許す
+        if norm.endswith(suffix) and len(norm) > len(suffix):
+            forms.append(_TRAILING_STRETCH_RE.sub("", norm[:-len(suffix)]))
+    for form in forms:
+        if form in YES_LEXICON:
+            return "YES"
+        if form in NO_LEXICON:
+            return "NO"
+    return None
+
+
+def classify_yes_no_local(text: str) -> Optional[str]:
+    """
+    辞書だけで YES / NO を判定する。判断できない（曖昧・長文・条件付き）なら None。
+    None のときだけ Gemini に問い合わせる。
+    """
+    raw = unicodedata.normalize("NFKC", text).casefold()
+    norm = normalize_reply(text)
+    if not norm or len(norm) > YES_NO_LEXICON_MAX_LEN or any(m in raw for m in _HEDGE_MARKERS):
+        result = None
+    else:
+        result = _lexicon_lookup(norm)
+        if result is None:
+            for heads, want in ((_YES_HEADS, "YES"), (_NO_HEADS, "NO")):
+                head = next((h for h in heads if norm.startswith(h)), None)
+                if head and _lexicon_lookup(norm[len(head):]) == want:
+                    result = want
+                    break
+    yes_no_lexicon_stats["local" if result else "escalated"] += 1
+    return result
+
+
 # ------------------------------------------------
 # ★ 面接官自動推薦ヘルパー
 # ------------------------------------------------
+def _schedule_text_from(content: Optional[str], embeds: list) -> str:
+    if content:
+        return content
+    if embeds:
+        first = embeds[0]
+        desc = first.get("description") if isinstance(first, dict) else first.description
+        return desc or ""
+    return ""
+
+
 async def _fetch_schedule_text(bot: discord.Client) -> str:
-    """予定表メッセージを 1 つ見つけて内容を返す（5 分キャッシュ）"""
-    now = asyncio.get_running_loop().time()
-    if now - _schedule_cache["ts"] < SCHEDULE_CACHE_MIN:
+    """
+    予定表メッセージの本文を返す。
+    2 回目以降はキャッシュを返すだけ（編集・削除はイベントで反映されるので期限切れは無い）。
+    初回は保存済みの data_manager.schedule_channel_id から 1 回だけ取得し、
+    それも無いときだけ全チャンネルを探して見つかったチャンネルを保存する。
+    見つからなかった結果はキャッシュせず、SCHEDULE_MISS_RETRY_SEC 秒後に探し直す。
+    """
+    if _schedule_cache["text"] is not None:
         return _schedule_cache["text"]
+    loop = asyncio.get_running_loop()
+    if loop.time() < _schedule_cache["retry_at"]:
+        return ""
 
     guild = bot.get_guild(MAIN_GUILD_ID)
     if guild is None:
         return ""
 
-    schedule_text = ""
-    for ch in guild.text_channels:
+    msg = None
+    channel_id = data_manager.schedule_channel_id
+    channel = guild.get_channel(channel_id) if channel_id else None
+    if isinstance(channel, discord.TextChannel):
         try:
-            msg = await ch.fetch_message(SCHEDULE_MESSAGE_ID)
-            schedule_text = msg.content or (msg.embeds[0].description if msg.embeds else "")
-            break
+            msg = await channel.fetch_message(SCHEDULE_MESSAGE_ID)
         except (discord.NotFound, discord.Forbidden):
-            continue
-    _schedule_cache["ts"] = now
-    _schedule_cache["text"] = schedule_text
-    return schedule_text
+            logger.warning(f"[schedule] 保存済みチャンネル {channel_id} に予定表が見つかりません。再探索します。")
+
+    if msg is None:
+        for ch in guild.text_channels:
+            try:
+                msg = await ch.fetch_message(SCHEDULE_MESSAGE_ID)
+            except (discord.NotFound, discord.Forbidden):
+                continue
+            data_manager.schedule_channel_id = ch.id
+            await data_manager.save_data()
+            logger.info(f"[schedule] 予定表チャンネルを記録: {ch.id}")
+            break
+
+    if msg is None:
+        logger.warning(f"[schedule] 予定表メッセージが見つかりません（{SCHEDULE_MISS_RETRY_SEC:g} 秒後に再探索します）")
+        _schedule_cache["retry_at"] = loop.time() + SCHEDULE_MISS_RETRY_SEC
+        return ""
+    _schedule_cache["text"] = _schedule_text_from(msg.content, msg.embeds)
+    return _schedule_cache["text"]
 
 
 def _count_by_interviewer_this_month() -> dict[int, int]:
     ym = datetime.now(JST).strftime("%Y-%m")
-    counts: defaultdict[int, int] = defaultdict(int)
-    for rec in data_manager.interview_records:
-        try:
-            dt = datetime.fromisoformat(rec["date"])
-        except Exception:
-            continue
-        if f"{dt.year}-{dt.month:02d}" == ym:
-            counts[int(rec["interviewer_id"])] += 1
-    return counts
+    return data_manager.stats_index.counts_for_month(ym)
+
+
+# ------------------------------------------------
+# 空き時間インデックス（予定表・候補者の「面接できる時間帯」を同じ形に変換）
+# ------------------------------------------------
+SCHEDULE_HORIZON_DAYS = 14              # 今日から何日先までの重なりを見るか
+_WEEKDAYS = "月火水木金土日"              # date.weekday() の並び
+_DAY_GROUPS: tuple[tuple[str, tuple[int, ...]], ...] = (
+    ("毎日", tuple(range(7))), ("いつでも", tuple(range(7))),
+    ("平日", (0, 1, 2, 3, 4)), ("土日祝", (5, 6)), ("土日", (5, 6)), ("週末", (5, 6)),
+)
+# 数字の時刻が無いときに使う大まかな時間帯（分）
+_DAY_PERIODS: tuple[tuple[str, tuple[int, int]], ...] = (
+    ("終日", (0, 1440)), ("いつでも", (0, 1440)), ("深夜", (1440, 1620)),
+    ("日中", (540, 1080)), ("午前", (540, 720)), ("午後", (720, 1080)), ("朝", (360, 720)),
+    ("昼", (720, 1080)), ("夕方", (960, 1140)), ("夜", (1080, 1440)),
+)
+_TIME_PART = r"(\d{1,2})(?:\s*:\s*(\d{2})|\s*時\s*(?:(\d{1,2})\s*分|(半))?)?"
+_TIME_RANGE_RE = re.compile(
+    _TIME_PART + r"\s*(?:(?:-|‐|−|―|〜|~|から)\s*(?:" + _TIME_PART + r")?|(以降|以後|頃から))"
+)
+_DATE_RE = re.compile(r"(\d{1,2})\s*(?:/|月)\s*(\d{1,2})\s*日?(?:\s*[(（][^)）]*[)）])?")
+_DAY_TOKEN_RE = re.compile(
+    "|".join(re.escape(w) for w, _ in _DAY_GROUPS)
+    + r"|([月火水木金土日])\s*[〜~\-]\s*([月火水木金土日])曜?日?"
+    # 単独の曜日は「今日」「日中」「月末」などの一部でないものだけ
+    + r"|(?<![^\s週毎・、,/()\d月火水木金土日:~〜\-])[月火水木金土日](?:曜日?)?(?![末初旬中])"
+)
+_MENTION_RE = re.compile(r"<@!?(\d{17,20})>|ID\s*:\s*(\d{17,20})")
+
+
+def _to_minutes(h: Optional[str], m: Optional[str], m2: Optional[str], half: Optional[str]) -> int:
+    minutes = int(m or m2 or 0) + (30 if half else 0)
+    return int(h) * 60 + minutes
+
+
+def _merge_intervals(intervals: Iterable[tuple[int, int]]) -> List[tuple[int, int]]:
+    merged: List[tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def overlap_minutes(a: List[tuple[int, int]], b: List[tuple[int, int]]) -> int:
+    """マージ済み区間リスト同士の重なり（分）"""
+    i = j = total = 0
+    while i < len(a) and j < len(b):
+        lo, hi = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if lo < hi:
+            total += hi - lo
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return total
+
+
+@dataclass
+class Availability:
+    """曜日ごとの空き（毎週）と日付指定の空き。値は 0:00 起点の分（24 時超えは翌日扱い）"""
+    weekly: Dict[int, List[tuple[int, int]]] = field(default_factory=dict)
+    dated: Dict[date, List[tuple[int, int]]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not self.weekly and not self.dated
+
+    def add(self, days: Iterable[int | date], interval: tuple[int, int]) -> None:
+        for d in days:
+            target = self.dated if isinstance(d, date) else self.weekly
+            target.setdefault(d, []).append(interval)
+
+    def timeline(self, start: date, days: int = SCHEDULE_HORIZON_DAYS) -> List[tuple[int, int]]:
+        """start から days 日分を 1 本の時間軸（分）に展開。日付指定がある日はそちらを優先"""
+        out: List[tuple[int, int]] = []
+        for i in range(days):
+            d = start + timedelta(days=i)
+            for s, e in self.dated.get(d) or self.weekly.get(d.weekday(), ()):
+                out.append((i * 1440 + s, i * 1440 + e))
+        return _merge_intervals(out)
+
+
+def _resolve_date(month: int, day: int, today: date) -> Optional[date]:
+    try:
+        d = date(today.year, month, day)
+    except ValueError:
+        return None
+    if d < today - timedelta(days=30):      # 年末に「1/5」と書かれたら翌年
+        d = date(today.year + 1, month, day)
+    return d
+
+
+def parse_availability(text: str, *, today: Optional[date] = None) -> Availability:
+    """
+    「平日 20時以降」「月水金 21:00-24:00」「6/12 19時〜22時」「土日 終日」などを Availability にする。
+    時刻の前に書かれた曜日・日付がその時刻に掛かる（次の行の時刻でもよい）。
+    曜日も日付も無ければ毎日、時刻が最後まで出てこない曜日・日付は終日とみなす。
+    """
+    today = today or datetime.now(JST).date()
+    avail = Availability()
+    days: List[int | date] = []
+    pending_days = False              # 曜日・日付が出たが、まだ時刻が付いていない
+    for line in unicodedata.normalize("NFKC", text).splitlines():
+        if not pending_days:
+            days = []
+        pos = 0
+        while pos < len(line):
+            m_date = _DATE_RE.match(line, pos)
+            m_range = _TIME_RANGE_RE.match(line, pos)
+            m_day = _DAY_TOKEN_RE.match(line, pos)
+            if m_date:
+                d = _resolve_date(int(m_date.group(1)), int(m_date.group(2)), today)
+                if not pending_days:
+                    days = []
+                if d:
+                    days.append(d)
+                pending_days = True
+                pos = m_date.end()
+            elif m_range:
+                start = _to_minutes(*m_range.group(1, 2, 3, 4))
+                if m_range.group(5):
+                    end = _to_minutes(*m_range.group(5, 6, 7, 8))
+                    if end <= start:        # 「22時-2時」は翌 2 時
+                        end += 1440
+                else:
+                    end = max(1440, start + 60)
+                if start < end <= 1440 * 2:
+                    avail.add(days or range(7), (start, end))
+                pending_days = False
+                pos = m_range.end()
+            elif m_day:
+                if not pending_days:
+                    days = []
+                days.extend(_day_token_weekdays(m_day))
+                pending_days = True
+                pos = m_day.end()
+            else:
+                period = next((iv for w, iv in _DAY_PERIODS if line.startswith(w, pos)), None)
+                if period is not None:
+                    avail.add(days or range(7), period)
+                    pending_days = False
+                    pos += next(len(w) for w, iv in _DAY_PERIODS if line.startswith(w, pos))
+                else:
+                    pos += 1
+    if pending_days and days:
+        avail.add(days, (0, 1440))
+    for table in (avail.weekly, avail.dated):
+        for key in table:
+            table[key] = _merge_intervals(table[key])
+    return avail
+
+
+def _day_token_weekdays(m: re.Match) -> tuple[int, ...]:
+    token = m.group(0)
+    for word, days in _DAY_GROUPS:
+        if token == word:
+            return days
+    if m.group(1):                      # 「月〜金」
+        a, b = _WEEKDAYS.index(m.group(1)), _WEEKDAYS.index(m.group(2))
+        return tuple(range(a, b + 1)) if a <= b else tuple(range(a, 7)) + tuple(range(0, b + 1))
+    return (_WEEKDAYS.index(token[0]),)
+
+
+def parse_schedule(text: str, members: Dict[int, str], *, today: Optional[date] = None) -> Dict[int, Availability]:
+    """
+    予定表メッセージを面接官ごとの Availability にする。
+    メンション / "ID:数字" / 表示名で始まる行を面接官の見出しとみなし、次の見出しまでをその人の予定とする。
+    """
+    names = sorted(((name, uid) for uid, name in members.items() if name), key=lambda x: -len(x[0]))
+    blocks: Dict[int, List[str]] = {}
+    current: Optional[int] = None
+    for line in text.splitlines():
+        uid, rest = None, line
+        m = _MENTION_RE.search(line)
+        if m:
+            uid = int(m.group(1) or m.group(2))
+            rest = line[:m.start()] + line[m.end():]
+        else:
+            stripped = line.lstrip(" ・-*●■◆【")
+            for name, member_id in names:
+                if stripped.startswith(name):
+                    uid, rest = member_id, stripped[len(name):]
+                    break
+        if uid is not None:
+            current = uid
+            blocks.setdefault(uid, [])
+        if current is not None:
+            blocks[current].append(rest)
+    result = {}
+    for uid, lines in blocks.items():
+        avail = parse_availability("\n".join(lines), today=today)
+        if not avail.is_empty():
+            result[uid] = avail
+    return result
+
+
+schedule_match_stats: Dict[str, int] = {"local": 0, "escalated": 0}
+_schedule_index_cache: Dict[str, Any] = {"key": None, "index": {}}
+
+
+def recommend_interviewers_locally(
+    schedule_text: str,
+    profile_text: Optional[str],
+    members: Dict[int, str],
+    counts: Dict[int, int],
+    *,
+    today: Optional[date] = None,
+    limit: int = 3,
+) -> Optional[List[int]]:
+    """
+    予定表と候補者の「面接できる時間帯」の重なりで面接官を選ぶ（重なりあり → 今月の回数が少ない順）。
+    どちらかが読み取れない・誰とも重ならないときは None（Gemini に任せる）。
+    """
+    today = today or datetime.now(JST).date()
+    key = (hash(schedule_text), tuple(sorted(members.items())), today)
+    if _schedule_index_cache["key"] != key:
+        index = parse_schedule(schedule_text, members, today=today)
+        _schedule_index_cache.update(
+            key=key, index={uid: av.timeline(today) for uid, av in index.items()}
+        )
+    timelines: Dict[int, List[tuple[int, int]]] = _schedule_index_cache["index"]
+
+    slot_text = parse_profile(profile_text or "").fields.get("面接できる時間帯", "")
+    candidate = parse_availability(slot_text, today=today).timeline(today) if slot_text else []
+    if not timelines or not candidate:
+        schedule_match_stats["escalated"] += 1
+        return None
+
+    scored = [(uid, overlap_minutes(candidate, tl)) for uid, tl in timelines.items() if uid in members]
+    scored = [(uid, mins) for uid, mins in scored if mins > 0]
+    if not scored:
+        schedule_match_stats["escalated"] += 1
+        return None
+    scored.sort(key=lambda x: (counts.get(x[0], 0), -x[1]))
+    schedule_match_stats["local"] += 1
+    return [uid for uid, _ in scored[:limit]]
 
 # ------------------------------------------------
 # Gemini で “空き＋低負荷” 面接官をリストアップ（最大 3 名）
@@ -481,6 +1483,9 @@ async def _recommend_interviewer_with_gemini(
     -------
     list[int] | None
         優先順に並んだ面接官 ID のリスト（最大 3 件）
+    予定表と候補者の希望時間帯が読み取れれば recommend_interviewers_locally で決め、
+    読み取れないときだけ Gemini に聞く。Gemini が使えない・答えを読み取れないときは
+    今月の面接回数が少ない順で返す。
     """
 
     guild = bot.get_guild(MAIN_GUILD_ID)
@@ -501,6 +1506,13 @@ async def _recommend_interviewer_with_gemini(
     ]
     info_block = "\n".join(info_lines) or "（今月はまだ面接回数がありません）"
 
+    local = recommend_interviewers_locally(
+        schedule_text, profile_text, {m.id: m.display_name for m in role.members}, counts
+    )
+    if local:
+        logger.info(f"[autoAssign] 予定表インデックスで決定: {local}")
+        return local
+
     # ── Gemini に渡すプロンプト ────────────────────
     prompt = f"""
 あなたは Discord の面接管理ボットです。
@@ -526,27 +1538,26 @@ async def _recommend_interviewer_with_gemini(
 """
 
     try:
-        resp = genai_client.models.generate_content(
-            model="gemini-2.5-flash-preview-05-20",
-            contents=prompt,
-            config=GenerateContentConfig(
-                max_output_tokens=64,
-                temperature=0,
-                thinking_config=ThinkingConfig(thinking_budget=0),
-            ),
-        )
-        answer = "".join(
-            getattr(part, "text", "") for part in resp.candidates[0].content.parts
-        ).strip()
+        answer = await ai_gateway.generate(prompt, max_output_tokens=64, label="autoAssign")
         logger.debug(f"[autoAssign] Gemini replied: {answer!r}")
 
     except Exception as e:
-        logger.error(f"[autoAssign] Gemini 呼び出し失敗: {e}")
-        return None
+        logger.error(f"[autoAssign] Gemini 呼び出し失敗、今月の面接回数が少ない順で推薦します: {e}")
+        return _least_loaded_interviewers(role.members, counts)
 
     # 「ID:xxxxxxxxxxxxxxx」を最大 3 件パース
     ids = re.findall(r"ID\s*:\s*(\d{17,20})", answer)[:3]
-    return [int(x) for x in ids if guild.get_member(int(x))] or None
+    picked = [int(x) for x in ids if guild.get_member(int(x))]
+    if not picked:
+        logger.warning(f"[autoAssign] Gemini の返答から面接官を読み取れないため、面接回数が少ない順で推薦します: {answer!r}")
+        return _least_loaded_interviewers(role.members, counts)
+    return picked
+
+
+def _least_loaded_interviewers(members: Iterable[discord.Member], counts: Dict[int, int], limit: int = 3) -> list[int]:
+    """今月の面接回数が少ない順（同数なら表示名順）の面接官 ID。Gemini が使えないときの推薦"""
+    ranked = sorted(members, key=lambda m: (counts.get(m.id, 0), m.display_name))
+    return [m.id for m in ranked[:limit]]
 
 # ------------------------------------------------
 # 推薦結果を処理（3 名表示・メンション付き）
@@ -560,6 +1571,11 @@ async def auto_assign_interviewer(
     if cp.get("interviewer_id"):
         return  # すでに設定済み
 
+    if AUTO_ASSIGN_MODE == "batch":
+        # 同時期にプロフィールが揃った候補者とまとめて割り当てる
+        request_batch_assignment(bot)
+        return
+
     logger.info("[autoAssign] --- called ----------------------------------")
 
     # ① 予定表
@@ -617,25 +1633,286 @@ async def auto_assign_interviewer(
     logger.info("[autoAssign] --- finished --------------------------------")
 
 # ------------------------------------------------
-# Gemini でプロフィール全文を評価するヘルパー
+# 面接官の一括割り当て（未割り当て候補者 × 面接官の最小費用マッチング）
 # ------------------------------------------------
-async def evaluate_profile_with_ai(
-    text: str,
-    *,
-    debug: bool = False,
-    inrate_cleared: bool = False,
-    move_cleared: bool = False,
-) -> tuple[bool, str]:
-    """
-    Returns
-    -------
-    (is_complete, feedback_or_empty)
+ASSIGN_LOAD_COST = 20            # 面接官の件数（今月分＋未完了分＋今回割り当て分）1 件あたり
+ASSIGN_NEUTRAL_AVAIL_COST = 50   # 候補者の希望時間帯が読めないとき（重なりありは 0–50）
+ASSIGN_UNASSIGNED_COST = 100_000 # 割り当て先が無い候補者
+ASSIGN_OPEN_STATUSES = ("記入済み", "担当者待ち", "日程調整済み")
+
+
+@dataclass
+class AssignmentCandidate:
+    key: str                                        # progress_key
+    timeline: Optional[List[tuple[int, int]]]       # None は希望時間帯不明
+
+
+@dataclass
+class AssignmentInterviewer:
+    user_id: int
+    timeline: Optional[List[tuple[int, int]]]      # None は予定表に載っていない（割り当て不可）
+    month_count: int = 0
+    open_load: int = 0
+
+
+@dataclass
+class AssignmentResult:
+    assigned: Dict[str, int] = field(default_factory=dict)           # progress_key → 面接官 ID
+    alternatives: Dict[str, List[int]] = field(default_factory=dict) # 次点（DM 表示用）
+    unassigned: List[str] = field(default_factory=list)
+
+
+def _assignment_edge_cost(c: AssignmentCandidate, i: AssignmentInterviewer) -> Optional[int]:
+    """
+    候補者と面接官の相性コスト。None は割り当て不可（辺を張らない）。
+    予定表に載っていない面接官は空いているか分からないので割り当てない。
+    """
+    if i.timeline is None:
+        return None
+    if c.timeline is None:
+        return ASSIGN_NEUTRAL_AVAIL_COST
+    minutes = overlap_minutes(c.timeline, i.timeline)
+    if minutes == 0:
+        return None
+    return int(ASSIGN_NEUTRAL_AVAIL_COST * (1 - min(minutes, 600) / 600))
+
+
+class _MinCostFlow:
+    """逐次最短路（ポテンシャル付き Dijkstra）による最小費用流。辺は [to, cap, cost, rev] のリスト"""
+
+    def __init__(self, n: int) -> None:
+        self.graph: List[List[list]] = [[] for _ in range(n)]
+
+    def add_edge(self, frm: int, to: int, cap: int, cost: int) -> list:
+        fwd = [to, cap, cost, None]
+        bwd = [frm, 0, -cost, fwd]
+        fwd[3] = bwd
+        self.graph[frm].append(fwd)
+        self.graph[to].append(bwd)
+        return fwd
+
+    def flow(self, s: int, t: int, max_flow: int) -> None:
+        n = len(self.graph)
+        inf = float("inf")
+        potential = [0] * n
+        for _ in range(max_flow):
+            dist = [inf] * n
+            prev: List[Optional[list]] = [None] * n
+            dist[s] = 0
+            heap = [(0, s)]
+            while heap:
+                d, v = heapq.heappop(heap)
+                if d > dist[v]:
+                    continue
+                for e in self.graph[v]:
+                    if e[1] > 0:
+                        nd = d + e[2] + potential[v] - potential[e[0]]
+                        if nd < dist[e[0]]:
+                            dist[e[0]] = nd
+                            prev[e[0]] = e
+                            heapq.heappush(heap, (nd, e[0]))
+            if dist[t] == inf:
+                return
+            for v in range(n):
+                if dist[v] < inf:
+                    potential[v] += dist[v]
+            v = t
+            while v != s:
+                e = prev[v]
+                e[1] -= 1
+                e[3][1] += 1
+                v = e[3][0]
+
+
+def solve_assignments(
+    candidates: List[AssignmentCandidate],
+    interviewers: List[AssignmentInterviewer],
+    *,
+    capacity: int = ASSIGN_MAX_OPEN_PER_INTERVIEWER,
+) -> AssignmentResult:
+    """
+    候補者全員をまとめて割り当てる。コスト = 相性（空き時間の重なり）＋ 件数 × ASSIGN_LOAD_COST。
+    面接官ごとの未完了件数は capacity まで。k 件目の追加ほど高くなるので負荷が分散する。
+    """
+    n, m = len(candidates), len(interviewers)
+    src, sink = n + m, n + m + 1
+    mcf = _MinCostFlow(n + m + 2)
+    pair_edges: List[List[tuple[int, list]]] = [[] for _ in range(n)]
+    ranking: List[List[tuple[int, int]]] = [[] for _ in range(n)]
+
+    for ci, c in enumerate(candidates):
+        mcf.add_edge(src, ci, 1, 0)
+        mcf.add_edge(ci, sink, 1, ASSIGN_UNASSIGNED_COST)
+        for ii, iv in enumerate(interviewers):
+            cost = _assignment_edge_cost(c, iv)
+            if cost is None:
+                continue
+            pair_edges[ci].append((ii, mcf.add_edge(ci, n + ii, 1, cost)))
+            ranking[ci].append((cost + ASSIGN_LOAD_COST * (iv.month_count + iv.open_load), ii))
+    for ii, iv in enumerate(interviewers):
+        base = iv.month_count + iv.open_load
+        for k in range(max(0, capacity - iv.open_load)):
+            mcf.add_edge(n + ii, sink, 1, ASSIGN_LOAD_COST * (base + k))
+
+    mcf.flow(src, sink, n)
+
+    result = AssignmentResult()
+    for ci, c in enumerate(candidates):
+        chosen = next((ii for ii, e in pair_edges[ci] if e[1] == 0), None)
+        if chosen is None:
+            result.unassigned.append(c.key)
+            continue
+        result.assigned[c.key] = interviewers[chosen].user_id
+        result.alternatives[c.key] = [
+            interviewers[ii].user_id for _, ii in sorted(ranking[ci]) if ii != chosen
+        ][:2]
+    return result
+
+
+_batch_assign_lock = asyncio.Lock()
+# プロフィール OK が続いても最初の要求から ASSIGN_BATCH_DELAY 秒以内に 1 回でまとめて割り当てる
+batch_assign_refresher = CoalescingRefresher(
+    "batch_assign", lambda bot, _scope: run_batch_assignment(bot),
+    delay=ASSIGN_BATCH_DELAY, min_interval=ASSIGN_BATCH_DELAY, max_staleness=ASSIGN_BATCH_DELAY,
+)
+
+
+def request_batch_assignment(bot: discord.Client) -> None:
+    batch_assign_refresher.request(bot)
+
+
+async def _candidate_slots_text(bot: discord.Client, cp: Dict[str, Any]) -> str:
+    """候補者の「面接できる時間帯」。未保存なら一度だけプロフィールを取得して cp に残す"""
+    if "available_slots_text" in cp:
+        return cp["available_slots_text"]
+    text = ""
+    channel = bot.get_channel(cp.get("channel_id"))
+    if channel is not None and cp.get("profile_message_id"):
+        try:
+            pm = await channel.fetch_message(cp["profile_message_id"])
+            text = parse_profile(pm.content).fields.get("面接できる時間帯", "")
+        except Exception:
+            pass
+    cp["available_slots_text"] = text
+    return text
+
+
+async def run_batch_assignment(bot: discord.Client) -> int:
+    """記入済みで担当者未定の候補者を一括で割り当て、管理者へまとめて DM する。割り当て件数を返す"""
+    async with _batch_assign_lock:
+        pending = [
+            (key, cp) for key, cp in data_manager.candidate_progress.items()
+            if cp.get("status") == "記入済み" and not cp.get("interviewer_id")
+        ]
+        if not pending:
+            return 0
+        guild = bot.get_guild(MAIN_GUILD_ID)
+        role = guild.get_role(INTERVIEWER_ROLE_ID) if guild else None
+        if role is None or not role.members:
+            logger.warning("[batchAssign] 面接担当者ロールが見つからない / メンバーゼロ")
+            return 0
+
+        today = datetime.now(JST).date()
+        members = {m.id: m.display_name for m in role.members}
+        schedule_text = await _fetch_schedule_text(bot)
+        if not schedule_text:
+            logger.warning("[batchAssign] 予定表が取得できないため割り当てを見送ります")
+            return 0
+        schedule = parse_schedule(schedule_text, members, today=today)
+        counts = _count_by_interviewer_this_month()
+        open_load = Counter(
+            cp["interviewer_id"] for cp in data_manager.candidate_progress.values()
+            if cp.get("interviewer_id") and cp.get("status") in ASSIGN_OPEN_STATUSES
+        )
+        interviewers = [
+            AssignmentInterviewer(
+                uid,
+                schedule[uid].timeline(today) if uid in schedule else None,
+                counts.get(uid, 0),
+                open_load.get(uid, 0),
+            )
+            for uid in members
+        ]
+        candidates = []
+        for key, cp in pending:
+            slots = parse_availability(await _candidate_slots_text(bot, cp), today=today)
+            candidates.append(AssignmentCandidate(key, None if slots.is_empty() else slots.timeline(today)))
+
+        # 200 × 40 規模で数百 ms かかるのでイベントループ外で解く
+        result = await asyncio.to_thread(solve_assignments, candidates, interviewers)
+        # 上の await の間に手動割り当て・辞退・削除があった候補者は書き換えない
+        for key, uid in list(result.assigned.items()):
+            cp = data_manager.candidate_progress.get(key)
+            if cp is None or cp.get("interviewer_id") or cp.get("status") != "記入済み":
+                logger.info(f"[batchAssign] {key} は計算中に状態が変わったのでスキップ")
+                del result.assigned[key]
+                continue
+            cp["interviewer_id"] = uid
+        await data_manager.save_data()
+        if result.assigned:
+            request_dashboard_update(bot)
+        logger.info(
+            f"[batchAssign] 候補者 {len(candidates)} 名 / 面接官 {len(interviewers)} 名 → "
+            f"割り当て {len(result.assigned)} 名, 未割り当て {len(result.unassigned)} 名"
+        )
+
+    if result.assigned:
+        await _send_batch_assignment_dm(bot, result, counts)
+    return len(result.assigned)
+
+
+async def _send_batch_assignment_dm(bot: discord.Client, result: AssignmentResult, counts: Dict[int, int]) -> None:
+    admin = bot.get_user(MANAGER_USER_ID)
+    if not admin:
+        return
+    lines = []
+    for key, uid in result.assigned.items():
+        channel_id = data_manager.candidate_progress.get(key, {}).get("channel_id")
+        alts = " / ".join(f"<@{a}>" for a in result.alternatives.get(key, []))
+        lines.append(
+            f"- <#{channel_id}> → <@{uid}> (今月 {counts.get(uid, 0)} 回)"
+            + (f"　次点: {alts}" if alts else "")
+        )
+    for key in result.unassigned:
+        channel_id = data_manager.candidate_progress.get(key, {}).get("channel_id")
+        lines.append(f"- <#{channel_id}> → 割り当て先なし（空き時間が重ならない / 上限到達）")
+    body = (
+        "🔔 **面接官の一括割り当て**\n" + "\n".join(lines)
+        + "\n(希望時間・予定表・今月の回数・担当中の件数から一括で最適化)"
+    )
+    try:
+        for i in range(0, len(body), 1900):    # DM の文字数上限対策
+            await admin.send(body[i:i + 1900])
+        logger.info("[batchAssign] 割り当て結果 DM 送信完了")
+    except Exception as e:
+        logger.error(f"[batchAssign] 割り当て結果 DM 失敗: {e}")
+
+
+# ------------------------------------------------
+# Gemini でプロフィール全文を評価するヘルパー
+# ------------------------------------------------
+async def evaluate_profile_with_ai(
+    text: str,
+    *,
+    debug: bool = False,
+    inrate_cleared: bool = False,
+    move_cleared: bool = False,
+) -> tuple[bool, str]:
+    """
+    Returns
+    -------
+    (is_complete, feedback_or_empty)
         - True, "" … すべて OK
         - False, "質問 or 不備テンプレ" … 追記 or 確認が必要
+    判定そのものは evaluate_profile_verdict を使う。
     """
+    verdict = await evaluate_profile_verdict(
+        text, debug=debug, inrate_cleared=inrate_cleared, move_cleared=move_cleared
+    )
+    return verdict.ok, verdict.render()
+
 
-    # ────────── プロンプト ──────────
-    system_prompt = """
+PROFILE_RULES_PROMPT = """
 あなたは Discord 面接ボットの厳格なプロフィールチェッカーです。
 
 ### 必須項目（全15）
@@ -662,7 +1939,9 @@ async def evaluate_profile_with_ai(
     * 日本国内  **または**
     * 6か月以内に日本へ移住予定が明記されている
 - **日本語**: 日本語で円滑なコミュニケーションが可能
+""".strip()
 
+PROFILE_TEXT_OUTPUT_PROMPT = """
 ### 評価手順と出力フォーマット（優先度順）
 
 1. **年齢が条件外**  
@@ -696,6 +1975,84 @@ Wishing you all the best in your future endeavors.
    → `OK`
 """.strip()
 
+PROFILE_JSON_OUTPUT_PROMPT = """
+### 評価手順（優先度順）
+最初に当てはまったものをルールコードとします。
+1. 年齢が条件外 → AGE
+2. 海外在住で移住予定が未記載 → MOVE（`move_cleared==False` の場合のみ）
+3. 日本語が困難 → JAPANESE
+4. イン率不足 → INRATE（`inrate_cleared==False` の場合のみ）
+5. その他の未記入・不備 → MISSING
+6. すべて OK → OK
+
+### 出力フォーマット
+次の形の JSON を 1 行だけ出力してください。説明文やコードブロックは不要です。
+{"code":"MISSING","issues":["身長（未記入）","イン率（日数の記載なし）"]}
+- code: 上のルールコードのいずれか
+- issues: MISSING のときだけ、不備のある項目を「項目名（理由）」の形で列挙。それ以外は []
+""".strip()
+
+_VERDICT_JSON_RE = re.compile(r"\{.*\}", re.S)
+
+
+def _parse_verdict_json(answer: str) -> Optional[ProfileVerdict]:
+    if answer.strip("` \n").upper() == "OK":       # JSON にせず OK とだけ返してきた場合
+        return ProfileVerdict("OK")
+    m = _VERDICT_JSON_RE.search(answer)
+    if m is None:
+        return None
+    try:
+        data = json.loads(m.group())
+    except json.JSONDecodeError:
+        return None
+    code = str(data.get("code", "")).upper()
+    if code not in PROFILE_VERDICT_TEMPLATES or code in PROFILE_INTERNAL_CODES:
+        return None
+    issues = [str(i) for i in data.get("issues") or [] if str(i).strip()]
+    return ProfileVerdict(code, issues=issues if code == "MISSING" else [])
+
+
+def _verdict_from_text(answer: str) -> ProfileVerdict:
+    """text モードの自由文をルールコードへ戻す（返答文は Gemini のものをそのまま使う）"""
+    if answer.upper() == "OK":
+        return ProfileVerdict("OK")
+    if "週3日以上" in answer:
+        code = "INRATE"
+    elif "半年以内に日本へ移住予定はございますか" in answer:
+        code = "MOVE"
+    elif "18歳以上36歳以下" in answer:
+        code = "AGE"
+    elif "fluent Japanese" in answer:
+        code = "JAPANESE"
+    else:
+        code = "MISSING"
+    return ProfileVerdict(code, message=answer)
+
+
+async def evaluate_profile_verdict(
+    text: str,
+    *,
+    debug: bool = False,
+    inrate_cleared: bool = False,
+    move_cleared: bool = False,
+) -> ProfileVerdict:
+    """
+    プロフィール全文を評価して ProfileVerdict を返す。
+      1. テンプレ通りで判定が明らかなものは evaluate_profile_locally で即決
+      2. それ以外は Gemini（PROFILE_VERDICT_MODE="json" ならルールコードの JSON だけを返させる）
+      3. Gemini に届かない（遮断中・再試行切れ）ときは候補者の不備ではないので DEFERRED（判定保留）
+    """
+    local = evaluate_profile_locally(text, inrate_cleared=inrate_cleared, move_cleared=move_cleared)
+    if local is not None:
+        if debug:
+            logger.info(f"[PROFILE-LOCAL] code={local.code} issues={local.issues}")
+        return local
+
+    json_mode = PROFILE_VERDICT_MODE == "json"
+    system_prompt = PROFILE_RULES_PROMPT + "\n\n" + (
+        PROFILE_JSON_OUTPUT_PROMPT if json_mode else PROFILE_TEXT_OUTPUT_PROMPT
+    )
+
     # --- フラグによる特例 -------------------------
     extra = []
     if inrate_cleared:
@@ -708,31 +2065,28 @@ Wishing you all the best in your future endeavors.
     prompt = f"{system_prompt}\n\n# ユーザー入力:\n```\n{text}\n```"
 
     try:
-        resp = genai_client.models.generate_content(
-            model="gemini-2.5-flash-preview-05-20",
-            contents=prompt,
-            config=GenerateContentConfig(
-                max_output_tokens=512,
-                temperature=0,
-                thinking_config=ThinkingConfig(thinking_budget=0),
-            ),
+        answer = await ai_gateway.generate(
+            prompt, max_output_tokens=128 if json_mode else 512, label="AI-RESP"
         )
-        answer = "".join(
-            getattr(p, "text", "") for p in resp.candidates[0].content.parts
-        ).strip()
 
         if debug:
             logger.info(f"[AI-RESP]\n{answer}")
 
+    except GeminiUnavailable:
+        logger.warning("[AI-RESP] Gemini 遮断中のため判定を保留します")
+        return ProfileVerdict("DEFERRED")
     except Exception as e:
-        logger.error(f"Gemini 呼び出し失敗: {e}")
-        return False, "プロフィール評価中にエラーが発生しました。お手数ですが再投稿をお願いいたします。"
+        logger.error(f"Gemini 呼び出し失敗、判定を保留します: {e}")
+        return ProfileVerdict("DEFERRED")
 
     # ---------- 結果判定 ----------
-    if answer.upper() == "OK":
-        return True, ""
-
-    return False, answer
+    if not json_mode:
+        return _verdict_from_text(answer)
+    verdict = _parse_verdict_json(answer)
+    if verdict is None:
+        logger.error(f"[AI-RESP] JSON 判定を解釈できません: {answer!r}")
+        return ProfileVerdict("ERROR")
+    return verdict
 
 # ------------------------------------------------
 # AI で「肯定的な返答か」を判定するヘルパー
@@ -743,7 +2097,20 @@ async def is_affirmative_ai(text: str, *, debug: bool = False) -> bool:
 
     - 日本語／英語混在どちらにも対応
     - 出力は **YES / NO** の 2 文字のみを要求して確実にパース
+    - 辞書で判定できる発言・キャッシュ済みの発言は Gemini を呼ばない
     """
+    local = classify_yes_no_local(text)
+    if local is not None:
+        if debug:
+            logger.info(f"[AFFIRMATIVE_AI] Q={text!r} → lexicon={local!r}")
+        return local == "YES"
+
+    cached = ai_answer_cache.get("affirmative", text)
+    if cached is not None:
+        if debug:
+            logger.info(f"[AFFIRMATIVE_AI] Q={text!r} → cache={cached!r}")
+        return cached
+
     prompt = f"""
 あなたは Discord 面接ボットのサブモジュールです。
 以下のユーザー発言が「肯定的・同意的に受け取れるか」を判定し、 **YES** か **NO** のどちらか 1 単語だけを出力してください。
@@ -754,21 +2121,14 @@ async def is_affirmative_ai(text: str, *, debug: bool = False) -> bool:
 """.strip()
 
     try:
-        resp = genai_client.models.generate_content(
-            model="gemini-2.5-flash-preview-05-20",
-            contents=prompt,
-            config=GenerateContentConfig(
-                max_output_tokens=4,
-                temperature=0,
-                thinking_config=ThinkingConfig(thinking_budget=0),
-            ),
-        )
-        answer = "".join(getattr(p, "text", "") for p in resp.candidates[0].content.parts).strip().upper()
+        answer = (await ai_gateway.generate(prompt, max_output_tokens=4, label="AFFIRMATIVE_AI")).upper()
 
         if debug:
             logger.info(f"[AFFIRMATIVE_AI] Q={text!r} → A={answer!r}")
 
-        return answer.startswith("Y")        # "YES" → True, それ以外 → False
+        result = answer.startswith("Y")        # "YES" → True, それ以外 → False
+        ai_answer_cache.put("affirmative", text, result)
+        return result
     except Exception as e:
         logger.error(f"is_affirmative_ai: Gemini 呼び出し失敗: {e}")
         # フォールバック：失敗時は従来の単語フィルタに回す
@@ -777,51 +2137,65 @@ async def is_affirmative_ai(text: str, *, debug: bool = False) -> bool:
 # ------------------------------------------------
 # Gemini で「YES / NO / UNSURE」を返す分類ヘルパー
 # ------------------------------------------------
-async def classify_yes_no_ai(text: str, *, debug: bool = False) -> str:
+async def classify_yes_no_ai(text: str, *, question: Optional[str] = None, debug: bool = False) -> str:
     """
     Parameters
     ----------
     text : str
         候補者の発言
+    question : str, optional
+        ボット側の質問文。「ありません」のように質問の向きで YES/NO が
+        入れ替わる返答を Gemini が正しく読めるよう、プロンプトに添える
     Returns
     -------
     "YES" | "NO" | "UNSURE"
         YES…肯定 / NO…否定 / UNSURE…曖昧
+        辞書（classify_yes_no_local）で判定できればそれを返し、
+        曖昧なものだけ Gemini に聞く（回答は ai_answer_cache に残して再利用する）
     """
+    local = classify_yes_no_local(text)
+    if local is not None:
+        if debug:
+            logger.info(f"[CLASSIFY_YN] Q={text!r} → lexicon={local!r}")
+        return local
+
+    cache_text = f"{question}\n{text}" if question else text   # 同じ返答でも質問が違えば別扱い
+    cached = ai_answer_cache.get("yes_no", cache_text)
+    if cached is not None:
+        if debug:
+            logger.info(f"[CLASSIFY_YN] Q={text!r} → cache={cached!r}")
+        return cached
+
+    question_block = f"# ボットの質問\n{question}\n" if question else ""
+
     prompt = f"""
 あなたは Discord 面接ボットの入力分類器です。
 次のユーザー発言が提案・質問への **肯定** (YES) / **否定** (NO) / **曖昧** (UNSURE) のどれに当たるかを判定し、
 **YES / NO / UNSURE** のいずれか 1 語だけ出力してください。
 - 日本語・英語混在可
-- 例: 「はい」「もちろん」「OK」「あります」 → YES
+- 例: 「はい」「もちろん」「OK」 → YES
       「いいえ」「無理です」「行けません」   → NO
       それ以外や判断が難しければ UNSURE
-# ユーザー発言
+- 「ありません」「ないです」などは質問に対する同意かどうかで判断する
+  （「問題はございませんか？」への「ありません」は YES、「予定はございますか？」への「ありません」は NO）
+{question_block}# ユーザー発言
 {text}
 """.strip()
 
     try:
-        resp = genai_client.models.generate_content(
-            model="gemini-2.5-flash-preview-05-20",
-            contents=prompt,
-            config=GenerateContentConfig(
-                max_output_tokens=4,
-                temperature=0,
-                thinking_config=ThinkingConfig(thinking_budget=0),
-            ),
-        )
-        answer = "".join(
-            getattr(p, "text", "") for p in resp.candidates[0].content.parts
-        ).strip().upper()
+        answer = (await ai_gateway.generate(prompt, max_output_tokens=4, label="CLASSIFY_YN")).upper()
 
         if debug:
             logger.info(f"[CLASSIFY_YN] Q={text!r} → A={answer!r}")
 
         if answer.startswith("Y"):
-            return "YES"
-        if answer.startswith("N"):
-            return "NO"
-        return "UNSURE"
+            result = "YES"
+        elif answer.startswith("N"):
+            result = "NO"
+        else:
+            result = "UNSURE"
+        ai_answer_cache.put("yes_no", cache_text, result)
+        return result
 
     except Exception as e:
         logger.error(f"classify_yes_no_ai: Gemini 呼び出し失敗: {e}")
@@ -831,24 +2205,251 @@ async def classify_yes_no_ai(text: str, *, debug: bool = False) -> str:
 # ------------------------------------------------
 # 投稿が「プロフィール本文らしい」か判定するヘルパー
 # ------------------------------------------------
+PROFILE_HEADERS: tuple[str, ...] = (
+    "呼ばれたい名前", "性別", "年齢", "身長", "お住まい",
+    "恋愛会議の経験", "現在入っている恋愛会議", "イン率",
+    "長所", "短所", "アピールポイント", "今すぐ面接可能",
+    "いつまでに面接してほしいか", "面接できる時間帯", "その他",
+)
+
+
 def looks_like_profile(text: str) -> bool:
     """
     - 必須 15 項目の見出しを 5 個以上含む
     - または改行が 8 行以上
     いずれかを満たす場合 True
     """
-    headers = [
-        "呼ばれたい名前", "性別", "年齢", "身長", "お住まい",
-        "恋愛会議の経験", "現在入っている恋愛会議", "イン率",
-        "長所", "短所", "アピールポイント", "今すぐ面接可能",
-        "いつまでに面接してほしいか", "面接できる時間帯", "その他"
-    ]
-    hit = sum(1 for h in headers if h in text)
+    hit = sum(1 for h in PROFILE_HEADERS if h in text)
     if hit >= 5:
         return True
     return text.count("\n") >= 8
 
 
+# ------------------------------------------------
+# プロフィールの構造化パースとローカル判定
+#   明らかな OK / NG は Gemini を呼ばずにここで決める
+# ------------------------------------------------
+PROFILE_AGE_MIN, PROFILE_AGE_MAX = 18, 36
+PROFILE_INRATE_MIN_DAYS = 3
+
+# evaluate_profile_with_ai のプロンプトに書いてある返答テンプレと同じ文面
+PROFILE_AGE_REJECT_MESSAGE = (
+    "募集要項に記載の通り、当サーバーでは18歳以上36歳以下の方を対象としております。"
+    "誠に恐れ入りますが、今回はお見送りとさせていただきます。"
+)
+PROFILE_MOVE_QUESTION = (
+    "募集要項に記載の通り、原則として日本在住または6か月以内に日本へ移住予定の方を対象としております。"
+    "半年以内に日本へ移住予定はございますか？"
+)
+PROFILE_INRATE_QUESTION = (
+    "募集要項に記載の通り、当サーバーでは週3日以上の会議通話へのご参加をお願いしております。"
+    "その点について問題はございませんでしょうか？"
+)
+PROFILE_JAPANESE_REJECT_MESSAGE = """Thank you very much for your interest and for taking the time to apply.
+
+We truly appreciate your interest in our server and were glad to hear from you.
+
+After careful consideration, however, we’ve determined that
+fluent Japanese communication is essential for participation 
+in our community.
+
+We’re very sorry to let you know that we won’t be able to move forward with your application this time. We hope for your kind understanding.
+
+Wishing you all the best in your future endeavors."""
+PROFILE_MISSING_HEADER = "プロフィールに未記入の項目があります。以下をご追記のうえ、再度ご投稿ください。"
+PROFILE_ERROR_MESSAGE = "プロフィール評価中にエラーが発生しました。お手数ですが再投稿をお願いいたします。"
+PROFILE_DEFERRED_MESSAGE = "プロフィールを受け付けました。確認に少しお時間をいただいています。再投稿は不要です。"
+
+# ルールコード → 候補者への返答テンプレ（MISSING は issues を箇条書きで付ける）
+PROFILE_VERDICT_TEMPLATES: Dict[str, str] = {
+    "OK": "",
+    "AGE": PROFILE_AGE_REJECT_MESSAGE,
+    "MOVE": PROFILE_MOVE_QUESTION,
+    "JAPANESE": PROFILE_JAPANESE_REJECT_MESSAGE,
+    "INRATE": PROFILE_INRATE_QUESTION,
+    "MISSING": PROFILE_MISSING_HEADER,
+    "ERROR": PROFILE_ERROR_MESSAGE,
+    "DEFERRED": PROFILE_DEFERRED_MESSAGE,     # Gemini が使えない間の判定保留（後で再評価）
+}
+# Gemini が返してはいけない（ボット側でだけ使う）コード
+PROFILE_INTERNAL_CODES = ("ERROR", "DEFERRED")
+
+# 行頭の番号・記号の後に見出しが来る行を項目の開始とみなす
+_PROFILE_HEADER_RE = re.compile(
+    r"^[\s\d.．、)）\-・*●■◆◇□【①-⑮]*("
+    + "|".join(re.escape(h) for h in sorted(PROFILE_HEADERS, key=len, reverse=True))
+    + ")(.*)$",
+    re.M,
+)
+_PROFILE_LABEL_TAIL_RE = re.compile(r"^[】」\]]?\s*(何かあれば)?\s*([（(][^）)]*[）)])?\s*[】」\]]?")
+_PREFECTURES: tuple[str, ...] = (
+    "北海道", "青森", "岩手", "宮城", "秋田", "山形", "福島", "茨城", "栃木", "群馬",
+    "埼玉", "千葉", "東京", "神奈川", "新潟", "富山", "石川", "福井", "山梨", "長野",
+    "岐阜", "静岡", "愛知", "三重", "滋賀", "京都", "大阪", "兵庫", "奈良", "和歌山",
+    "鳥取", "島根", "岡山", "広島", "山口", "徳島", "香川", "愛媛", "高知", "福岡",
+    "佐賀", "長崎", "熊本", "大分", "宮崎", "鹿児島", "沖縄",
+)
+# お住まい欄にこれらが含まれていたら国内とは断定せず Gemini に任せる
+_ABROAD_MARKERS = ("海外", "国外", "外国", "留学", "移住", "在住予定", "引っ越し予定")
+# 複数の場所を並べた答え（「東京と韓国」「大阪/ソウル」「東京(今は海外)」など）も Gemini に任せる
+_RESIDENCE_COMPOUND_MARKERS = ("と", "/", "・", "、", ",", "→", "⇒", "(", "から", "まで", "または")
+_PREFECTURE_RE = re.compile("|".join(sorted(_PREFECTURES, key=len, reverse=True)))
+# 「週3日」「週 4」（「週10時間」のような時間数は除く）
+_INRATE_WEEK_RE = re.compile(r"週\s*(\d+)(?![\d.]|\s*(?:時間|h))")
+# 「3日」（「1日2時間」のような 1 日あたりの時間数は除く）
+_INRATE_DAYS_RE = re.compile(r"(?<![\d月])(\d+)\s*日(?!\s*\d)")
+# 「月10日」「月に8回」「毎月」など月単位の答えは週に換算せず Gemini に任せる
+_INRATE_MONTHLY_RE = re.compile(r"毎月|月\s*に?\s*\d")
+_KANA_RE = re.compile(r"[\u3040-\u30ff]")
+
+profile_precheck_stats: Dict[str, int] = {"local": 0, "escalated": 0}
+
+
+@dataclass
+class ProfileVerdict:
+    code: str                                   # PROFILE_VERDICT_TEMPLATES のキー
+    issues: List[str] = field(default_factory=list)
+    message: Optional[str] = None               # text モードで Gemini が書いた返答文
+
+    @property
+    def ok(self) -> bool:
+        return self.code == "OK"
+
+    def render(self) -> str:
+        """候補者へ送る返答文"""
+        if self.message is not None:
+            return self.message
+        text = PROFILE_VERDICT_TEMPLATES.get(self.code, PROFILE_ERROR_MESSAGE)
+        if self.code == "MISSING" and self.issues:
+            text += "\n" + "\n".join(f"・{i}" for i in self.issues)
+        return text
+
+
+@dataclass
+class ParsedProfile:
+    fields: Dict[str, str] = field(default_factory=dict)   # 見出し → 記入内容（NFKC 済み）
+    age: Optional[int] = None
+    inrate_days: Optional[int] = None
+
+    @property
+    def missing(self) -> List[str]:
+        return [h for h in PROFILE_HEADERS if not self.fields.get(h)]
+
+
+# 「25」「25歳」「25才です」のように年齢だけが書かれた欄
+_AGE_RE = re.compile(r"^\s*(\d{1,2})\s*(?:歳|才)?\s*(?:です)?\s*[。.]?\s*$")
+
+
+def _parse_age(value: str) -> Optional[int]:
+    """年齢だけが書かれていれば数値を返す。生年・元号・「20代」・範囲などは None（Gemini に任せる）"""
+    m = _AGE_RE.match(unicodedata.normalize("NFKC", value))
+    return int(m.group(1)) if m else None
+
+
+def _parse_inrate_days(value: str) -> Optional[int]:
+    """週あたりの参加日数。読み取れない・月単位・週 7 日を超える値は None（Gemini に任せる）"""
+    if "毎日" in value:
+        return 7
+    if _INRATE_MONTHLY_RE.search(value):
+        return None
+    m = (
+        _INRATE_WEEK_RE.search(value)
+        or _INRATE_DAYS_RE.search(value)
+        or re.fullmatch(r"\s*(\d+)\s*", value)
+    )
+    if m is None:
+        return None
+    days = int(m.group(1))
+    return days if 0 <= days <= 7 else None
+
+
+def _is_domestic_residence(residence: str) -> bool:
+    """お住まい欄が国内 1 か所だけを指していると断定できるときだけ True"""
+    if any(m in residence for m in _ABROAD_MARKERS + _RESIDENCE_COMPOUND_MARKERS):
+        return False
+    if re.search(r"[a-zA-Z]", residence):     # 「Tokyo」「Seoul」など英字の地名は Gemini に任せる
+        return False
+    prefectures = set(_PREFECTURE_RE.findall(residence))
+    if len(prefectures) > 1:
+        return False
+    return residence.startswith("日本") or len(prefectures) == 1
+
+
+def parse_profile(text: str) -> ParsedProfile:
+    """テンプレート 15 項目を見出し単位で切り出す（複数行の記入にも対応）"""
+    text = unicodedata.normalize("NFKC", text)
+    profile = ParsedProfile()
+    matches = list(_PROFILE_HEADER_RE.finditer(text))
+    for i, m in enumerate(matches):
+        header, rest = m.group(1), m.group(2)
+        label, sep, after = rest.partition(":")
+        if sep and not re.search(r"\d", label):    # 「時間帯 20:00〜」の 20: は区切りではない
+            rest = after
+        else:
+            rest = _PROFILE_LABEL_TAIL_RE.sub("", rest, count=1)
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        value = (rest + text[m.end():end]).strip()
+        if header not in profile.fields or not profile.fields[header]:
+            profile.fields[header] = value
+    profile.age = _parse_age(profile.fields.get("年齢", ""))
+    profile.inrate_days = _parse_inrate_days(profile.fields.get("イン率", ""))
+    return profile
+
+
+def evaluate_profile_locally(
+    text: str,
+    *,
+    inrate_cleared: bool = False,
+    move_cleared: bool = False,
+) -> Optional[ProfileVerdict]:
+    """
+    evaluate_profile_verdict と同じ優先順で判定し、確定できれば ProfileVerdict を返す。
+    お住まい・日本語力・年齢やイン率の書き方が曖昧なときは None（Gemini に任せる）。
+    """
+    p = parse_profile(text)
+    result = _decide_profile(p, inrate_cleared=inrate_cleared, move_cleared=move_cleared)
+    profile_precheck_stats["local" if result else "escalated"] += 1
+    return result
+
+
+def _decide_profile(
+    p: ParsedProfile, *, inrate_cleared: bool, move_cleared: bool
+) -> Optional[ProfileVerdict]:
+    # 1. 年齢
+    if p.fields.get("年齢"):
+        if p.age is None:
+            return None
+        if not PROFILE_AGE_MIN <= p.age <= PROFILE_AGE_MAX:
+            return ProfileVerdict("AGE")
+
+    # 2. お住まい（国内と断定できなければ Gemini）
+    if not move_cleared and p.fields.get("お住まい"):
+        if not _is_domestic_residence(p.fields["お住まい"]):
+            return None
+
+    # 3. 日本語（自由記述欄にかなが無ければ Gemini）
+    free_text = "".join(p.fields.get(h, "") for h in ("長所", "短所", "アピールポイント"))
+    if free_text and not _KANA_RE.search(free_text):
+        return None
+
+    # 4. イン率
+    if not inrate_cleared and p.fields.get("イン率"):
+        if p.inrate_days is None:
+            return None
+        if p.inrate_days < PROFILE_INRATE_MIN_DAYS:
+            return ProfileVerdict("INRATE")
+
+    # 5. 未記入
+    missing = p.missing
+    if missing == ["その他"]:      # 「その他」だけ空欄なら不備かどうかは Gemini に任せる
+        return None
+    if missing:
+        return ProfileVerdict("MISSING", issues=missing)
+
+    # 6. すべて OK
+    return ProfileVerdict("OK")
+
+
 def get_main_display_name(bot: discord.Client, user_id: int) -> str:
     """
     メインサーバーのニックネーム（存在しなければユーザー名）を返す。
@@ -889,49 +2490,41 @@ async def update_or_send_message(
 async def delete_candidate_channels(
     bot: commands.Bot,
     guild: discord.Guild,
-    candidate_id: int
+    candidate_id: int,
+    *,
+    save: bool = True,
 ) -> None:
+    """
+    候補者のテキストチャンネルと VC をまとめて削除する。
+    所有チャンネルは登録表から O(1) で引き、削除前に登録を外すので
+    on_guild_channel_delete が進捗を巻き込んで消すことはない。永続化は 1 回だけ。
+    """
     progress_key = make_progress_key(guild.id, candidate_id)
-
-    # ---------- テキストチャンネル削除 ----------
-    for ch in guild.text_channels:
-        if data_manager.interview_channel_mapping.get(ch.id) == progress_key:
-            try:
-                await ch.delete()
-                logger.info(f"候補者 {candidate_id} のテキストチャンネル {ch.id} を削除")
-            except Exception as e:
-                logger.error(f"テキストチャンネル {ch.id} 削除失敗: {e}")
-            data_manager.interview_channel_mapping.pop(ch.id, None)
-            break
-
-    # ---------- VC 削除 ----------
-    # 1) cp 由来の voice_channel_id
     cp = data_manager.candidate_progress.get(progress_key)
-    vc_candidates: list[int] = []
-    if cp and cp.get("voice_channel_id"):
-        vc_candidates.append(cp["voice_channel_id"])
-
-    # 2) インデックスから逆引き
-    for ch_id, pk in data_manager.interview_channel_mapping.items():
-        if pk == progress_key:
-            vc_candidates.append(ch_id)
-
-    # 重複除去
-    for vc_id in set(vc_candidates):
-        vc_obj = bot.get_channel(vc_id)
-        if isinstance(vc_obj, discord.VoiceChannel):
-            try:
-                await vc_obj.delete()
-                logger.info(f"候補者 {candidate_id} のボイスチャンネル {vc_id} を削除")
-            except Exception as e:
-                logger.error(f"ボイスチャンネル {vc_id} 削除失敗: {e}")
-            data_manager.interview_channel_mapping.pop(vc_id, None)
-            if cp:
-                cp.pop("voice_channel_id", None)
-            break   # 1 つ削除できれば十分
+    owned = data_manager.channels_for(progress_key)
+    if cp:
+        owned.update(ch_id for ch_id in (cp.get("channel_id"), cp.get("voice_channel_id")) if ch_id)
+    for ch_id in owned:
+        data_manager.unlink_channel(ch_id)
+    if cp:
+        cp.pop("voice_channel_id", None)
+
+    async def delete_one(ch_id: int) -> None:
+        ch = bot.get_channel(ch_id)
+        if not isinstance(ch, (discord.TextChannel, discord.VoiceChannel)):
+            return
+        kind = "ボイスチャンネル" if isinstance(ch, discord.VoiceChannel) else "テキストチャンネル"
+        try:
+            await ch.delete()
+            logger.info(f"候補者 {candidate_id} の{kind} {ch_id} を削除")
+        except Exception as e:
+            logger.error(f"{kind} {ch_id} 削除失敗: {e}")
+
+    await asyncio.gather(*(delete_one(ch_id) for ch_id in owned))
 
     # 変更を永続化
-    await data_manager.save_data()
+    if save:
+        await data_manager.save_data()
 
 
 def update_candidate_status(cp: Dict[str, Any], status: str) -> None:
@@ -944,7 +2537,7 @@ async def ensure_channel_exists(
 ) -> Optional[discord.TextChannel]:
     channel = bot.get_channel(cp.get('channel_id'))
     if not channel:
-        data_manager.candidate_progress.pop(progress_key, None)
+        data_manager.pop_candidate(progress_key)
         await data_manager.save_data()
         await update_dashboard(bot)
         return None
@@ -985,78 +2578,1251 @@ class utils:
             return None
 
 
+# ------------------------------------------------
+# 差分ジャーナル（DATA_STORAGE_MODE="journal" 用）
+# ------------------------------------------------
+class StateDiffTracker:
+    """
+    前回永続化した状態との差分を「小さな操作レコード」の列にして返す。
+      ・dict 型セクション … キー単位で put / del
+      ・interview_records … 末尾追記なら append、それ以外は replace
+      ・その他スカラー値   … 値が変わったら replace
+    比較用に保持するのは各値の JSON 文字列のハッシュだけ。
+    """
+
+    RECORDS_SECTION = "interview_records"
+
+    def __init__(self) -> None:
+        self._digests: Dict[str, Any] = {}
+        self._records_len: int = 0
+        self._records_gen: int = -1
+
+    @staticmethod
+    def _digest(value: Any) -> int:
+        return hash(json.dumps(value, ensure_ascii=False, sort_keys=True))
+
+    def reset(self, state: Dict[str, Any], records_gen: int) -> None:
+        """state を「永続化済み」とみなして比較基準を作り直す"""
+        self._digests = {}
+        for section, value in state.items():
+            if section == self.RECORDS_SECTION:
+                continue
+            if isinstance(value, dict):
+                self._digests[section] = {k: self._digest(v) for k, v in value.items()}
+            else:
+                self._digests[section] = self._digest(value)
+        self._records_len = len(state.get(self.RECORDS_SECTION, []))
+        self._records_gen = records_gen
+
+    def diff(self, state: Dict[str, Any], records_gen: int) -> list[dict[str, Any]]:
+        ops: list[dict[str, Any]] = []
+
+        # ---- interview_records ----
+        records = state.get(self.RECORDS_SECTION, [])
+        if records_gen == self._records_gen and len(records) >= self._records_len:
+            if len(records) > self._records_len:
+                ops.append({"op": "append", "s": self.RECORDS_SECTION,
+                            "v": list(records[self._records_len:])})
+        else:
+            ops.append({"op": "replace", "s": self.RECORDS_SECTION, "v": list(records)})
+        self._records_len = len(records)
+        self._records_gen = records_gen
+
+        # ---- dict セクション / スカラー ----
+        for section, value in state.items():
+            if section == self.RECORDS_SECTION:
+                continue
+            if isinstance(value, dict):
+                old: Dict[str, int] = self._digests.get(section)
+                if not isinstance(old, dict):
+                    old = {}
+                new: Dict[str, int] = {}
+                for k, v in value.items():
+                    d = self._digest(v)
+                    new[k] = d
+                    if old.get(k) != d:
+                        ops.append({"op": "put", "s": section, "k": k, "v": v})
+                for k in old.keys() - new.keys():
+                    ops.append({"op": "del", "s": section, "k": k})
+                self._digests[section] = new
+            else:
+                d = self._digest(value)
+                if self._digests.get(section) != d:
+                    ops.append({"op": "replace", "s": section, "v": value})
+                    self._digests[section] = d
+        return ops
+
+    @classmethod
+    def apply(cls, state: Dict[str, Any], op: dict[str, Any]) -> None:
+        """操作レコード 1 件を state（JSON 形式の dict）へ適用"""
+        kind, section = op.get("op"), op.get("s")
+        if kind == "put":
+            target = state.get(section)
+            if not isinstance(target, dict):
+                target = state[section] = {}
+            target[op["k"]] = op["v"]
+        elif kind == "del":
+            target = state.get(section)
+            if isinstance(target, dict):
+                target.pop(op["k"], None)
+        elif kind == "append":
+            state.setdefault(section, []).extend(op["v"])
+        elif kind == "replace":
+            state[section] = op["v"]
+        else:
+            logger.warning(f"[Journal] 不明な操作をスキップ: {kind}")
+
+
+class JournalStore:
+    """
+    スナップショット（従来の interview_records.json）＋追記専用ジャーナルの組み合わせ。
+      ・保存のたびに差分だけを JSON Lines で追記
+      ・compact() でスナップショットへ畳み込み、ジャーナルを空にする
+      ・各行の seq とスナップショットの journal_seq を比べるので、
+        畳み込み途中でクラッシュしても二重適用しない
+    """
+    _TMP_SUFFIX = ".tmp"
+
+    def __init__(self, snapshot_path: str, journal_path: Optional[str] = None) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or os.path.splitext(snapshot_path)[0] + ".journal"
+        self.tracker = StateDiffTracker()
+        self.seq: int = 0
+        self.pending: int = 0              # 前回の畳み込み以降に追記した行数
+
+    def replay(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """スナップショット (dict 形式) にジャーナルを順に適用して返す"""
+        base_seq = int(data.pop("journal_seq", 0) or 0)
+        self.seq = base_seq
+        if not os.path.isfile(self.journal_path):
+            return data
+
+        applied = 0
+        good_offset = 0
+        with open(self.journal_path, "rb") as fp:
+            for raw in fp:
+                try:
+                    rec = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    logger.warning("[Journal] 末尾の破損行を検出したため以降を破棄します")
+                    break
+                good_offset += len(raw)
+                seq = int(rec.get("seq", 0))
+                if seq <= base_seq:
+                    continue
+                StateDiffTracker.apply(data, rec)
+                self.seq = max(self.seq, seq)
+                applied += 1
+
+        # 書きかけの行が残っていると以降の追記が読めなくなるので切り詰める
+        if good_offset < os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as fp:
+                fp.truncate(good_offset)
+
+        self.pending = applied
+        logger.info(f"[Journal] リプレイ完了 ({applied} 件適用, seq={self.seq})")
+        return data
+
+    def mark_persisted(self, state: Dict[str, Any], records_gen: int) -> None:
+        self.tracker.reset(state, records_gen)
+
+    def append(self, state: Dict[str, Any], records_gen: int) -> int:
+        """差分をジャーナルへ追記し、書いた操作数を返す"""
+        ops = self.tracker.diff(state, records_gen)
+        if not ops:
+            return 0
+        lines = []
+        for op in ops:
+            self.seq += 1
+            op["seq"] = self.seq
+            lines.append(json.dumps(op, ensure_ascii=False))
+        with open(self.journal_path, "a", encoding="utf-8") as fp:
+            fp.write("\n".join(lines) + "\n")
+            fp.flush()
+            os.fsync(fp.fileno())
+        self.pending += len(ops)
+        return len(ops)
+
+    def compact(self, state: Dict[str, Any], records_gen: int) -> None:
+        """現在の状態をスナップショットへ書き出し、ジャーナルを空にする"""
+        tmp = self.snapshot_path + self._TMP_SUFFIX
+        data = dict(state)
+        data["journal_seq"] = self.seq
+        try:
+            with open(tmp, "w", encoding="utf-8") as fp:
+                json.dump(data, fp, ensure_ascii=False, indent=4, default=_json_default)
+            os.replace(tmp, self.snapshot_path)
+        except Exception:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp)
+            raise
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self.pending = 0
+        self.tracker.reset(state, records_gen)
+
+
+# ------------------------------------------------
+# SQLite ストレージ（DATA_STORAGE_MODE="sqlite" 用）
+# ------------------------------------------------
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _record_year_month(rec: Dict[str, Any]) -> Optional[str]:
+    try:
+        dt = datetime.fromisoformat(rec.get("date"))
+    except Exception:
+        return None
+    return f"{dt.year}-{dt.month:02d}"
+
+
+class SqliteStore:
+    """
+    interview_records / candidate_progress / interview_channel_mapping / memo_history を
+    インデックス付きテーブルに行単位で保存する。
+      ・各行の body に元の dict を JSON で丸ごと持つので、ロード結果は JSON モードと同一
+      ・検索用の列（interviewer_id, interviewee_id, date, channel_id …）だけを別途展開
+        （DataManager は未保存の変更が無いとき、面接官×年月 / 受験者 / チャンネルの参照をここから引く）
+      ・保存は StateDiffTracker の差分を 1 トランザクションで適用（変更行だけ書く）
+      ・上記以外のセクション（統計メッセージ ID など）は state_maps / state_values に保存
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS interview_records (
+        seq            INTEGER PRIMARY KEY AUTOINCREMENT,
+        date           TEXT,
+        year_month     TEXT,
+        interviewer_id INTEGER,
+        interviewee_id INTEGER,
+        result         TEXT,
+        body           TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_records_interviewer_month ON interview_records(interviewer_id, year_month);
+    CREATE INDEX IF NOT EXISTS idx_records_month ON interview_records(year_month);
+    CREATE INDEX IF NOT EXISTS idx_records_interviewee ON interview_records(interviewee_id);
+    CREATE INDEX IF NOT EXISTS idx_records_date ON interview_records(date);
+
+    CREATE TABLE IF NOT EXISTS candidate_progress (
+        progress_key     TEXT PRIMARY KEY,
+        candidate_id     INTEGER,
+        interviewer_id   INTEGER,
+        channel_id       INTEGER,
+        voice_channel_id INTEGER,
+        status           TEXT,
+        body             TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_progress_candidate ON candidate_progress(candidate_id);
+    CREATE INDEX IF NOT EXISTS idx_progress_interviewer ON candidate_progress(interviewer_id);
+    CREATE INDEX IF NOT EXISTS idx_progress_channel ON candidate_progress(channel_id);
+    CREATE INDEX IF NOT EXISTS idx_progress_voice_channel ON candidate_progress(voice_channel_id);
+
+    CREATE TABLE IF NOT EXISTS interview_channel_mapping (
+        channel_id   INTEGER PRIMARY KEY,
+        progress_key TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_mapping_progress ON interview_channel_mapping(progress_key);
+
+    CREATE TABLE IF NOT EXISTS memo_history (
+        candidate_key  TEXT NOT NULL,
+        idx            INTEGER NOT NULL,
+        interviewer_id INTEGER,
+        channel_id     INTEGER,
+        message_id     INTEGER,
+        timestamp      TEXT,
+        result         TEXT,
+        body           TEXT NOT NULL,
+        PRIMARY KEY (candidate_key, idx)
+    );
+    CREATE INDEX IF NOT EXISTS idx_memo_interviewer ON memo_history(interviewer_id);
+    CREATE INDEX IF NOT EXISTS idx_memo_channel ON memo_history(channel_id);
+
+    CREATE TABLE IF NOT EXISTS state_maps (
+        section TEXT NOT NULL,
+        key     TEXT NOT NULL,
+        value   TEXT NOT NULL,
+        PRIMARY KEY (section, key)
+    );
+    CREATE TABLE IF NOT EXISTS state_values (
+        section TEXT PRIMARY KEY,
+        value   TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key   TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """
+
+    TABLE_SECTIONS = ("interview_records", "candidate_progress", "interview_channel_mapping", "memo_history")
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self.tracker = StateDiffTracker()
+        self.pending: int = 0              # 前回のチェックポイント以降に書いた操作数
+        self._conn_lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.executescript(self.SCHEMA)
+
+    # ---------- 移行 ----------
+
+    @property
+    def migrated(self) -> bool:
+        with self._conn_lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key='migrated_at'").fetchone()
+        return row is not None
+
+    def import_state(self, state: Dict[str, Any], source: str) -> None:
+        """JSON 由来の状態を一括投入（初回起動時のワンショット移行）"""
+        with self._conn_lock, self.conn:
+            for table in self.TABLE_SECTIONS:
+                self.conn.execute(f"DELETE FROM {table}")
+            self.conn.execute("DELETE FROM state_maps")
+            self.conn.execute("DELETE FROM state_values")
+            self._insert_records(state.get("interview_records", []))
+            for section, value in state.items():
+                if section == "interview_records":
+                    continue
+                if isinstance(value, dict):
+                    for k, v in value.items():
+                        self._put(section, k, v)
+                else:
+                    self._replace(section, value)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES ('migrated_at', ?), ('migrated_from', ?)",
+                (get_current_time_iso(), source),
+            )
+
+    # ---------- ロード / 保存 ----------
+
+    def load(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {
+            "interview_records": [],
+            "candidate_progress": {},
+            "interview_channel_mapping": {},
+            "memo_history": {},
+        }
+        with self._conn_lock:
+            cur = self.conn.execute("SELECT body FROM interview_records ORDER BY seq")
+            state["interview_records"] = [json.loads(body) for (body,) in cur]
+            for pk, body in self.conn.execute("SELECT progress_key, body FROM candidate_progress"):
+                state["candidate_progress"][pk] = json.loads(body)
+            for ch_id, pk in self.conn.execute("SELECT channel_id, progress_key FROM interview_channel_mapping"):
+                state["interview_channel_mapping"][str(ch_id)] = pk
+            cur = self.conn.execute("SELECT candidate_key, body FROM memo_history ORDER BY candidate_key, idx")
+            for key, body in cur:
+                state["memo_history"].setdefault(key, []).append(json.loads(body))
+            for section, key, value in self.conn.execute("SELECT section, key, value FROM state_maps"):
+                state.setdefault(section, {})[key] = json.loads(value)
+            for section, value in self.conn.execute("SELECT section, value FROM state_values"):
+                state[section] = json.loads(value)
+        return state
+
+    def mark_persisted(self, state: Dict[str, Any], records_gen: int) -> None:
+        self.tracker.reset(state, records_gen)
+
+    def append(self, state: Dict[str, Any], records_gen: int) -> int:
+        """差分を 1 トランザクションで各テーブルへ反映し、操作数を返す"""
+        ops = self.tracker.diff(state, records_gen)
+        if not ops:
+            return 0
+        with self._conn_lock, self.conn:
+            for op in ops:
+                kind, section = op["op"], op["s"]
+                if kind == "put":
+                    self._put(section, op["k"], op["v"])
+                elif kind == "del":
+                    self._delete(section, op["k"])
+                elif kind == "append":
+                    self._insert_records(op["v"])
+                elif kind == "replace" and section == "interview_records":
+                    self.conn.execute("DELETE FROM interview_records")
+                    self._insert_records(op["v"])
+                else:
+                    self._replace(section, op["v"])
+        self.pending += len(ops)
+        return len(ops)
+
+    def compact(self, state: Dict[str, Any], records_gen: int) -> None:
+        """WAL をメイン DB へ書き戻して切り詰める"""
+        with self._conn_lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.pending = 0
+
+    # ---------- 検索（インデックス使用） ----------
+
+    def records_for_interviewer_month(self, interviewer_id: int, year_month: str) -> list[dict[str, Any]]:
+        with self._conn_lock:
+            cur = self.conn.execute(
+                "SELECT body FROM interview_records WHERE interviewer_id=? AND year_month=? ORDER BY seq",
+                (interviewer_id, year_month),
+            )
+            return [json.loads(body) for (body,) in cur]
+
+    def records_for_interviewee(self, interviewee_id: int) -> list[dict[str, Any]]:
+        with self._conn_lock:
+            cur = self.conn.execute(
+                "SELECT body FROM interview_records WHERE interviewee_id=? ORDER BY seq", (interviewee_id,)
+            )
+            return [json.loads(body) for (body,) in cur]
+
+    def progress_key_for_channel(self, channel_id: int) -> Optional[str]:
+        """テキスト / VC どちらのチャンネル ID からでも progress_key を引く"""
+        with self._conn_lock:
+            row = self.conn.execute(
+                "SELECT progress_key FROM interview_channel_mapping WHERE channel_id=?", (channel_id,)
+            ).fetchone()
+            if row is None:
+                row = self.conn.execute(
+                    "SELECT progress_key FROM candidate_progress WHERE channel_id=? "
+                    "UNION SELECT progress_key FROM candidate_progress WHERE voice_channel_id=? LIMIT 1",
+                    (channel_id, channel_id),
+                ).fetchone()
+            if row is not None and self.conn.execute(
+                "SELECT 1 FROM candidate_progress WHERE progress_key=?", (row[0],)
+            ).fetchone() is None:
+                row = None      # 候補者が消えた対応は返さない（メモリ側の参照と同じ）
+        return row[0] if row else None
+
+    # ---------- 内部 ----------
+
+    def _insert_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        self.conn.executemany(
+            "INSERT INTO interview_records(date, year_month, interviewer_id, interviewee_id, result, body) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    rec.get("date"),
+                    _record_year_month(rec),
+                    _as_int(rec.get("interviewer_id")),
+                    rec.get("interviewee_id"),
+                    rec.get("result"),
+                    json.dumps(rec, ensure_ascii=False),
+                )
+                for rec in records
+            ],
+        )
+
+    def _put(self, section: str, key: str, value: Any) -> None:
+        if section == "candidate_progress":
+            self.conn.execute(
+                "INSERT OR REPLACE INTO candidate_progress"
+                "(progress_key, candidate_id, interviewer_id, channel_id, voice_channel_id, status, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    _as_int(value.get("candidate_id")),
+                    _as_int(value.get("interviewer_id")),
+                    _as_int(value.get("channel_id")),
+                    _as_int(value.get("voice_channel_id")),
+                    value.get("status"),
+                    json.dumps(value, ensure_ascii=False),
+                ),
+            )
+        elif section == "interview_channel_mapping":
+            self.conn.execute(
+                "INSERT OR REPLACE INTO interview_channel_mapping(channel_id, progress_key) VALUES (?, ?)",
+                (int(key), value),
+            )
+        elif section == "memo_history":
+            self.conn.execute("DELETE FROM memo_history WHERE candidate_key=?", (key,))
+            self.conn.executemany(
+                "INSERT INTO memo_history"
+                "(candidate_key, idx, interviewer_id, channel_id, message_id, timestamp, result, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        key, i,
+                        _as_int(rec.get("interviewer_id")),
+                        _as_int(rec.get("channel_id")),
+                        _as_int(rec.get("message_id")),
+                        rec.get("timestamp"),
+                        rec.get("result"),
+                        json.dumps(rec, ensure_ascii=False),
+                    )
+                    for i, rec in enumerate(value)
+                ],
+            )
+        else:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO state_maps(section, key, value) VALUES (?, ?, ?)",
+                (section, key, json.dumps(value, ensure_ascii=False)),
+            )
+
+    def _delete(self, section: str, key: str) -> None:
+        if section == "candidate_progress":
+            self.conn.execute("DELETE FROM candidate_progress WHERE progress_key=?", (key,))
+        elif section == "interview_channel_mapping":
+            self.conn.execute("DELETE FROM interview_channel_mapping WHERE channel_id=?", (int(key),))
+        elif section == "memo_history":
+            self.conn.execute("DELETE FROM memo_history WHERE candidate_key=?", (key,))
+        else:
+            self.conn.execute("DELETE FROM state_maps WHERE section=? AND key=?", (section, key))
+
+    def _replace(self, section: str, value: Any) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO state_values(section, value) VALUES (?, ?)",
+            (section, json.dumps(value, ensure_ascii=False)),
+        )
+
+
+# ------------------------------------------------
+# 面接記録の列指向ストア
+# ------------------------------------------------
+def _ym_code(year_month: str) -> int:
+    """"YYYY-MM" → YYYYMM (int)"""
+    year, month = year_month.split("-")
+    return int(year) * 100 + int(month)
+
+
+class InterviewRecordStore:
+    """
+    interview_records を型付き配列の列で保持する。
+      ・epoch 秒 / interviewer_id / interviewee_id / 結果コード の 4 列
+      ・年月ごとに行番号と「面接官 × 結果」のセルコードのバケットを持ち、
+        月・面接官での絞り込みはそのバケットだけを、月の集計はセルコード列を Counter で数えるだけ
+      ・絞り込みは map / compress で列を C 側のループのまま引く
+      ・interviewee → 最新の面接官の表は初めて引かれたときに作る（以後は追記のたびに更新）
+      ・list[dict] と同じように for / reversed / len / [] / append が使える（dict はその場で生成）
+    列で元の dict を復元できない行（manual_set の文字列 ID、JST 以外の日時、余分なキー等）は
+    元の dict をそのまま _raw に持つので、保存結果は list[dict] 時代と一致する。
+    """
+
+    KEYS = ("date", "interviewer_id", "interviewee_id", "result")
+    KNOWN_RESULTS = (
+        "PASS", "FAIL", "BAN", "INTERVAL",
+        "FAIL (遅延)", "BAN (遅延)", "INTERVAL (遅延)", "manual_set",
+    )
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()) -> None:
+        self._ts = array("d")
+        self._interviewer = array("q")
+        self._interviewee = array("q")
+        self._result = array("H")
+        self._raw: Dict[int, Dict[str, Any]] = {}
+        self._month_rows: Dict[int, array] = {}           # YYYYMM → 行番号
+        self._month_cells: Dict[int, array] = {}          # YYYYMM → セルコード（行番号と同じ並び）
+        self._cell_keys: List[tuple[int, int]] = []       # セルコード → (interviewer_id, 結果コード)
+        self._cell_codes: Dict[tuple[int, int], int] = {}
+        self._latest_interviewer: Optional[Dict[Any, Any]] = None   # interviewee_id → 最新の interviewer_id
+        self._result_names: List[str] = list(self.KNOWN_RESULTS)
+        self._result_codes: Dict[str, int] = {r: i for i, r in enumerate(self._result_names)}
+        for rec in records:
+            self.append(rec)
+
+    # ---------- list 互換 ----------
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def __iter__(self):
+        for row in range(len(self._ts)):
+            yield self._materialize(row)
+
+    def __reversed__(self):
+        for row in range(len(self._ts) - 1, -1, -1):
+            yield self._materialize(row)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in range(*index.indices(len(self._ts)))]
+        if index < 0:
+            index += len(self._ts)
+        if not 0 <= index < len(self._ts):
+            raise IndexError(index)
+        return self._materialize(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (InterviewRecordStore, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def append(self, rec: Dict[str, Any]) -> None:
+        row = len(self._ts)
+        ts, ym, canonical = 0.0, 0, False
+        try:
+            dt = datetime.fromisoformat(rec.get("date"))
+            ts, ym = dt.timestamp(), dt.year * 100 + dt.month
+            canonical = (
+                dt.tzinfo is not None
+                and datetime.fromtimestamp(ts, JST).isoformat() == rec.get("date")
+            )
+        except Exception:
+            pass
+        interviewer = _as_int(rec.get("interviewer_id"))
+        interviewee = rec.get("interviewee_id")
+        result = str(rec.get("result", ""))
+        canonical = (
+            canonical
+            and tuple(rec.keys()) == self.KEYS
+            and type(rec.get("interviewer_id")) is int
+            and type(interviewee) is int
+        )
+
+        code = self._result_codes.get(result)
+        if code is None:
+            code = self._result_codes[result] = len(self._result_names)
+            self._result_names.append(result)
+
+        interviewer = interviewer if interviewer is not None else 0
+        self._ts.append(ts)
+        self._interviewer.append(interviewer)
+        self._interviewee.append(interviewee if type(interviewee) is int else 0)
+        self._result.append(code)
+        if not canonical:
+            self._raw[row] = dict(rec)
+        if ym:
+            cell = self._cell_codes.get((interviewer, code))
+            if cell is None:
+                cell = self._cell_codes[(interviewer, code)] = len(self._cell_keys)
+                self._cell_keys.append((interviewer, code))
+            self._month_rows.setdefault(ym, array("I")).append(row)
+            self._month_cells.setdefault(ym, array("I")).append(cell)
+        if interviewee is not None and self._latest_interviewer is not None:
+            self._latest_interviewer[interviewee] = rec.get("interviewer_id")
+
+    def copy(self) -> "InterviewRecordStore":
+        """配列ごとコピー（保存スレッドへ渡すスナップショット用）"""
+        new = InterviewRecordStore()
+        new._ts = array("d", self._ts)
+        new._interviewer, new._interviewee = array("q", self._interviewer), array("q", self._interviewee)
+        new._result = array("H", self._result)
+        new._raw = dict(self._raw)
+        new._month_rows = {ym: array("I", rows) for ym, rows in self._month_rows.items()}
+        new._month_cells = {ym: array("I", cells) for ym, cells in self._month_cells.items()}
+        new._cell_keys, new._cell_codes = list(self._cell_keys), dict(self._cell_codes)
+        if self._latest_interviewer is not None:
+            new._latest_interviewer = dict(self._latest_interviewer)
+        new._result_names = list(self._result_names)
+        new._result_codes = dict(self._result_codes)
+        return new
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def iter_json_rows(self) -> Iterable[str]:
+        """1 件ずつ JSON 文字列にして返す（保存用。dict はその場で捨てるので GC を誘発しない）"""
+        for row in range(len(self._ts)):
+            yield json.dumps(self._materialize(row), ensure_ascii=False, default=str)
+
+    # ---------- 絞り込み ----------
+
+    def rows(
+        self,
+        year_month: Optional[str] = None,
+        interviewer_id: Optional[int] = None,
+        result: Optional[str] = None,
+        interviewee_id: Optional[int] = None,
+    ) -> List[int]:
+        """条件に一致する行番号（昇順）。年月指定時はその月のバケットだけを見る"""
+        candidates: Any
+        if year_month is not None:
+            candidates = self._month_rows.get(_ym_code(year_month), ())
+        else:
+            candidates = range(len(self._ts))
+        if interviewer_id is not None:
+            candidates = list(compress(
+                candidates,
+                map(operator.eq, repeat(interviewer_id), map(self._interviewer.__getitem__, candidates)),
+            ))
+        if interviewee_id is not None:
+            candidates = list(compress(
+                candidates,
+                map(operator.eq, repeat(interviewee_id), map(self._interviewee.__getitem__, candidates)),
+            ))
+        if result is not None:
+            code = self._result_codes.get(result)
+            if code is None:
+                return []
+            candidates = list(compress(
+                candidates, map(operator.eq, repeat(code), map(self._result.__getitem__, candidates))
+            ))
+        return list(candidates)
+
+    def months(self) -> List[str]:
+        """記録のある年月（"YYYY-MM"）"""
+        return [f"{ym // 100}-{ym % 100:02d}" for ym in self._month_rows]
+
+    def month_cells(self, year_month: str) -> Counter:
+        """{(interviewer_id, 結果): 件数}。その月のセルコード列を数えるだけ（interviewer_id 不明は 0）"""
+        counts = Counter(self._month_cells.get(_ym_code(year_month), ()))
+        keys, names = self._cell_keys, self._result_names
+        return Counter({(keys[cell][0], names[keys[cell][1]]): n for cell, n in counts.items()})
+
+    def latest_interviewer_by_interviewee(self) -> Dict[int, int]:
+        """{interviewee_id: 最新記録の interviewer_id}（表の写し）"""
+        return dict(self._latest_index())
+
+    def latest_interviewer(self, interviewee_id: int) -> Optional[int]:
+        return self._latest_index().get(interviewee_id)
+
+    def _latest_index(self) -> Dict[Any, Any]:
+        if self._latest_interviewer is None:
+            if not self._raw:
+                latest = dict(zip(self._interviewee, self._interviewer))   # 後の行ほど優先
+            else:
+                latest, raw = {}, self._raw
+                for row, pair in enumerate(zip(self._interviewee, self._interviewer)):
+                    rec = raw.get(row)
+                    if rec is None:
+                        latest[pair[0]] = pair[1]
+                    elif rec.get("interviewee_id") is not None:
+                        latest[rec["interviewee_id"]] = rec.get("interviewer_id")
+            self._latest_interviewer = latest
+        return self._latest_interviewer
+
+    def without_rows(self, rows: Iterable[int]) -> "InterviewRecordStore":
+        """指定行を除いた新しいストアを返す"""
+        drop = set(rows)
+        return InterviewRecordStore(
+            self._materialize(row) for row in range(len(self._ts)) if row not in drop
+        )
+
+    # ---------- 内部 ----------
+
+    def _materialize(self, row: int) -> Dict[str, Any]:
+        raw = self._raw.get(row)
+        if raw is not None:
+            return dict(raw)
+        return {
+            "date": datetime.fromtimestamp(self._ts[row], JST).isoformat(),
+            "interviewer_id": self._interviewer[row],
+            "interviewee_id": self._interviewee[row],
+            "result": self._result_names[self._result[row]],
+        }
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dump 用: InterviewRecordStore などを list へ変換"""
+    if hasattr(obj, "to_list"):
+        return obj.to_list()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# ------------------------------------------------
+# 面接記録の集計インデックス（年月 × 面接官 × 結果）
+# ------------------------------------------------
+class InterviewStatsIndex:
+    """
+    interview_records を月ごとに面接官別・結果別で数えておく。
+    DataManager が記録の追加・削除のたびに add / remove を呼び、ロード時に 1 回だけ rebuild する。
+    結果キーは str(result).upper()（"PASS", "FAIL (遅延)", "MANUAL_SET" など）。
+    """
+
+    def __init__(self) -> None:
+        self._month_totals: Dict[str, Dict[int, int]] = {}     # ym -> {interviewer_id: 件数}
+        self._month_results: Dict[str, Dict[str, int]] = {}    # ym -> {result: 件数}
+
+    @staticmethod
+    def _key(rec: Dict[str, Any]) -> Optional[tuple[str, int, str]]:
+        ym = _record_year_month(rec)
+        iid = _as_int(rec.get("interviewer_id"))
+        if ym is None or iid is None:
+            return None
+        return ym, iid, str(rec.get("result", "")).upper()
+
+    def rebuild(self, records: Iterable[Dict[str, Any]]) -> None:
+        self._month_totals, self._month_results = {}, {}
+        if not isinstance(records, InterviewRecordStore):
+            for rec in records:
+                self.add(rec)
+            return
+        # 列指向ストアからは dict を作らずに月ごとに数える
+        for ym in records.months():
+            totals, results = {}, {}
+            for (iid, result), n in records.month_cells(ym).items():
+                if not iid:
+                    continue
+                result = result.upper()
+                totals[iid] = totals.get(iid, 0) + n
+                results[result] = results.get(result, 0) + n
+            if totals:
+                self._month_totals[ym], self._month_results[ym] = totals, results
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        key = self._key(rec)
+        if key is None:
+            return
+        ym, iid, result = key
+        totals = self._month_totals.setdefault(ym, {})
+        totals[iid] = totals.get(iid, 0) + 1
+        results = self._month_results.setdefault(ym, {})
+        results[result] = results.get(result, 0) + 1
+
+    def remove(self, rec: Dict[str, Any]) -> None:
+        key = self._key(rec)
+        if key is None:
+            return
+        ym, iid, result = key
+        for bucket, owner, k, sub in (
+            (self._month_totals.get(ym), self._month_totals, ym, iid),
+            (self._month_results.get(ym), self._month_results, ym, result),
+        ):
+            if not bucket or sub not in bucket:
+                continue
+            bucket[sub] -= 1
+            if bucket[sub] <= 0:
+                del bucket[sub]
+            if not bucket:
+                del owner[k]
+
+    # ---------- 参照 ----------
+
+    def months(self) -> set[str]:
+        return set(self._month_totals)
+
+    def counts_for_month(self, year_month: str) -> Dict[int, int]:
+        """{interviewer_id: 全結果の合計件数}（コピーを返す）"""
+        return dict(self._month_totals.get(year_month, {}))
+
+    def result_counts(self, year_month: str) -> Dict[str, int]:
+        """{result: 件数}（コピーを返す）"""
+        return dict(self._month_results.get(year_month, {}))
+
+
+# ------------------------------------------------
+# 候補者の二次インデックス
+# ------------------------------------------------
+class CandidateIndex:
+    """
+    candidate_progress / interview_channel_mapping から引く逆引き表。
+      ・チャンネル / VC ID ⇄ progress_key（どの候補者のチャンネルか / 候補者のチャンネル一覧）
+      ・candidate_id → {progress_key}
+      ・candidate_id → 最後に在籍を確認したサーバー ID
+    DataManager の変更用メソッド経由で常に更新し、ロード時に作り直して整合を取る。
+    """
+
+    def __init__(self) -> None:
+        self.by_channel: Dict[int, str] = {}
+        self.channels_of: Dict[str, set[int]] = defaultdict(set)
+        self.by_candidate: Dict[int, set[str]] = defaultdict(set)
+        self.guild_of: Dict[int, int] = {}
+
+    def link(self, channel_id: int, progress_key: str) -> None:
+        self.unlink(channel_id)
+        self.by_channel[channel_id] = progress_key
+        self.channels_of[progress_key].add(channel_id)
+
+    def unlink(self, channel_id: int) -> Optional[str]:
+        progress_key = self.by_channel.pop(channel_id, None)
+        if progress_key is not None:
+            owned = self.channels_of.get(progress_key)
+            if owned is not None:
+                owned.discard(channel_id)
+                if not owned:
+                    del self.channels_of[progress_key]
+        return progress_key
+
+    def add(self, progress_key: str, cp: Dict[str, Any]) -> None:
+        for ch_id in (cp.get("channel_id"), cp.get("voice_channel_id")):
+            if ch_id:
+                self.link(int(ch_id), progress_key)
+        cid = cp.get("candidate_id")
+        if cid:
+            self.by_candidate[cid].add(progress_key)
+            if cp.get("source_guild_id"):
+                self.guild_of[cid] = cp["source_guild_id"]
+
+    def discard(self, progress_key: str, cp: Dict[str, Any]) -> None:
+        for ch_id in list(self.channels_of.get(progress_key, ())):
+            self.unlink(ch_id)
+        cid = cp.get("candidate_id")
+        keys = self.by_candidate.get(cid)
+        if keys is not None:
+            keys.discard(progress_key)
+            if not keys:
+                del self.by_candidate[cid]
+
+    def rebuild(
+        self, candidate_progress: Dict[str, Dict[str, Any]], mapping: Dict[int, str]
+    ) -> int:
+        """全件から作り直す。mapping に無い候補者チャンネルは補い、その件数を返す"""
+        self.by_channel = {}
+        self.channels_of = defaultdict(set)
+        self.by_candidate = defaultdict(set)
+        self.guild_of = {}
+        for ch_id, progress_key in mapping.items():
+            if progress_key in candidate_progress:
+                self.link(ch_id, progress_key)
+        repaired = 0
+        for progress_key, cp in candidate_progress.items():
+            self.add(progress_key, cp)
+            for ch_id in (cp.get("channel_id"), cp.get("voice_channel_id")):
+                if ch_id and int(ch_id) not in mapping:
+                    mapping[int(ch_id)] = progress_key
+                    repaired += 1
+        return repaired
+
+
 # ------------------------------------------------
 # DataManager（永続化用）
 # ------------------------------------------------
 class DataManager:
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        storage_mode: str = DATA_STORAGE_MODE,
+        flush_interval: float = DATA_FLUSH_INTERVAL,
+    ):
         self.file_path = file_path
         self.lock = asyncio.Lock()
-        self.interview_records: List[Dict[str, Any]] = []
+        # ---- write-behind（flush_interval > 0 のとき有効） ----
+        self.flush_interval = flush_interval
+        self._dirty: bool = False
+        self._dirty_event = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+        self.save_requests: int = 0        # save_data() / flush() が呼ばれた回数
+        self.save_writes: int = 0          # 実際に永続化した回数
+        self._records_generation: int = 0
+        # 面接記録・候補者・チャンネル対応の変更回数と、そのうち SQLite へ書き終えた回数
+        self._mutations: int = 0
+        self._persisted_mutations: int = -1
+        self.stats_index = InterviewStatsIndex()
+        self.interview_records: InterviewRecordStore = InterviewRecordStore()
         self.interviewer_stats_message_ids: Dict[str, int] = {}
         self.monthly_stats_message_ids: Dict[str, int] = {}
         self.candidate_progress: Dict[str, Dict[str, Any]] = {}
         self.interview_channel_mapping: Dict[int, str] = {}
+        self.index = CandidateIndex()
         self.dashboard_message_id: Optional[int] = None
+        self.dashboard_page_message_ids: List[int] = []    # ダッシュボード 2 ページ目以降のメッセージ
+        self.schedule_channel_id: Optional[int] = None     # 予定表メッセージのあるチャンネル
         self.memo_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.storage_mode = storage_mode
+        # json モードでは None（従来どおり全量書き込み）
+        self.store: Optional[JournalStore | SqliteStore] = None
+        if storage_mode == "journal":
+            self.store = JournalStore(file_path)
+        elif storage_mode == "sqlite":
+            self.store = SqliteStore(SQLITE_DATA_FILE)
         self.load_data()
 
-    async def save_data(self) -> None:
-        async with self.lock:
-            data: Dict[str, Any] = {
+    # interview_records を丸ごと差し替えたことを差分保存側が検知できるよう世代番号を持つ
+    # list[dict] を代入しても列指向ストアへ変換して保持する
+    @property
+    def interview_records(self) -> InterviewRecordStore:
+        return self._interview_records
+
+    @interview_records.setter
+    def interview_records(self, value: Iterable[Dict[str, Any]]) -> None:
+        if not isinstance(value, InterviewRecordStore):
+            value = InterviewRecordStore(value)
+        self._interview_records = value
+        self._records_generation += 1
+        self._mutations += 1
+        self.stats_index.rebuild(value)
+
+    def add_interview_record(self, rec: Dict[str, Any]) -> None:
+        """面接記録を 1 件追加（集計インデックスも同時に更新）"""
+        self._interview_records.append(rec)
+        self._mutations += 1
+        self.stats_index.add(rec)
+
+    def remove_interview_rows(self, rows: Iterable[int]) -> int:
+        """InterviewRecordStore.rows() で得た行番号の記録を削除し、削除件数を返す"""
+        rows = list(rows)
+        if not rows:
+            return 0
+        for row in rows:
+            self.stats_index.remove(self._interview_records[row])
+        self._interview_records = self._interview_records.without_rows(rows)
+        self._records_generation += 1
+        self._mutations += 1
+        return len(rows)
+
+    def _snapshot_state(self, *, copy: bool = False) -> Dict[str, Any]:
+        """
+        保存用の状態 dict を返す。
+        copy=True のときはワーカースレッドへ渡せるよう、イベントループ側で変更され得る
+        コンテナだけを浅くコピーする（面接記録は列の配列コピーで済む）。
+        """
+        if not copy:
+            return {
                 'interview_records': self.interview_records,
                 'interviewer_stats_message_ids': self.interviewer_stats_message_ids,
                 'monthly_stats_message_ids': self.monthly_stats_message_ids,
                 'candidate_progress': self.candidate_progress,
                 'interview_channel_mapping': {str(k): v for k, v in self.interview_channel_mapping.items()},
                 'dashboard_message_id': self.dashboard_message_id,
+                'dashboard_page_message_ids': self.dashboard_page_message_ids,
+                'schedule_channel_id': self.schedule_channel_id,
                 'memo_history': self.memo_history
             }
+        return {
+            'interview_records': self.interview_records.copy(),
+            'interviewer_stats_message_ids': dict(self.interviewer_stats_message_ids),
+            'monthly_stats_message_ids': dict(self.monthly_stats_message_ids),
+            'candidate_progress': {k: dict(v) for k, v in self.candidate_progress.items()},
+            'interview_channel_mapping': {str(k): v for k, v in self.interview_channel_mapping.items()},
+            'dashboard_message_id': self.dashboard_message_id,
+            'dashboard_page_message_ids': list(self.dashboard_page_message_ids),
+            'schedule_channel_id': self.schedule_channel_id,
+            'memo_history': {k: [dict(r) for r in v] for k, v in self.memo_history.items()},
+        }
+
+    async def save_data(self) -> None:
+        """
+        変更を保存する。write-behind 有効時はダーティ印を付けるだけで、
+        実際の書き込みはフラッシャーが flush_interval ごとに 1 回だけ行う。
+        """
+        self.save_requests += 1
+        self._mutations += 1        # 直接書き換えた dict の変更もここで未保存扱いにする
+        if self.flush_interval <= 0:
+            await self._persist()
+            return
+        self._dirty = True
+        self._dirty_event.set()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def flush(self) -> None:
+        """保留中の変更を今すぐ書き出す（応答前に永続化が必要な箇所用）"""
+        self.save_requests += 1
+        await self._persist()
+
+    async def shutdown(self) -> None:
+        """フラッシャーを止めて未保存分を書き出す（Bot 終了時）"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        if self._dirty:
+            await self._persist()
+        logger.info(f"DataManager 終了: {self.persistence_stats()}")
+
+    @property
+    def coalesced_saves(self) -> int:
+        return max(self.save_requests - self.save_writes, 0)
+
+    def persistence_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.storage_mode,
+            "flush_interval": self.flush_interval,
+            "requests": self.save_requests,
+            "writes": self.save_writes,
+            "coalesced": self.coalesced_saves,
+            "dirty": self._dirty,
+            "pending_compaction": self.store.pending if self.store is not None else 0,
+        }
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._dirty_event.wait()
+            await asyncio.sleep(self.flush_interval)
+            self._dirty_event.clear()
+            if self._dirty:
+                # shutdown() でキャンセルされても書き込み途中で止めない
+                await asyncio.shield(self._persist())
+
+    async def _persist(self) -> None:
+        async with self.lock:
+            self._dirty = False
+            # ループ上ではスナップショットを取るだけ。差分計算・JSON 化・書き込みはワーカースレッドで
+            data: Dict[str, Any] = self._snapshot_state(copy=True)
+            records_gen, mutations = self._records_generation, self._mutations
             try:
-                with open(self.file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+                if self.store is not None:
+                    written = await asyncio.to_thread(self.store.append, data, records_gen)
+                    self.save_writes += 1
+                    self._persisted_mutations = mutations
+                    logger.info(f"データ保存に成功 ({self.storage_mode}: {written} 件)")
+                    return
+                await asyncio.to_thread(write_json_atomic, self.file_path, data)
+                self.save_writes += 1
                 logger.info("データ保存に成功")
             except Exception as e:
+                self._dirty = True
                 logger.error(f"データ保存に失敗: {e}")
 
+    async def compact(self) -> None:
+        """ジャーナル → スナップショットの畳み込み / SQLite の WAL チェックポイント"""
+        if self.store is None or self.store.pending == 0:
+            return
+        async with self.lock:
+            try:
+                pending = self.store.pending
+                await asyncio.to_thread(
+                    self.store.compact, self._snapshot_state(copy=True), self._records_generation
+                )
+                logger.info(f"[{self.storage_mode}] コンパクション完了 ({pending} 件を畳み込み)")
+            except Exception as e:
+                logger.error(f"[{self.storage_mode}] コンパクション失敗: {e}")
+
     def load_data(self) -> None:
-        if os.path.exists(self.file_path):
+        self._load_file()
+        if self.store is not None:
+            self.store.mark_persisted(self._snapshot_state(), self._records_generation)
+        # 補ったマッピングは基準スナップショットとの差分として次回の保存で書かれる
+        repaired = self.index.rebuild(self.candidate_progress, self.interview_channel_mapping)
+        if repaired:
+            logger.warning(f"チャンネル対応表の欠損を {repaired} 件補いました")
+        elif isinstance(self.store, SqliteStore) and self.store.migrated:
+            self._persisted_mutations = self._mutations
+
+    # ---- candidate_progress / interview_channel_mapping の変更（インデックスも更新） ----
+    def put_candidate(self, progress_key: str, cp: Dict[str, Any]) -> None:
+        old = self.candidate_progress.get(progress_key)
+        if old is not None:
+            self.index.discard(progress_key, old)
+        self.candidate_progress[progress_key] = cp
+        self.index.add(progress_key, cp)
+        self._mutations += 1
+
+    def pop_candidate(self, progress_key: str) -> Optional[Dict[str, Any]]:
+        cp = self.candidate_progress.pop(progress_key, None)
+        if cp is not None:
+            self.index.discard(progress_key, cp)
+            self._mutations += 1
+        return cp
+
+    def link_channel(self, channel_id: int, progress_key: str) -> None:
+        self.interview_channel_mapping[channel_id] = progress_key
+        self.index.link(channel_id, progress_key)
+        self._mutations += 1
+
+    def unlink_channel(self, channel_id: int) -> Optional[str]:
+        self.index.unlink(channel_id)
+        self._mutations += 1
+        return self.interview_channel_mapping.pop(channel_id, None)
+
+    def channels_for(self, progress_key: str) -> set[int]:
+        """候補者のテキストチャンネル / VC の ID 一覧"""
+        return set(self.index.channels_of.get(progress_key, ()))
+
+    def set_candidate_guild(self, progress_key: str, guild_id: int) -> None:
+        cp = self.candidate_progress[progress_key]
+        cp["source_guild_id"] = guild_id
+        self.index.guild_of[cp.get("candidate_id")] = guild_id
+
+    # ---- 索引付きの参照（SQLite が最新ならその索引から、そうでなければメモリ上の索引から） ----
+    def _sqlite_current(self) -> Optional[SqliteStore]:
+        """未保存の変更が無い SQLite ストア（write-behind 待ちの変更があれば None）"""
+        if isinstance(self.store, SqliteStore) and self._persisted_mutations == self._mutations:
+            return self.store
+        return None
+
+    def records_for_interviewer_month(self, interviewer_id: int, year_month: str) -> List[Dict[str, Any]]:
+        sqlite_store = self._sqlite_current()
+        if sqlite_store is not None:
+            return sqlite_store.records_for_interviewer_month(interviewer_id, year_month)
+        records = self.interview_records
+        return [records[row] for row in records.rows(year_month=year_month, interviewer_id=interviewer_id)]
+
+    def records_for_interviewee(self, interviewee_id: int) -> List[Dict[str, Any]]:
+        sqlite_store = self._sqlite_current()
+        if sqlite_store is not None:
+            return sqlite_store.records_for_interviewee(interviewee_id)
+        records = self.interview_records
+        return [records[row] for row in records.rows(interviewee_id=interviewee_id)]
+
+    def latest_interviewer(self, interviewee_id: int) -> Optional[int]:
+        """受験者の最新の面接記録の interviewer_id"""
+        sqlite_store = self._sqlite_current()
+        if sqlite_store is not None:
+            recs = sqlite_store.records_for_interviewee(interviewee_id)
+            return recs[-1].get("interviewer_id") if recs else None
+        return self.interview_records.latest_interviewer(interviewee_id)
+
+    def progress_key_for_channel(self, channel_id: int) -> Optional[str]:
+        sqlite_store = self._sqlite_current()
+        if sqlite_store is not None:
+            return sqlite_store.progress_key_for_channel(channel_id)
+        # 対応表へ直接書かれた分も拾えるよう、索引に無ければ対応表も見る（どちらも O(1)）
+        progress_key = self.index.by_channel.get(channel_id) or self.interview_channel_mapping.get(channel_id)
+        return progress_key if progress_key in self.candidate_progress else None
+
+    def progress_keys_for_candidate(self, candidate_id: int) -> set[str]:
+        return set(self.index.by_candidate.get(candidate_id, ()))
+
+    def _load_file(self) -> None:
+        sqlite_store = self.store if isinstance(self.store, SqliteStore) else None
+        if sqlite_store is not None and sqlite_store.migrated:
+            try:
+                self._apply_loaded(sqlite_store.load())
+                logger.info("データロードに成功 (SQLite)")
+            except Exception as e:
+                logger.error(f"データロードに失敗 (SQLite): {e}", exc_info=True)
+            return
+
+        journal = self.store if isinstance(self.store, JournalStore) else None
+        if sqlite_store is not None:
+            # journal モードから移行する場合は未畳み込みのジャーナルも取り込む
+            legacy = JournalStore(self.file_path)
+            if os.path.isfile(legacy.journal_path):
+                journal = legacy
+
+        journal_exists = journal is not None and os.path.isfile(journal.journal_path)
+        if os.path.exists(self.file_path) or journal_exists:
             try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 両対応：リスト形式 or 辞書形式
+                data: Any = {}
+                if os.path.exists(self.file_path):
+                    with open(self.file_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                if journal is not None:
                     if isinstance(data, list):
-                        self.interview_records = data
-                        self.interviewer_stats_message_ids = {}
-                        self.monthly_stats_message_ids = {}
-                        self.candidate_progress = {}
-                        self.interview_channel_mapping = {}
-                        self.dashboard_message_id = None
-                        self.memo_history = {}
-                    elif isinstance(data, dict):
-                        self.interview_records = data.get('interview_records', [])
-                        self.interviewer_stats_message_ids = data.get('interviewer_stats_message_ids', {})
-                        self.monthly_stats_message_ids = data.get('monthly_stats_message_ids', {})
-                        self.candidate_progress = data.get('candidate_progress', {})
-                        imap = data.get('interview_channel_mapping', {})
-                        self.interview_channel_mapping = {int(k): v for k, v in imap.items()}
-                        self.dashboard_message_id = data.get('dashboard_message_id')
-                        self.memo_history = data.get('memo_history', {})
-                    else:
-                        self.interview_records = []
-                        self.interviewer_stats_message_ids = {}
-                        self.monthly_stats_message_ids = {}
-                        self.candidate_progress = {}
-                        self.interview_channel_mapping = {}
-                        self.dashboard_message_id = None
-                        self.memo_history = {}
+                        data = {'interview_records': data}
+                    if isinstance(data, dict):
+                        data = journal.replay(data)
+                self._apply_loaded(data)
                 logger.info("データロードに成功")
             except Exception as e:
                 import traceback
                 logger.error(f"データロードに失敗: {e}\n{traceback.format_exc()}")
+                if sqlite_store is not None:
+                    return      # 読めなかった JSON で DB を初期化しない
         else:
             logger.warning(f"データファイルなし。空の状態から開始します。({self.file_path} が見つかりません。カレントディレクトリ: {os.getcwd()})")
 
+        # ---- SQLite 初回起動: JSON からワンショット移行 ----
+        if sqlite_store is not None:
+            try:
+                sqlite_store.import_state(self._snapshot_state(), self.file_path)
+                logger.info(
+                    f"SQLite へ移行完了: records={len(self.interview_records)} "
+                    f"progress={len(self.candidate_progress)} memo={len(self.memo_history)}"
+                )
+            except Exception as e:
+                logger.error(f"SQLite への移行に失敗: {e}", exc_info=True)
+
+    def _apply_loaded(self, data: Any) -> None:
+        # 両対応：リスト形式 or 辞書形式
+        if isinstance(data, list):
+            self.interview_records = data
+            self.interviewer_stats_message_ids = {}
+            self.monthly_stats_message_ids = {}
+            self.candidate_progress = {}
+            self.interview_channel_mapping = {}
+            self.dashboard_message_id = None
+            self.dashboard_page_message_ids = []
+            self.schedule_channel_id = None
+            self.memo_history = {}
+        elif isinstance(data, dict):
+            self.interview_records = data.get('interview_records', [])
+            self.interviewer_stats_message_ids = data.get('interviewer_stats_message_ids', {})
+            self.monthly_stats_message_ids = data.get('monthly_stats_message_ids', {})
+            self.candidate_progress = data.get('candidate_progress', {})
+            imap = data.get('interview_channel_mapping', {})
+            self.interview_channel_mapping = {int(k): v for k, v in imap.items()}
+            self.dashboard_message_id = data.get('dashboard_message_id')
+            self.dashboard_page_message_ids = data.get('dashboard_page_message_ids', [])
+            self.schedule_channel_id = data.get('schedule_channel_id')
+            self.memo_history = data.get('memo_history', {})
+        else:
+            self.interview_records = []
+            self.interviewer_stats_message_ids = {}
+            self.monthly_stats_message_ids = {}
+            self.candidate_progress = {}
+            self.interview_channel_mapping = {}
+            self.dashboard_message_id = None
+            self.dashboard_page_message_ids = []
+            self.schedule_channel_id = None
+            self.memo_history = {}
+
 data_manager = DataManager(DATA_FILE_PATH)
 
 
@@ -1110,6 +3876,73 @@ async def notify_interviewer_of_candidate_message(
         logger.error(f"DM 通知失敗: {e}")
 
 
+class RoleRegistry:
+    """
+    サブサーバーのロールを名前で引く処理のキャッシュ。(サーバー, ロール名) → ロール ID。
+      ・名前での走査は最初の 1 回だけ。以降は guild.get_role の dict 参照
+      ・見つからない組も覚えておき、警告はその組につき 1 回だけ
+      ・ロールの作成 / 更新 / 削除イベントで該当する組だけ捨てる
+      ・見つかった ID だけ ROLE_CACHE_FILE に保存（見つからない組は再起動で引き直す）
+    """
+
+    def __init__(self, file_path: Optional[str] = None) -> None:
+        self._ids: Dict[tuple[int, str], Optional[int]] = {}
+        self._writer = BackgroundJsonWriter(file_path, "ロールキャッシュ") if file_path else None
+        self.lookups = 0
+        self.scans = 0
+        if file_path:
+            self._load(file_path)
+
+    def resolve(self, guild: discord.Guild, name: str) -> Optional[discord.Role]:
+        self.lookups += 1
+        key = (guild.id, name)
+        if key in self._ids:
+            role_id = self._ids[key]
+            if role_id is None:
+                return None
+            role = guild.get_role(role_id)
+            if role is not None and role.name == name:
+                return role
+            # 取りこぼしたイベントなどで古くなっていたら引き直す
+        self.scans += 1
+        role = discord.utils.get(guild.roles, name=name)
+        self._ids[key] = role.id if role else None
+        if role is None:
+            logger.warning(f"サーバー {guild.id} に名前 '{name}' のロールが見つかりません")
+        self._save()
+        return role
+
+    def invalidate(self, role: discord.Role, *names: str) -> None:
+        """role（の旧名・新名）に関わる組を捨てる"""
+        names = {role.name, *names}
+        stale = [
+            key for key, role_id in self._ids.items()
+            if key[0] == role.guild.id and (role_id == role.id or key[1] in names)
+        ]
+        for key in stale:
+            del self._ids[key]
+        if stale:
+            self._save()
+
+    def _save(self) -> None:
+        if self._writer:
+            self._writer.schedule([[gid, name, rid] for (gid, name), rid in self._ids.items() if rid])
+
+    def _load(self, file_path: str) -> None:
+        if not os.path.exists(file_path):
+            return
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                for gid, name, rid in json.load(f):
+                    self._ids[(int(gid), name)] = int(rid)
+            logger.info(f"ロールキャッシュロード成功 ({len(self._ids)} 件)")
+        except Exception as e:
+            logger.error(f"ロールキャッシュロード失敗: {e}")
+
+
+role_registry = RoleRegistry(ROLE_CACHE_FILE)
+
+
 def get_interviewer_role(guild: discord.Guild) -> Optional[discord.Role]:
     if guild.id == MAIN_GUILD_ID:
         role: Optional[discord.Role] = guild.get_role(INTERVIEWER_ROLE_ID)
@@ -1117,10 +3950,260 @@ def get_interviewer_role(guild: discord.Guild) -> Optional[discord.Role]:
             logger.warning(f"ID {INTERVIEWER_ROLE_ID} の面接担当者ロールが見つかりません")
         return role
     else:
-        role = discord.utils.get(guild.roles, name="面接手伝い")
-        if role is None:
-            logger.warning(f"名前 '面接手伝い' のロールが見つかりません")
-        return role
+        return role_registry.resolve(guild, "面接手伝い")
+
+
+DASHBOARD_STATUS_MAPPING: Dict[str, Optional[str]] = {
+    "プロフィール未記入": "プロフィール未記入",
+    "記入済み": "記入済み",
+    "担当者待ち": "担当者待ち",
+    "日程調整済み": "日程調整済み",
+    "面接済み": "面接済み",
+    "不合格": None,
+}
+DASHBOARD_EMBED_CONFIG: Dict[str, Dict[str, Any]] = {
+    "プロフィール未記入": {"title": "⚠️ プロフィール未記入", "color": 0x808080},
+    "記入済み": {"title": "要連絡！", "color": 0x00FF00},
+    "担当者待ち": {"title": "日程調整してね！", "color": 0xFF0000},
+    "日程調整済み": {"title": "📅 日程調整済み", "color": 0x0000FF},
+    "面接済み": {"title": "✅ 面接済み", "color": 0x808080},
+}
+
+
+def _filled_urgency(cp: Dict[str, Any], now: datetime) -> str:
+    """記入済みからの経過時間に応じた行頭マーク（8h / 16h で変わる）"""
+    if cp.get("status") != "記入済み" or not cp.get("profile_filled_time"):
+        return ""
+    try:
+        filled_time = datetime.fromisoformat(cp.get("profile_filled_time"))
+        hours_passed = (now - filled_time).total_seconds() / 3600
+    except Exception as e:
+        logger.error(f"記入済み時間解析失敗: {e}")
+        return ""
+    if hours_passed >= 16:
+        return ":bangbang: "
+    if hours_passed >= 8:
+        return ":exclamation: "
+    return ""
+
+
+@dataclass(order=True)
+class DashboardRow:
+    """ダッシュボードの 1 行。sort_key（＋ progress_key）の順に並び、text は生成時に確定する"""
+    sort_key: tuple
+    progress_key: str
+    status: str = field(compare=False)
+    candidate_name: str = field(compare=False)
+    links: str = field(compare=False)
+    interviewer_name: str = field(default="", compare=False)
+    interview_time: Optional[datetime] = field(default=None, compare=False)
+    prefix: str = field(default="", compare=False)
+    text: str = field(default="", compare=False)
+
+    def render(self) -> str:
+        if self.status in ("担当者待ち", "日程調整済み", "面接済み"):
+            time_str = self.interview_time.strftime('%m/%d %H:%M') if self.interview_time else ""
+            return f"**{self.interviewer_name}** | {time_str} | {self.candidate_name} {self.links}"
+        if self.status == "記入済み":
+            return f"{self.prefix}**{self.candidate_name}** {self.links}"
+        return f"{self.candidate_name} {self.links}"
+
+
+def _dashboard_sort_key(
+    status: str, candidate_name: str, interviewer_name: str,
+    interview_time: Optional[datetime], prefix: str,
+) -> tuple:
+    if status == "日程調整済み":
+        # 面接官ごとに面接日時順（年をまたいでも正しく並ぶ）。日時未設定は先頭
+        return (interviewer_name, interview_time.timestamp() if interview_time else float("-inf"), candidate_name)
+    if status in ("担当者待ち", "面接済み"):
+        return (interviewer_name, candidate_name)
+    if status == "記入済み":
+        return (prefix, candidate_name)
+    return (candidate_name,)
+
+
+def _build_dashboard_row(
+    bot: discord.Client, progress_key: str, cp: Dict[str, Any], now: datetime
+) -> Optional[DashboardRow]:
+    """候補者 1 名分の行。チャンネル / ユーザーが引けなければ None"""
+    orig_status = cp.get("status", "")
+    channel_obj: Optional[discord.TextChannel] = bot.get_channel(cp.get("channel_id"))
+    if channel_obj is None:
+        logger.warning(f"候補者 {progress_key} のチャンネル (ID: {cp.get('channel_id')}) が見つかりません")
+        return None
+    channel_link: str = channel_obj.mention
+    if orig_status != "日程調整済み" and cp.get("voice_channel_id"):
+        vc_obj: Optional[discord.VoiceChannel] = bot.get_channel(cp.get("voice_channel_id"))
+        if vc_obj:
+            channel_link += f" (VC: {vc_obj.mention})"
+    candidate_id = cp.get("candidate_id")
+    candidate: Optional[discord.User] = bot.get_user(candidate_id)
+    if not candidate:
+        logger.warning(f"候補者 {candidate_id} が見つかりません")
+        return None
+
+    interviewer_name = ""
+    interview_time: Optional[datetime] = None
+    if orig_status in ("担当者待ち", "日程調整済み", "面接済み"):
+        interviewer = bot.get_user(cp.get("interviewer_id")) if cp.get("interviewer_id") else None
+        interviewer_name = interviewer.display_name if interviewer else "未設定"
+        if cp.get("interview_time"):
+            try:
+                interview_time = datetime.fromisoformat(cp.get("interview_time"))
+            except Exception as e:
+                logger.error(f"面接時間解析失敗: {e}")
+            if interview_time is not None and interview_time.tzinfo is None:
+                interview_time = interview_time.replace(tzinfo=JST)
+    prefix = _filled_urgency(cp, now)
+    row = DashboardRow(
+        sort_key=_dashboard_sort_key(orig_status, candidate.display_name, interviewer_name, interview_time, prefix),
+        progress_key=progress_key,
+        status=orig_status,
+        candidate_name=candidate.display_name,
+        links=channel_link,
+        interviewer_name=interviewer_name,
+        interview_time=interview_time,
+        prefix=prefix,
+    )
+    row.text = row.render()
+    return row
+
+
+# Discord の上限（説明文 4096 / 1 メッセージの埋め込み合計 6000 文字・10 個）に余裕を持たせた値
+DASHBOARD_DESCRIPTION_LIMIT = 4000
+DASHBOARD_MESSAGE_CHAR_LIMIT = 5800
+DASHBOARD_EMBEDS_PER_MESSAGE = 10
+DASHBOARD_FOOTER_LEN = len("最終更新: 0000-00-00 00:00:00")
+
+
+@dataclass
+class DashboardPage:
+    """ダッシュボード 1 メッセージ分。sections は (セクションキー, タイトル, 説明文)"""
+    sections: List[tuple[str, str, str]]
+    digest: str = ""
+
+    def embeds(self, now: datetime) -> List[discord.Embed]:
+        embeds = []
+        for key, title, description in self.sections:
+            embed = discord.Embed(
+                title=title,
+                description=description,
+                color=DASHBOARD_EMBED_CONFIG[key]["color"],
+                timestamp=now
+            )
+            embed.set_footer(text="最終更新: " + now.strftime("%Y-%m-%d %H:%M:%S"))
+            embeds.append(embed)
+        return embeds
+
+
+def _chunk_rows(texts: List[str], limit: int = DASHBOARD_DESCRIPTION_LIMIT) -> List[str]:
+    """行を改行で連結し、limit 文字以内の塊に分ける（行の途中では切らない）"""
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for text in texts:
+        text = text[:limit]
+        if current and size + 1 + len(text) > limit:
+            chunks.append("\n".join(current))
+            current, size = [], 0
+        size += len(text) + (1 if current else 0)
+        current.append(text)
+    if current:
+        chunks.append("\n".join(current))
+    return chunks or ["なし"]
+
+
+class DashboardModel:
+    """
+    ダッシュボードの表示モデル。
+      ・候補者ごとに「表示に効く項目」の指紋を覚え、変わった候補者の行だけ作り直す
+      ・行が動いたセクションだけ説明文を組み直し、上限を超えるセクションは複数の埋め込みに分割
+      ・埋め込みを複数メッセージ（ページ）に詰め、内容のハッシュが前回送信分と違うページだけ編集する
+    """
+
+    def __init__(self) -> None:
+        self._fingerprints: Dict[str, tuple] = {}
+        self._rows: Dict[str, tuple[str, DashboardRow]] = {}      # progress_key → (セクション, 行)
+        self._sections: Dict[str, List[DashboardRow]] = {k: [] for k in DASHBOARD_EMBED_CONFIG}  # 常に整列済み
+        self._dirty: set[str] = set(DASHBOARD_EMBED_CONFIG)
+        self._chunks: Dict[str, List[str]] = {}
+        self.sent_hashes: List[Optional[str]] = []                 # ページごとの送信済みハッシュ
+        self.stats = {
+            "rows_rebuilt": 0, "sections_rendered": 0, "edits": 0, "edits_skipped": 0,
+            "pages_created": 0, "pages_deleted": 0,
+        }
+
+    @staticmethod
+    def _fingerprint(cp: Dict[str, Any], now: datetime) -> tuple:
+        return (
+            cp.get("status"), cp.get("channel_id"), cp.get("voice_channel_id"), cp.get("candidate_id"),
+            cp.get("interviewer_id"), cp.get("interview_time"), _filled_urgency(cp, now),
+        )
+
+    def _drop(self, progress_key: str) -> None:
+        self._fingerprints.pop(progress_key, None)
+        row = self._rows.pop(progress_key, None)
+        if row is not None:
+            section, old = row
+            rows = self._sections[section]
+            i = bisect_left(rows, old)
+            if i < len(rows) and rows[i] == old:
+                del rows[i]
+            self._dirty.add(section)
+
+    def sync(self, bot: discord.Client, candidate_progress: Dict[str, Dict[str, Any]], now: datetime) -> None:
+        """candidate_progress の変更（追加・更新・削除）を行に反映する"""
+        for progress_key in self._fingerprints.keys() - candidate_progress.keys():
+            self._drop(progress_key)
+        for progress_key, cp in candidate_progress.items():
+            fp = self._fingerprint(cp, now)
+            if self._fingerprints.get(progress_key) == fp:
+                continue
+            self._drop(progress_key)
+            section = DASHBOARD_STATUS_MAPPING.get(cp.get("status", ""))
+            if section is None:
+                self._fingerprints[progress_key] = fp
+                continue
+            row = _build_dashboard_row(bot, progress_key, cp, now)
+            self.stats["rows_rebuilt"] += 1
+            if row is None:
+                continue    # 指紋を残さず次回また引き直す
+            self._fingerprints[progress_key] = fp
+            self._rows[progress_key] = (section, row)
+            insort(self._sections[section], row)
+            self._dirty.add(section)
+
+    def render(self) -> List[DashboardPage]:
+        """ページ一覧を返す。説明文を組み直すのは変化したセクションだけ"""
+        for key in self._dirty:
+            self._chunks[key] = _chunk_rows([row.text for row in self._sections[key]])
+            self.stats["sections_rendered"] += 1
+        self._dirty.clear()
+
+        pages: List[DashboardPage] = [DashboardPage([])]
+        used = 0
+        for key, config in DASHBOARD_EMBED_CONFIG.items():
+            chunks = self._chunks[key]
+            for i, description in enumerate(chunks, start=1):
+                title = config["title"] if len(chunks) == 1 else f"{config['title']} ({i}/{len(chunks)})"
+                size = len(title) + len(description) + DASHBOARD_FOOTER_LEN
+                page = pages[-1]
+                if page.sections and (
+                    used + size > DASHBOARD_MESSAGE_CHAR_LIMIT
+                    or len(page.sections) >= DASHBOARD_EMBEDS_PER_MESSAGE
+                ):
+                    pages.append(DashboardPage([]))
+                    used = 0
+                pages[-1].sections.append((key, title, description))
+                used += size
+        for page in pages:
+            payload = "\x00".join(f"{title}\x01{description}" for _, title, description in page.sections)
+            page.digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return pages
+
+
+dashboard_model = DashboardModel()
 
 
 async def update_dashboard(bot: discord.Client) -> None:
@@ -1130,114 +4213,45 @@ async def update_dashboard(bot: discord.Client) -> None:
         logger.error(f"ダッシュボードチャンネル (ID: {DASHBOARD_CHANNEL_ID}) が見つかりません")
         return
     now = datetime.now(JST)
-    status_mapping = {
-        "プロフィール未記入": "プロフィール未記入",
-        "記入済み": "記入済み",
-        "担当者待ち": "担当者待ち",
-        "日程調整済み": "日程調整済み",
-        "面接済み": "面接済み",
-        "不合格": None,
-    }
-    embed_config = {
-        "プロフィール未記入": {"title": "⚠️ プロフィール未記入", "color": 0x808080},
-        "記入済み": {"title": "要連絡！", "color": 0x00FF00},
-        "担当者待ち": {"title": "日程調整してね！", "color": 0xFF0000},
-        "日程調整済み": {"title": "📅 日程調整済み", "color": 0x0000FF},
-        "面接済み": {"title": "✅ 面接済み", "color": 0x808080},
-    }
-    dashboard_sections = {key: [] for key in embed_config.keys()}
-
-    for progress_key, cp in data_manager.candidate_progress.items():
-        orig_status = cp.get("status", "")
-        display_key = status_mapping.get(orig_status)
-        if display_key is None:
-            continue
-        channel_obj: Optional[discord.TextChannel] = bot.get_channel(cp.get("channel_id"))
-        if channel_obj is None:
-            logger.warning(f"候補者 {progress_key} のチャンネル (ID: {cp.get('channel_id')}) が見つかりません")
+    dashboard_model.sync(bot, data_manager.candidate_progress, now)
+    pages = dashboard_model.render()
+
+    old_ids: List[Optional[int]] = [data_manager.dashboard_message_id, *data_manager.dashboard_page_message_ids]
+    new_ids: List[int] = []
+    sent = dashboard_model.sent_hashes
+    for i, page in enumerate(pages):
+        message_id = old_ids[i] if i < len(old_ids) else None
+        if message_id and i < len(sent) and sent[i] == page.digest:
+            dashboard_model.stats["edits_skipped"] += 1
+            new_ids.append(message_id)
             continue
-        channel_link: str = channel_obj.mention
-        if orig_status != "日程調整済み" and cp.get("voice_channel_id"):
-            vc_obj: Optional[discord.VoiceChannel] = bot.get_channel(cp.get("voice_channel_id"))
-            if vc_obj:
-                channel_link += f" (VC: {vc_obj.mention})"
-        candidate_id = cp.get("candidate_id")
-        candidate: Optional[discord.User] = bot.get_user(candidate_id)
-        if not candidate:
-            logger.warning(f"候補者 {candidate_id} が見つかりません")
-            continue
-
-        entry = ""
-        if orig_status in ["担当者待ち", "日程調整済み", "面接済み"]:
-            interviewer = bot.get_user(cp.get("interviewer_id")) if cp.get("interviewer_id") else None
-            interviewer_name = interviewer.display_name if interviewer else "未設定"
-            interview_time_str = ""
-            if cp.get("interview_time"):
-                try:
-                    it = datetime.fromisoformat(cp.get("interview_time"))
-                    interview_time_str = it.strftime('%m/%d %H:%M')
-                except Exception as e:
-                    logger.error(f"面接時間解析失敗: {e}")
-            entry = f"**{interviewer_name}** | {interview_time_str} | {candidate.display_name} {channel_link}"
-        elif orig_status == "記入済み":
-            prefix = ""
-            if cp.get("profile_filled_time"):
-                try:
-                    filled_time = datetime.fromisoformat(cp.get("profile_filled_time"))
-                    hours_passed = (now - filled_time).total_seconds() / 3600
-                    if hours_passed >= 16:
-                        prefix = ":bangbang: "
-                    elif hours_passed >= 8:
-                        prefix = ":exclamation: "
-                except Exception as e:
-                    logger.error(f"記入済み時間解析失敗: {e}")
-            entry = f"{prefix}**{candidate.display_name}** {channel_link}"
-        else:
-            entry = f"{candidate.display_name} {channel_link}"
-        dashboard_sections[display_key].append(entry)
-
-    dashboard_sections["記入済み"].sort()
-    for key in ["担当者待ち", "面接済み"]:
-        dashboard_sections[key].sort(key=lambda entry: entry.split(" | ")[0])
-    if dashboard_sections["日程調整済み"]:
-        def sort_key(entry: str):
-            parts = entry.split(" | ")
-            interviewer_name = parts[0].replace("**", "").strip() if len(parts) > 0 else ""
-            interview_time_str = parts[1].strip() if len(parts) > 1 else ""
+        embeds = page.embeds(now)
+        if message_id:
             try:
-                dt = datetime.strptime(interview_time_str, "%m/%d %H:%M")
-            except Exception:
-                dt = datetime.min
-            return (interviewer_name, dt)
-
-        dashboard_sections["日程調整済み"].sort(key=sort_key)
-    dashboard_sections["プロフィール未記入"].sort()
-
-    embeds = []
-    for key, config in embed_config.items():
-        entries = dashboard_sections.get(key, [])
-        description = "\n".join(entries) if entries else "なし"
-        embed = discord.Embed(
-            title=config["title"],
-            description=description,
-            color=config["color"],
-            timestamp=datetime.now(JST)
-        )
-        embed.set_footer(text="最終更新: " + now.strftime("%Y-%m-%d %H:%M:%S"))
-        embeds.append(embed)
-
-    if data_manager.dashboard_message_id:
+                await dashboard_channel.get_partial_message(message_id).edit(content="", embeds=embeds)
+                dashboard_model.stats["edits"] += 1
+            except discord.NotFound:
+                message_id = None
+        if not message_id:
+            message_id = (await dashboard_channel.send(embeds=embeds)).id
+            dashboard_model.stats["pages_created"] += 1
+        new_ids.append(message_id)
+    # 減ったページは削除
+    for message_id in old_ids[len(pages):]:
+        if not message_id:
+            continue
         try:
-            msg = await dashboard_channel.fetch_message(data_manager.dashboard_message_id)
-            await msg.edit(content="", embeds=embeds)
+            await dashboard_channel.get_partial_message(message_id).delete()
         except discord.NotFound:
-            msg = await dashboard_channel.send(embeds=embeds)
-            data_manager.dashboard_message_id = msg.id
-    else:
-        msg = await dashboard_channel.send(embeds=embeds)
-        data_manager.dashboard_message_id = msg.id
-    await data_manager.save_data()
-    logger.info("ダッシュボード更新完了")
+            pass
+        dashboard_model.stats["pages_deleted"] += 1
+    dashboard_model.sent_hashes = [page.digest for page in pages]
+
+    if new_ids != old_ids:
+        data_manager.dashboard_message_id = new_ids[0]
+        data_manager.dashboard_page_message_ids = new_ids[1:]
+        await data_manager.save_data()
+    logger.info(f"ダッシュボード更新完了 ({len(pages)} ページ)")
 
 # ------------------------------------------------
 # CandidateContext および補助関数
@@ -1261,8 +4275,8 @@ async def get_candidate_context(
     ────────────────────────────────────────────────────────────────
     ・面接関連ボタンで呼ばれ、候補者／担当者／進捗をまとめて取得するヘルパー
     ・interviewer_id が未設定なら「ボタンを押した面接官」を自動で担当者に登録
-    ・interview_channel_mapping に欠損があっても、candidate_progress を走査して
-      自己修復（チャンネル ID → progress_key の再登録）を行う
+    ・チャンネル → progress_key、候補者 → 所属サーバーは data_manager.index から O(1) で引く
+      （対応表の欠損はロード時に補修済み。REST は在籍が確認できないときだけ）
     ────────────────────────────────────────────────────────────────
     """
 
@@ -1275,25 +4289,9 @@ async def get_candidate_context(
     bot: discord.Client = interaction.client
 
     # ─────────────────────────────────────────────
-    # 1) progress_key を取得  (int → str → 自己修復)
+    # 1) progress_key を取得（テキスト / VC どちらのチャンネルでも引ける）
     # ─────────────────────────────────────────────
-    progress_key = (
-        progress_key_override
-        or data_manager.interview_channel_mapping.get(interaction.channel.id)          # int キー
-        or data_manager.interview_channel_mapping.get(str(interaction.channel.id))     # 旧 str キー
-    )
-
-    # ----- 欠損時: candidate_progress をスキャンして自己修復 -----
-    if progress_key is None:
-        for pk, rec in data_manager.candidate_progress.items():
-            if rec.get("channel_id") == interaction.channel.id or \
-               rec.get("voice_channel_id") == interaction.channel.id:
-                progress_key = pk
-                # int キーでマッピングを復元
-                data_manager.interview_channel_mapping[interaction.channel.id] = pk
-                await data_manager.save_data()
-                break
-
+    progress_key = progress_key_override or data_manager.progress_key_for_channel(interaction.channel.id)
     if progress_key is None:
         await send_error("進捗情報が見つかりません。")
         return None
@@ -1352,25 +4350,30 @@ async def get_candidate_context(
     # ─────────────────────────────────────────────
     guild_ids: list[int] = []
     source_gid: Optional[int] = cp.get("source_guild_id")
-    if source_gid:
-        guild_ids.append(source_gid)
-    if interaction.guild and interaction.guild.id not in guild_ids:
-        guild_ids.append(interaction.guild.id)
-    guild_ids.extend(g.id for g in bot.guilds if g.id not in guild_ids)
+    for gid in (data_manager.index.guild_of.get(cid), source_gid,
+                interaction.guild.id if interaction.guild else None):
+        if gid and gid not in guild_ids:
+            guild_ids.append(gid)
+    guild_ids.extend(g.id for g in member_index.candidate_guilds(bot, cid) if g.id not in guild_ids)
 
+    # まずキャッシュだけで探し、見つからないときに限り REST で取りに行く
     target_guild: Optional[discord.Guild] = None
     target_member: Optional[discord.Member] = None
-    for gid in guild_ids:
-        g = bot.get_guild(gid)
-        if g is None:
-            continue
-        member = g.get_member(cid) or await utils.safe_fetch_member(g, cid)
+    guilds = [g for g in map(bot.get_guild, guild_ids) if g is not None]
+    for g in guilds:
+        member = g.get_member(cid)
         if member:
             target_guild, target_member = g, member
-            if source_gid != gid:
-                cp["source_guild_id"] = gid
-                await data_manager.save_data()
             break
+    else:
+        for g in guilds:
+            member = await utils.safe_fetch_member(g, cid)
+            if member:
+                target_guild, target_member = g, member
+                break
+    if target_guild is not None and source_gid != target_guild.id:
+        data_manager.set_candidate_guild(progress_key, target_guild.id)
+        await data_manager.save_data()
 
     if target_member is None:
         await send_error("対象メンバーが見つかりません。")
@@ -1436,19 +4439,19 @@ async def process_immediate_action(
 
     try:
         # ① 面接記録追加 & 進捗削除 ----------------------------------------
-        data_manager.interview_records.append({
+        data_manager.add_interview_record({
             "date":          get_current_time_iso(),
             "interviewer_id": cp["interviewer_id"],
             "interviewee_id": candidate_id,
             "result":         action_type.upper()
         })
         update_candidate_status(cp, action_type.upper())
-        data_manager.candidate_progress.pop(progress_key, None)
-        await data_manager.save_data()
+        data_manager.pop_candidate(progress_key)
+        await data_manager.flush()
 
         # ② ダッシュボード & 統計更新 --------------------------------------
         request_dashboard_update(interaction.client)
-        asyncio.create_task(update_stats(interaction.client))
+        request_stats_update(interaction.client)
         await update_memo_result_simple(target_member, action_type.upper())
 
         # ③ **押されたサーバーだけでキック** -------------------------------
@@ -1511,18 +4514,18 @@ async def register_delayed_action(
 
     # --- 面接記録・進捗 ----------------------------------------------------
     update_candidate_status(cp, action_type.upper())
-    data_manager.candidate_progress.pop(context.progress_key, None)
-    data_manager.interview_records.append({
+    data_manager.pop_candidate(context.progress_key)
+    data_manager.add_interview_record({
         "date":          get_current_time_iso(),
         "interviewer_id": cp["interviewer_id"],
         "interviewee_id": candidate_id,
         "result":        f"{action_type.upper()} (遅延)"
     })
-    await data_manager.save_data()
+    await data_manager.flush()
 
     # --- UI 更新 ----------------------------------------------------------
     request_dashboard_update(interaction.client)
-    asyncio.create_task(update_stats(interaction.client))          # ★ 追加
+    request_stats_update(interaction.client)
 
     await interaction.followup.send(
         f"{target_member.mention} の **{action_type.upper()}** を "
@@ -1552,7 +4555,7 @@ async def process_pass_action(interaction: discord.Interaction,
     pass_role = (
         target_guild.get_role(PASS_ROLE_ID)
         if target_guild.id == MAIN_GUILD_ID
-        else discord.utils.get(target_guild.roles, name=OTHER_SERVER_PASS_ROLE_NAME)
+        else role_registry.resolve(target_guild, OTHER_SERVER_PASS_ROLE_NAME)
     )
     if pass_role is None:
         await interaction.followup.send("合格ロールが見つかりませんでした。", ephemeral=True)
@@ -1577,13 +4580,13 @@ async def process_pass_action(interaction: discord.Interaction,
     cp.pop("channel_id", None)
     cp.pop("voice_channel_id", None)
 
-    data_manager.interview_records.append({
+    data_manager.add_interview_record({
         "date":          get_current_time_iso(),
         "interviewer_id": cp["interviewer_id"],
         "interviewee_id": candidate_id,
         "result":        "PASS"
     })
-    await data_manager.save_data()
+    await data_manager.flush()
 
     # ---------- ④ 合格メモ送信 -------------------------------
     pass_channel = main_guild.get_channel(PASS_MEMO_CHANNEL_ID)
@@ -1602,7 +4605,7 @@ async def process_pass_action(interaction: discord.Interaction,
 
     # ---------- ⑤ ダッシュボード・統計更新 + DM ---------------
     request_dashboard_update(interaction.client)
-    asyncio.create_task(update_stats(interaction.client))
+    request_stats_update(interaction.client)
     try:
         await target_member.send(
             "🎉 合格おめでとうございます！\n"
@@ -1828,7 +4831,7 @@ class VCControlView(discord.ui.View):
 
         # --- 3) 進捗 & マッピング更新 --------------------------
         cp['voice_channel_id'] = vc.id
-        data_manager.interview_channel_mapping[vc.id] = progress_key
+        data_manager.link_channel(vc.id, progress_key)
         await data_manager.save_data()
 
         # --- 4) UI 反映 ---------------------------------------
@@ -2091,6 +5094,7 @@ class MonthlyCountCog(commands.Cog):
         self.monthly_counts_data: Dict[str, Dict[int, Dict[str, Any]]] = {}
         self.monthly_messages: Dict[str, Optional[discord.Message]] = {}
         self.current_year_month: Optional[str] = None
+        self._writer = BackgroundJsonWriter(DATA_FILE, "月次カウントデータ")
         self.load_counts_data()
 
         # ★ 追加: 月替わり監視ループ起動
@@ -2146,11 +5150,7 @@ class MonthlyCountCog(commands.Cog):
                     "name": info.get("name", "不明な担当者"),
                     "assigned": list(info.get("assigned", set()))
                 }
-        try:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(to_save, f, ensure_ascii=False, indent=4)
-        except Exception as e:
-            logger.error(f"月次カウントデータの保存中にエラー: {e}", exc_info=True)
+        self._writer.schedule(to_save)
 
     async def check_monthly_reset(self):
         now = datetime.now(JST)
@@ -2200,7 +5200,7 @@ class GuideCountCog(commands.Cog):
         if ym != self.current_ym:
             self.current_ym = ym
             self.monthly_counts.setdefault(ym, {})
-            await self._update_log_message()
+            self._log_refresher.request(self.bot)
 
     @_month_watch.before_loop
     async def _before_month_watch(self):
@@ -2214,6 +5214,11 @@ class GuideCountCog(commands.Cog):
         self.monthly_counts:   dict[str, dict[int, dict[str, Any]]] = {}  # ym -> {uid: {name,count}}
         self.monthly_messages: dict[str, int] = {}                         # ym -> message_id
         self.current_ym: str | None = None
+        self._writer = BackgroundJsonWriter(self.DATA_FILE, "GuideCountCog: データ")
+        self._log_refresher = CoalescingRefresher(
+            "guide_log", lambda _bot, _scope: self._update_log_message(),
+            delay=2.0, min_interval=5.0, max_staleness=15.0,
+        )
 
         self._load_data()                                 # counts / messages を復元
         self.bot.loop.create_task(self._send_initial())   # 起動直後にダッシュボード生成
@@ -2240,16 +5245,13 @@ class GuideCountCog(commands.Cog):
         self.monthly_counts.setdefault(self.current_ym, {})
 
     def _save_data(self) -> None:
+        # カウント dict はループ側で更新され続けるので、担当者単位までコピーして渡す
         out = {
-            "counts":   self.monthly_counts,
-            "messages": self.monthly_messages,
+            "counts":   {ym: {uid: dict(info) for uid, info in bucket.items()}
+                         for ym, bucket in self.monthly_counts.items()},
+            "messages": dict(self.monthly_messages),
         }
-        try:
-            with open(self.DATA_FILE, "w", encoding="utf-8") as fp:
-                json.dump(out, fp, ensure_ascii=False, indent=4)
-            logger.info("GuideCountCog: データ保存成功")
-        except Exception as e:
-            logger.error(f"GuideCountCog: データ保存失敗: {e}")
+        self._writer.schedule(out)
 
     # 旧コード互換（on_member_update / adjust_guide_count から呼ばれる）
     def save_counts_data(self) -> None:
@@ -2260,7 +5262,7 @@ class GuideCountCog(commands.Cog):
     # ─────────────────────────────────────────────
     async def _send_initial(self) -> None:
         await self.bot.wait_until_ready()
-        await self._update_log_message()
+        self._log_refresher.request(self.bot)
 
     # ─────────────────────────────────────────────
     #  ダッシュボード更新（Embed 送信 / 更新 / 重複掃除）
@@ -2374,7 +5376,7 @@ class GuideCountCog(commands.Cog):
             info["count"] += 1
 
             self._save_data()
-            await self._update_log_message()
+            self._log_refresher.request(self.bot)
 
     # ─────────────────────────────────────────────
     #  /adjust_guide_count  （手動調整コマンド）
@@ -2433,7 +5435,7 @@ class GuideCountCog(commands.Cog):
         entry["name"]  = guide.display_name
 
         self._save_data()
-        await self._update_log_message()
+        self._log_refresher.request(self.bot)
 
         await interaction.followup.send(
             f"{ym_key} の {guide.mention} の案内回数を **{mode} {count}** して **{new_count} 回** にしました。",
@@ -2441,6 +5443,59 @@ class GuideCountCog(commands.Cog):
         )
 
 
+# ------------------------------------------------
+# サーバー横断の在籍インデックス（user_id → 在籍サーバー ID）
+# ------------------------------------------------
+class MembershipIndex:
+    """
+    起動時のメンバー取得（guild_available / ready）と参加・退出イベントで更新する。
+    まだ取り込めていないサーバーは indexed に入らないので、呼び出し側で従来の確認に回す。
+    """
+
+    def __init__(self) -> None:
+        self._guilds_of: Dict[int, set[int]] = defaultdict(set)
+        self._members_of: Dict[int, set[int]] = {}
+        self.indexed: set[int] = set()
+
+    def index_guild(self, guild: discord.Guild) -> None:
+        self.drop_guild(guild.id)
+        members = {m.id for m in guild.members}
+        self._members_of[guild.id] = members
+        for uid in members:
+            self._guilds_of[uid].add(guild.id)
+        self.indexed.add(guild.id)
+
+    def drop_guild(self, guild_id: int) -> None:
+        self.indexed.discard(guild_id)
+        for uid in self._members_of.pop(guild_id, ()):
+            self.discard(uid, guild_id)
+
+    def add(self, user_id: int, guild_id: int) -> None:
+        self._guilds_of[user_id].add(guild_id)
+        self._members_of.setdefault(guild_id, set()).add(user_id)
+
+    def discard(self, user_id: int, guild_id: int) -> None:
+        guilds = self._guilds_of.get(user_id)
+        if guilds is not None:
+            guilds.discard(guild_id)
+            if not guilds:
+                del self._guilds_of[user_id]
+        members = self._members_of.get(guild_id)
+        if members is not None:
+            members.discard(user_id)
+
+    def guilds_of(self, user_id: int) -> frozenset[int]:
+        return frozenset(self._guilds_of.get(user_id, ()))
+
+    def candidate_guilds(self, bot: discord.Client, user_id: int) -> List[discord.Guild]:
+        """在籍していそうなサーバー（インデックス上の在籍先＋未取り込みのサーバー）"""
+        known = self.guilds_of(user_id)
+        return [g for g in bot.guilds if g.id in known or g.id not in self.indexed]
+
+
+member_index = MembershipIndex()
+
+
 # ------------------------------------------------
 # EventCog（参加・退出・チャンネル削除などのイベントハンドラ）
 #   ✅ 参加制御ポリシーを追加
@@ -2452,6 +5507,44 @@ class EventCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
 
+    # ---------- 在籍インデックスの取り込み ----------
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        for g in self.bot.guilds:
+            if g.id not in member_index.indexed:
+                member_index.index_guild(g)
+        logger.info(f"在籍インデックス: {len(member_index.indexed)} サーバー取り込み完了")
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        member_index.index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        member_index.index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_unavailable(self, guild: discord.Guild) -> None:
+        member_index.drop_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        member_index.drop_guild(guild.id)
+
+    # ---------- 名前で引くロールのキャッシュ破棄 ----------
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        role_registry.invalidate(role)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        if before.name != after.name:
+            role_registry.invalidate(after, before.name)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        role_registry.invalidate(role)
+
     # ---------- 内部ヘルパ ----------
 
     async def _should_kick_sub_join(
@@ -2477,9 +5570,12 @@ class EventCog(commands.Cog):
                     return False, ""
                 return True, "メインサーバー在籍者はサブサーバーに参加できません"
 
-        # 2️⃣ 他のサブサーバーに在籍していないか？
+        # 2️⃣ 他のサブサーバーに在籍していないか？（在籍インデックスの集合で判定）
+        if member_index.guilds_of(member.id) - {MAIN_GUILD_ID, sub_guild.id}:
+            return True, "既に別のサブサーバーに在籍しているため参加できません"
         for g in self.bot.guilds:
-            if g.id in (MAIN_GUILD_ID, sub_guild.id):
+            # インデックスへ未取り込みのサーバーだけ従来どおりキャッシュを確認
+            if g.id in member_index.indexed or g.id in (MAIN_GUILD_ID, sub_guild.id):
                 continue
             if g.get_member(member.id):
                 return True, "既に別のサブサーバーに在籍しているため参加できません"
@@ -2496,6 +5592,8 @@ class EventCog(commands.Cog):
         ・メイン/サブ参加ポリシーの強制
         ・新規候補者チャンネル作成  … 既存実装
         """
+        member_index.add(member.id, member.guild.id)
+
         # ------------- 0) BAN / INTERVAL チェック -------------
         if member.guild.id != MAIN_GUILD_ID:
             ban_record = ban_manager.check_ban(member.id)
@@ -2545,9 +5643,9 @@ class EventCog(commands.Cog):
             return
 
         progress_key = make_progress_key(guild.id, member.id)
-        data_manager.interview_channel_mapping[interview_channel.id] = progress_key
+        data_manager.link_channel(interview_channel.id, progress_key)
 
-        data_manager.candidate_progress[progress_key] = {
+        data_manager.put_candidate(progress_key, {
             'candidate_id': member.id,
             'status': "プロフィール未記入",
             'channel_id': interview_channel.id,
@@ -2565,7 +5663,7 @@ class EventCog(commands.Cog):
             'profile_message_id': None,
             'pending_inrate_confirmation': False,
             'pending_move_confirmation': False,
-        }
+        })
         await data_manager.save_data()
         request_dashboard_update(self.bot)
 
@@ -2583,23 +5681,64 @@ class EventCog(commands.Cog):
         else:
             logger.warning("プロフィールフォームチャンネルが見つかりません。")
 
+    # ---------- 予定表メッセージの編集 / 削除 ----------
+    # キャッシュ済みの予定表本文をその場で差し替える（raw なのでメッセージキャッシュ外でも届く）
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        if payload.message_id != SCHEDULE_MESSAGE_ID:
+            return
+        data = payload.data
+        if "content" in data or "embeds" in data:
+            text = _schedule_text_from(data.get("content"), data.get("embeds") or [])
+        else:
+            channel = self.bot.get_channel(payload.channel_id)
+            try:
+                msg = await channel.fetch_message(SCHEDULE_MESSAGE_ID)  # type: ignore[union-attr]
+            except Exception as e:
+                logger.error(f"[schedule] 編集後の予定表取得に失敗: {e}")
+                _schedule_cache["text"] = None      # 次回の参照で取り直す
+                return
+            text = _schedule_text_from(msg.content, msg.embeds)
+        _schedule_cache["text"] = text
+        if data_manager.schedule_channel_id != payload.channel_id:
+            data_manager.schedule_channel_id = payload.channel_id
+            await data_manager.save_data()
+        logger.info(f"[schedule] 予定表の編集を反映 ({len(text)} 文字)")
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        if payload.message_id != SCHEDULE_MESSAGE_ID:
+            return
+        _schedule_cache["text"] = ""
+        logger.warning("[schedule] 予定表メッセージが削除されました")
+
     # ---------- チャンネル削除 / 退出イベントなど（既存実装は変更なし） ----------
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
-        data_manager.interview_channel_mapping.pop(channel.id, None)
-        for progress_key, cp in list(data_manager.candidate_progress.items()):
-            if cp.get('channel_id') == channel.id:
-                data_manager.candidate_progress.pop(progress_key, None)
-                await data_manager.save_data()
-                request_dashboard_update(self.bot)
-                logger.info(f"候補者 {progress_key} の進捗削除 (チャンネル削除)")
+        progress_key = data_manager.index.by_channel.get(channel.id)
+        if progress_key is None and channel.id not in data_manager.interview_channel_mapping:
+            return
+        data_manager.unlink_channel(channel.id)
+        cp = data_manager.candidate_progress.get(progress_key) if progress_key else None
+        if cp is None:
+            await data_manager.save_data()
+            return
+        if cp.get('channel_id') == channel.id:
+            data_manager.pop_candidate(progress_key)
+            request_dashboard_update(self.bot)
+            logger.info(f"候補者 {progress_key} の進捗削除 (チャンネル削除)")
+        elif cp.get('voice_channel_id') == channel.id:
+            cp.pop('voice_channel_id', None)
+            request_dashboard_update(self.bot)
+        await data_manager.save_data()
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
         guild = member.guild
-        await delete_candidate_channels(self.bot, guild, member.id)
+        member_index.discard(member.id, guild.id)
+        await delete_candidate_channels(self.bot, guild, member.id, save=False)
         progress_key = make_progress_key(guild.id, member.id)
-        data_manager.candidate_progress.pop(progress_key, None)
+        data_manager.pop_candidate(progress_key)
         await data_manager.save_data()
         request_dashboard_update(self.bot)
         logger.info(f"メンバー {member.id} 退会処理完了")
@@ -2614,6 +5753,23 @@ class TaskCog(commands.Cog):
         self.bot = bot
         self.check_candidate_status.start()
         self.schedule_notifications.start()
+        if data_manager.store is not None:
+            self.compact_data_journal.start()
+        if AUTO_ASSIGN_MODE == "batch":
+            self.batch_assign_interviewers.start()
+
+    # 担当者未定の候補者を定期的にまとめて割り当て（取りこぼし・上限待ちの再試行も兼ねる）
+    @tasks.loop(minutes=ASSIGN_BATCH_MINUTES)
+    async def batch_assign_interviewers(self) -> None:
+        try:
+            await run_batch_assignment(self.bot)
+        except Exception:
+            logger.exception("[batchAssign] 定期一括割り当てで例外発生")
+
+    # journal / sqlite モード時: 定期的にコンパクション
+    @tasks.loop(minutes=JOURNAL_COMPACT_MINUTES)
+    async def compact_data_journal(self) -> None:
+        await data_manager.compact()
 
     @tasks.loop(minutes=5)
     async def check_candidate_status(self) -> None:
@@ -2669,7 +5825,7 @@ class TaskCog(commands.Cog):
                             await guild.kick(member_obj, reason="プロフィール未記入による自動キック")
                             logger.info(f"候補者 {candidate_id} を自動キックしました。")
                             await log_auto_kick(self.bot, member_obj, guild, "プロフィール未記入による自動キック") # type: ignore
-                            data_manager.candidate_progress.pop(progress_key, None)
+                            data_manager.pop_candidate(progress_key)
                             await data_manager.save_data()
                         except Exception as e:
                             logger.error(f"自動キック失敗: {e}")
@@ -2821,7 +5977,8 @@ async def execute_delayed_action(action: dict, bot: commands.Bot):
     apply_all = action.get("apply_all", False)
 
     if apply_all:
-        for guild in bot.guilds:
+        # 在籍インデックス上の在籍先（＋未取り込みのサーバー）だけに絞る
+        for guild in member_index.candidate_guilds(bot, candidate_id):
             try:
                 member = guild.get_member(candidate_id) or await guild.fetch_member(candidate_id)
                 if member:
@@ -2898,9 +6055,37 @@ class DelayedActionCog(commands.Cog):
 # ------------------------------------------------
 # MessageCog  ―  投稿・編集イベント
 # ------------------------------------------------
+def profile_content_hash(text: str, *, inrate_cleared: bool, move_cleared: bool) -> str:
+    """
+    評価結果を再利用してよいかの判定用ハッシュ。
+    NFKC・空白の揺れは同一視し、判定に効くフラグ（イン率・移住の確認済み）も含める。
+    """
+    norm = " ".join(unicodedata.normalize("NFKC", text).split())
+    key = f"{int(inrate_cleared)}{int(move_cleared)}:{norm}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+# 判定コード → (ステータス, pending_inrate_confirmation, pending_move_confirmation)
+#   None はそのフラグを変更しない
+PROFILE_VERDICT_TRANSITIONS: Dict[str, tuple[str, Optional[bool], Optional[bool]]] = {
+    "OK":       ("記入済み", False, False),
+    "INRATE":   ("プロフィール未記入", True, False),
+    "MOVE":     ("プロフィール未記入", None, True),
+    "AGE":      ("要修正", False, False),
+    "JAPANESE": ("要修正", False, False),
+    "MISSING":  ("要修正", False, False),
+    "ERROR":    ("要修正", False, False),
+    "DEFERRED": ("プロフィール未記入", None, None),
+}
+
+
 class MessageCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        # progress_key → 編集後の再評価待ちタスク（連続編集はまとめて 1 回にする）
+        self._profile_edit_tasks: Dict[str, asyncio.Task] = {}
+        # progress_key → 判定保留にしたプロフィールの再評価タスク
+        self._deferred_tasks: Dict[str, asyncio.Task] = {}
 
     # ===== 共通処理 ==========================================
     async def _process_profile(
@@ -2911,25 +6096,65 @@ class MessageCog(commands.Cog):
         *,
         move_confirmed_by_user: bool = False,
         reply_to: Optional[discord.Message] = None,
+        skip_if_unchanged: bool = False,
     ):
-        """プロフィール本文らしい投稿 / 編集を評価"""
+        """
+        プロフィール本文らしい投稿 / 編集を評価。
+        前回評価と内容・フラグが同じなら cp["profile_eval"] の判定を再利用して Gemini を呼ばない。
+        skip_if_unchanged=True（編集時）なら返信もせずに終える。
+        """
         if reply_to is None:
             reply_to = message
+        inrate_cleared = cp.get("pending_inrate_confirmation", False)
+        move_cleared = move_confirmed_by_user or not cp.get("pending_move_confirmation", False)
+        content_hash = profile_content_hash(
+            message.content, inrate_cleared=inrate_cleared, move_cleared=move_cleared
+        )
+        memo = cp.get("profile_eval") or {}
+
+        if memo.get("hash") == content_hash:
+            if skip_if_unchanged and cp.get("profile_message_id") == message.id:
+                logger.info(f"[profile] 内容に変化なし、再評価をスキップ: {progress_key}")
+                return
+            verdict = ProfileVerdict(memo["code"], issues=memo.get("issues", []), message=memo.get("message"))
+            logger.info(f"[profile] 前回の判定を再利用: {progress_key} code={verdict.code}")
+        else:
+            verdict = await evaluate_profile_verdict(
+                message.content,
+                debug=True,
+                inrate_cleared=inrate_cleared,
+                move_cleared=move_cleared,
+            )
+            if verdict.code not in PROFILE_INTERNAL_CODES:
+                cp["profile_eval"] = {
+                    "hash": content_hash,
+                    "code": verdict.code,
+                    "issues": verdict.issues,
+                    "message": verdict.message,
+                    "evaluated_at": get_current_time_iso(),
+                }
         cp["profile_message_id"] = message.id
 
-        ok, fb = await evaluate_profile_with_ai(
-            message.content,
-            debug=True,
-            inrate_cleared=cp.get("pending_inrate_confirmation", False),
-            move_cleared=move_confirmed_by_user or not cp.get("pending_move_confirmation", False),
-        )
+        if verdict.code == "DEFERRED":
+            await self._park_profile(message, cp, progress_key, reply_to)
+            await data_manager.save_data()
+            request_dashboard_update(self.bot)
+            return
+        if cp.pop("profile_deferred", None) is not None:
+            logger.info(f"[profile] 判定保留を解除: {progress_key} code={verdict.code}")
+
+        # ----------- 判定コード → 状態遷移 -----------
+        status, pending_inrate, pending_move = PROFILE_VERDICT_TRANSITIONS[verdict.code]
+        update_candidate_status(cp, status)
+        if pending_inrate is not None:
+            cp["pending_inrate_confirmation"] = pending_inrate
+        if pending_move is not None:
+            cp["pending_move_confirmation"] = pending_move
 
         # ----------- OK -----------
-        if ok:
-            update_candidate_status(cp, "記入済み")
+        if verdict.ok:
             cp["profile_filled_time"] = get_current_time_iso()
-            cp["pending_inrate_confirmation"] = False
-            cp["pending_move_confirmation"] = False
+            cp["available_slots_text"] = parse_profile(message.content).fields.get("面接できる時間帯", "")
             await reply_to.reply("プロフィールありがとうございます。面接官が確認次第ご連絡します。")
 
             # 面接官通知 (07–23)
@@ -2946,23 +6171,89 @@ class MessageCog(commands.Cog):
 
         # ----------- NG / 要確認 -----------
         else:
-            await reply_to.reply(fb)
-
-            if "週3回以上" in fb:
-                cp["pending_inrate_confirmation"] = True
-                cp["pending_move_confirmation"] = False
-                update_candidate_status(cp, "プロフィール未記入")
-            elif "半年以内に日本へ移住予定はございますか" in fb:
-                cp["pending_move_confirmation"] = True
-                update_candidate_status(cp, "プロフィール未記入")
-            else:
-                cp["pending_inrate_confirmation"] = False
-                cp["pending_move_confirmation"] = False
-                update_candidate_status(cp, "要修正")
+            await reply_to.reply(verdict.render())
 
         await data_manager.save_data()
         request_dashboard_update(self.bot)
 
+    # ===== 判定保留（Gemini が使えない間） =====================
+    async def _park_profile(
+        self,
+        message: discord.Message,
+        cp: Dict[str, Any],
+        progress_key: str,
+        reply_to: discord.Message,
+    ) -> None:
+        """
+        cp["profile_deferred"] に保留中のプロフィールを記録し、PROFILE_DEFER_RETRY_SEC 後に再評価する。
+        候補者への返信は最初の 1 回だけ。回数を使い切ったら面接官チャンネルへ手動確認を依頼する。
+        """
+        status, _, _ = PROFILE_VERDICT_TRANSITIONS["DEFERRED"]
+        update_candidate_status(cp, status)
+        parked = cp.get("profile_deferred")
+        if parked is None or parked.get("message_id") != message.id:
+            parked = cp["profile_deferred"] = {
+                "message_id": message.id,
+                "channel_id": message.channel.id,
+                "attempts": 0,
+                "since": get_current_time_iso(),
+            }
+            await reply_to.reply(PROFILE_DEFERRED_MESSAGE)
+        parked["attempts"] += 1
+
+        if parked["attempts"] < PROFILE_DEFER_MAX_ATTEMPTS:
+            logger.info(f"[profile] 判定保留 ({parked['attempts']} 回目): {progress_key}")
+            self._schedule_deferred(message, progress_key)
+            return
+        if not parked.get("manual_review"):
+            parked["manual_review"] = True
+            logger.warning(f"[profile] Gemini が使えないまま再評価の上限に達したため手動確認へ: {progress_key}")
+            ch = self.bot.get_channel(INTERVIEWER_REMIND_CHANNEL_ID)
+            if isinstance(ch, discord.TextChannel):
+                await ch.send(
+                    f"{message.channel.mention} のプロフィールを自動判定できませんでした（AI 応答なし）。"
+                    "お手数ですが手動で確認してください。"
+                )
+
+    def _schedule_deferred(self, message: discord.Message, progress_key: str) -> None:
+        prev = self._deferred_tasks.pop(progress_key, None)
+        if prev is not None and prev is not asyncio.current_task():
+            prev.cancel()
+        self._deferred_tasks[progress_key] = asyncio.create_task(
+            self._retry_deferred(message, progress_key)
+        )
+
+    async def _retry_deferred(self, message: discord.Message, progress_key: str) -> None:
+        try:
+            await asyncio.sleep(PROFILE_DEFER_RETRY_SEC)
+        except asyncio.CancelledError:
+            return
+        if self._deferred_tasks.get(progress_key) is asyncio.current_task():
+            del self._deferred_tasks[progress_key]
+        cp = data_manager.candidate_progress.get(progress_key)
+        if not cp or (cp.get("profile_deferred") or {}).get("message_id") != message.id:
+            return                              # 解決済み・別の投稿で判定済み・候補者が消えた
+        try:
+            await self._process_profile(message, cp, progress_key)
+        except Exception:
+            logger.exception(f"[profile] 判定保留の再評価で例外発生: {progress_key}")
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """再起動前に判定保留だったプロフィールの再評価を予約し直す"""
+        for progress_key, cp in list(data_manager.candidate_progress.items()):
+            parked = cp.get("profile_deferred")
+            if not parked or parked.get("manual_review") or progress_key in self._deferred_tasks:
+                continue
+            channel = self.bot.get_channel(parked.get("channel_id"))
+            if not isinstance(channel, discord.TextChannel):
+                continue
+            try:
+                message = await channel.fetch_message(parked["message_id"])
+            except discord.HTTPException:
+                continue
+            self._schedule_deferred(message, progress_key)
+
     # ==========================================================
     # on_message  ―  候補者の新規投稿を処理
     # ==========================================================
@@ -2973,7 +6264,7 @@ class MessageCog(commands.Cog):
 
         await self.bot.process_commands(message) # type: ignore
 
-        progress_key = data_manager.interview_channel_mapping.get(message.channel.id)
+        progress_key = data_manager.progress_key_for_channel(message.channel.id)
         if not progress_key:
             return
 
@@ -2985,7 +6276,7 @@ class MessageCog(commands.Cog):
         # A. イン率確認フェーズへの返答
         # ──────────────────────────────────────────────
         if cp.get("pending_inrate_confirmation"):
-            yn_inrate = await classify_yes_no_ai(message.content, debug=True)
+            yn_inrate = await classify_yes_no_ai(message.content, question=PROFILE_INRATE_QUESTION, debug=True)
             cp["profile_evaluated"] = True # この会話もAI評価の一環とみなす
 
             if yn_inrate == "YES":
@@ -3022,7 +6313,7 @@ class MessageCog(commands.Cog):
         # B. 移住予定確認フェーズへの返答
         # ──────────────────────────────────────────────
         if cp.get("pending_move_confirmation"):
-            yn_move = await classify_yes_no_ai(message.content, debug=True)
+            yn_move = await classify_yes_no_ai(message.content, question=PROFILE_MOVE_QUESTION, debug=True)
             cp["profile_evaluated"] = True # この会話もAI評価の一環とみなす
 
             if yn_move == "YES":
@@ -3083,7 +6374,7 @@ class MessageCog(commands.Cog):
         if after.author.bot:
             return
 
-        progress_key = data_manager.interview_channel_mapping.get(after.channel.id)
+        progress_key = data_manager.progress_key_for_channel(after.channel.id)
         if not progress_key:
             return
 
@@ -3095,9 +6386,32 @@ class MessageCog(commands.Cog):
         # または現在のステータスが未記入/要修正で、内容がプロフィールらしい場合に再評価
         if cp.get("profile_message_id") == after.id or \
            (cp.get("status") in ("プロフィール未記入", "要修正") and looks_like_profile(after.content)):
-            # 編集時も _process_profile を呼ぶが、move_confirmed_by_user は False (通常の編集とみなす)
-            # もし編集によって移住に関する記述が変わり、再度確認が必要になった場合はAIが指摘する想定
-            await self._process_profile(after, cp, progress_key, move_confirmed_by_user=False)
+            # 連続した編集は PROFILE_EDIT_DEBOUNCE_SEC 秒止まってから最後の内容で 1 回だけ評価する
+            prev = self._profile_edit_tasks.pop(progress_key, None)
+            if prev is not None:
+                prev.cancel()
+            self._profile_edit_tasks[progress_key] = asyncio.create_task(
+                self._process_profile_after_quiet(after, progress_key)
+            )
+
+    async def _process_profile_after_quiet(self, after: discord.Message, progress_key: str) -> None:
+        try:
+            await asyncio.sleep(PROFILE_EDIT_DEBOUNCE_SEC)
+        except asyncio.CancelledError:
+            return                              # 待っている間に次の編集が来た
+        if self._profile_edit_tasks.get(progress_key) is asyncio.current_task():
+            del self._profile_edit_tasks[progress_key]
+        cp = data_manager.candidate_progress.get(progress_key)
+        if not cp or cp.get("candidate_id") != after.author.id:
+            return
+        # 編集時も _process_profile を呼ぶが、move_confirmed_by_user は False (通常の編集とみなす)
+        # もし編集によって移住に関する記述が変わり、再度確認が必要になった場合はAIが指摘する想定
+        try:
+            await self._process_profile(
+                after, cp, progress_key, move_confirmed_by_user=False, skip_if_unchanged=True
+            )
+        except Exception:
+            logger.exception(f"[profile] 編集後の再評価で例外発生: {progress_key}")
 
 
 # ------------------------------------------------
@@ -3114,6 +6428,52 @@ class AdminCog(commands.Cog):
         await update_stats(self.bot)
         await interaction.followup.send("統計情報を更新しました。", ephemeral=True)
 
+    @app_commands.command(name="storage_stats", description="データ保存の回数（集約された保存数を含む）を表示します")
+    @app_commands.checks.has_role(ADMIN_ROLE_ID)
+    async def storage_stats_command(self, interaction: discord.Interaction):
+        st = data_manager.persistence_stats()
+        ds = dashboard_model.stats
+        await interaction.response.send_message(
+            f"保存方式: **{st['mode']}** (集約間隔 {st['flush_interval']} 秒)\n"
+            f"保存要求: {st['requests']} 回 / 実書き込み: {st['writes']} 回 / 集約: **{st['coalesced']} 回**\n"
+            f"未保存の変更: {'あり' if st['dirty'] else 'なし'} / 未コンパクション: {st['pending_compaction']} 件\n"
+            f"ダッシュボード: {1 + len(data_manager.dashboard_page_message_ids)} ページ / 編集 {ds['edits']} 回 "
+            f"/ 変化なしで省略 **{ds['edits_skipped']} 回** (ページ作成 {ds['pages_created']} / 削除 {ds['pages_deleted']}) "
+            f"(行の再生成 {ds['rows_rebuilt']} / セクション再描画 {ds['sections_rendered']})"
+            + "".join(f"\n- {r.describe()}" for r in _refreshers)
+            + f"\nロールキャッシュ: 参照 {role_registry.lookups} 回 / 名前で走査 {role_registry.scans} 回",
+            ephemeral=True,
+        )
+
+    @app_commands.command(name="ai_stats", description="Gemini の呼び出し状況（レイテンシ・エラー率・遮断状態）と判定キャッシュを表示します")
+    @app_commands.checks.has_role(ADMIN_ROLE_ID)
+    async def ai_stats_command(self, interaction: discord.Interaction):
+        gw = ai_gateway.stats()
+        cache = ai_answer_cache.stats()
+        local, escalated = yes_no_lexicon_stats["local"], yes_no_lexicon_stats["escalated"]
+        decided = local / (local + escalated) if local + escalated else 0.0
+        await interaction.response.send_message(
+            f"Gemini 呼び出し: {gw['calls']} 回 (タイムアウト {gw['timeouts']} / 失敗 {gw['failures']}) "
+            f"/ 最大同時実行: {gw['peak_in_flight']} (上限 {gw['max_concurrency']})\n"
+            f"判定キャッシュ: ヒット **{cache['hits']}** / ミス {cache['misses']} "
+            f"(ヒット率 {cache['hit_rate']:.1%}、節約した呼び出し {cache['hits']} 回) "
+            f"/ 保持 {cache['entries']} 件\n"
+            f"YES/NO 辞書判定: {local} 件 / Gemini へ回送 {escalated} 件 (辞書で確定 {decided:.1%})\n"
+            f"プロフィール事前判定: 即決 {profile_precheck_stats['local']} 件 "
+            f"/ Gemini へ回送 {profile_precheck_stats['escalated']} 件\n"
+            f"面接官推薦: 予定表インデックスで決定 {schedule_match_stats['local']} 件 "
+            f"/ Gemini へ回送 {schedule_match_stats['escalated']} 件\n"
+            f"サーキットブレーカー: **{gw['breaker_state']}** (遮断 {gw['breaker_trips']} 回)"
+            + "".join(
+                f"\n- `{label}` {mt.calls} 回 / エラー率 {mt.error_rate():.1%} "
+                f"(再試行 {mt.retries} / 遮断中の即時失敗 {mt.fast_failures}) "
+                f"p50≤{mt.percentile(0.5) or 0:g}s p95≤{mt.percentile(0.95) or 0:g}s\n"
+                f"  {mt.histogram_line() or '-'}"
+                for label, mt in sorted(ai_gateway.metrics.items())
+            ),
+            ephemeral=True,
+        )
+
     @app_commands.command(name="remove_ban", description="対象ユーザーのBAN／インターバルを手動で解除します（メインサーバー専用）")
     @app_commands.checks.has_role(ADMIN_ROLE_ID)
     async def remove_ban_command(self, interaction: discord.Interaction, target: discord.Member):
@@ -3211,52 +6571,24 @@ class AdminCog(commands.Cog):
             f"count={count} by {interaction.user.id}"
         )
 
-        # ---------- 既存 manual_set 抽出 ----------
-        def same_month(rec_dt: datetime) -> bool:
-            return rec_dt.year == dt_target.year and rec_dt.month == dt_target.month
-
-        existing_manual = [
-            r for r in data_manager.interview_records
-            if (
-                    r.get("interviewer_id") == iid
-                    and r.get("result") == "manual_set"
-                    and same_month(datetime.fromisoformat(r.get("date")))
-            )
-        ]
+        # ---------- 既存 manual_set 抽出（列ストアの月バケットから） ----------
+        manual_rows = data_manager.interview_records.rows(
+            year_month=ym_key, interviewer_id=iid, result="manual_set"
+        )
 
         # ---------- mode 別処理 ----------
         if mode == "set":
-            data_manager.interview_records = [
-                r for r in data_manager.interview_records
-                if not (
-                        r.get("interviewer_id") == iid
-                        and r.get("result") == "manual_set"
-                        and same_month(datetime.fromisoformat(r.get("date")))
-                )
-            ]
+            data_manager.remove_interview_rows(manual_rows)
             delta = count
 
         elif mode == "add":
             delta = count
 
         else:  # sub
-            remove_n = min(count, len(existing_manual))
-            keep_n = len(existing_manual) - remove_n
-            removed = 0
-            new_records = []
-            for r in data_manager.interview_records:
-                if (
-                        removed < remove_n
-                        and r.get("interviewer_id") == iid
-                        and r.get("result") == "manual_set"
-                        and same_month(datetime.fromisoformat(r.get("date")))
-                ):
-                    removed += 1
-                    continue
-                new_records.append(r)
-
-            data_manager.interview_records = new_records
-            await data_manager.save_data()
+            remove_n = min(count, len(manual_rows))
+            keep_n = len(manual_rows) - remove_n
+            data_manager.remove_interview_rows(manual_rows[:remove_n])
+            await data_manager.flush()
             await update_stats(self.bot, target_months=[ym_key])  # ★ 変更点
             if ym_key == datetime.now(JST).strftime("%Y-%m"):
                 await update_monthly_stats(self.bot)
@@ -3269,7 +6601,7 @@ class AdminCog(commands.Cog):
 
         # add / set → delta 件追加
         for _ in range(delta):
-            data_manager.interview_records.append(
+            data_manager.add_interview_record(
                 {
                     "date": dt_target.isoformat(),
                     "interviewer_id": iid,
@@ -3278,7 +6610,7 @@ class AdminCog(commands.Cog):
                 }
             )
 
-        await data_manager.save_data()
+        await data_manager.flush()
         await update_stats(self.bot, target_months=[ym_key])  # ★ 変更点
         if ym_key == datetime.now(JST).strftime("%Y-%m"):
             await update_monthly_stats(self.bot)
@@ -3433,46 +6765,34 @@ class AdminCog(commands.Cog):
             await interaction.followup.send("面接担当者ロールが見つかりません。", ephemeral=True)
             return
 
-        candidate_role_ids = {784723518402592803, 1289488152301539339}
-
         # ---------- ① interviewer_id → [display_name,…] ------------
-        from collections import defaultdict
         mapping: defaultdict[int | str, list[str]] = defaultdict(list)  # str "unknown" 用
+        interviewers = interviewer_role.members         # Role.members はメンバー全走査なので 1 回だけ
+        interviewer_ids = {m.id for m in interviewers}
 
-        # 1) メインサーバーで候補者ロール保持メンバーを取得
+        # 1) メインサーバーで候補者ロール保持メンバーを取得（ロール ID で直接判定）
         candidate_members = [
             m for m in guild.members
-            if any(r.id in candidate_role_ids for r in m.roles)
+            if any(m.get_role(rid) for rid in CANDIDATE_ROLE_IDS)
         ]
 
-        # 2) interview_records を最新→古い順にインデックス
-        latest_interviewer_by_user: dict[int, int | None] = {}
-        for rec in reversed(data_manager.interview_records):
-            uid = rec.get("interviewee_id")
-            if uid is None or uid in latest_interviewer_by_user:
-                continue
-            latest_interviewer_by_user[uid] = rec.get("interviewer_id")
-
-        # 3) 各候補者について担当者を決定
+        # 2) 各候補者について担当者を決定
         for member in candidate_members:
             iid: int | None = None
 
-            # 3-A candidate_progress に残っていれば優先
-            prog = next(
-                (cp for cp in data_manager.candidate_progress.values()
-                 if cp.get("candidate_id") == member.id
-                 and cp.get("source_guild_id") == MAIN_GUILD_ID),
-                None
-            )
-            if prog:
-                iid = prog.get("interviewer_id")
+            # 2-A candidate_progress に残っていれば優先（候補者 ID の索引から）
+            for progress_key in data_manager.progress_keys_for_candidate(member.id):
+                prog = data_manager.candidate_progress.get(progress_key)
+                if prog and prog.get("source_guild_id") == MAIN_GUILD_ID:
+                    iid = prog.get("interviewer_id")
+                    break
 
-            # 3-B それでも None なら interview_records から
+            # 2-B それでも None なら interview_records の最新記録から
             if iid is None:
-                iid = latest_interviewer_by_user.get(member.id)
+                iid = data_manager.latest_interviewer(member.id)
 
-            # 3-C 担当者ロールを持っていない場合 → unknown
-            if iid is None or guild.get_member(iid) not in interviewer_role.members:
+            # 2-C 担当者ロールを持っていない場合 → unknown
+            if iid is None or iid not in interviewer_ids:
                 mapping["unknown"].append(member.display_name)
             else:
                 mapping[iid].append(member.display_name)
@@ -3484,7 +6804,7 @@ class AdminCog(commands.Cog):
 
         lines: list[str] = []
         # 担当者あり
-        for interviewer in sorted(interviewer_role.members, key=lambda m: m.display_name):
+        for interviewer in sorted(interviewers, key=lambda m: m.display_name):
             cand_list = mapping.get(interviewer.id, [])
             if not cand_list:
                 continue
@@ -3533,6 +6853,12 @@ class MyBot(commands.Bot):
         await self.add_cog(GuideCountCog(self))
         self.add_view(VCControlView())
 
+    async def close(self) -> None:
+        # write-behind で保留中の変更と、各 BackgroundJsonWriter の書き込み待ちを書き出してから切断
+        await data_manager.shutdown()
+        await drain_json_writers()
+        await super().close()
+
     async def on_ready(self) -> None:
         await self.tree.sync()
         logger.info(f'Logged in as {self.user.name}')
@@ -3540,4 +6866,6 @@ class MyBot(commands.Bot):
             self.add_view(InterviewResultView(progress_key))
 
 bot = MyBot(command_prefix="!$", intents=intents)
-bot.run(BOT_TOKEN)
+
+if __name__ == "__main__":
+    bot.run(BOT_TOKEN)
@@ -0,0 +1,25 @@
+"""
+mensetsu.py をテスト用の一時ディレクトリにコピーして import する。
+BASE_DIR が一時ディレクトリになるので、JSON / SQLite の保存先がリポジトリを汚さない。
+"""
+import importlib.util
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def mensetsu(tmp_path_factory):
+    os.environ.setdefault("GENAI_API_KEY", "test")
+    os.environ["GENAI_FAKE"] = "1"
+    workdir = tmp_path_factory.mktemp("mensetsu")
+    shutil.copy(os.path.join(ROOT, "mensetsu.py"), workdir / "mensetsu.py")
+    spec = importlib.util.spec_from_file_location("mensetsu", workdir / "mensetsu.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["mensetsu"] = module
+    spec.loader.exec_module(module)
+    return module
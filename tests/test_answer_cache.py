@@ -0,0 +1,82 @@
+"""AnswerCache: LRU での追い出し・TTL 切れ・ヒット率、保存のまとめ書き"""
+import asyncio
+import json
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _cache(mensetsu, **kwargs):
+    cache = mensetsu.AnswerCache(**kwargs)
+    cache._now = Clock()
+    return cache
+
+
+def test_lru_evicts_least_recently_used(mensetsu):
+    cache = _cache(mensetsu, max_entries=2, ttl=60)
+    cache.put("yes_no", "はい", "YES")
+    cache.put("yes_no", "いいえ", "NO")
+    assert cache.get("yes_no", "はい") == "YES"         # 「はい」を最近使った側へ
+    cache.put("yes_no", "たぶん", "UNSURE")
+    assert cache.get("yes_no", "いいえ") is None
+    assert cache.get("yes_no", "はい") == "YES"
+    assert cache.get("yes_no", "たぶん") == "UNSURE"
+    assert cache.stats()["evictions"] == 1 and cache.stats()["entries"] == 2
+
+
+def test_ttl_expiry_counts_as_miss(mensetsu):
+    cache = _cache(mensetsu, ttl=60)
+    cache.put("affirmative", "OK です", True)
+    assert cache.get("affirmative", "ok です") is True     # 正規化したキーで引く
+    cache._now.now += 61
+    assert cache.get("affirmative", "OK です") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.get("yes_no", "OK です") is None          # 種別が違えば別のキー
+
+
+def test_hit_rate_counters(mensetsu):
+    cache = _cache(mensetsu, ttl=60)
+    assert cache.stats()["hit_rate"] == 0.0
+    cache.put("yes_no", "はい", "YES")
+    for text in ("はい", "はい", "はい", "いいえ"):
+        cache.get("yes_no", text)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (3, 1, 0.75)
+
+
+def test_persisted_puts_are_batched_and_reloaded(mensetsu, tmp_path, monkeypatch):
+    path = tmp_path / "ai_answer_cache.json"
+    cache = mensetsu.AnswerCache(ttl=60, file_path=str(path), flush_delay=0.05)    # 読み戻しと同じ実時刻
+    writes = []
+    original = cache._writer.write_sync
+    monkeypatch.setattr(cache._writer, "write_sync", lambda data: writes.append(len(data)) or original(data))
+
+    async def scenario():
+        for i in range(20):
+            cache.put("yes_no", f"返答{i}", "YES")
+        assert writes == []                      # まだ書かない
+        await asyncio.sleep(0.15)
+        assert writes == [20]                    # 20 回の追加が 1 回の書き込みに
+        cache.put("yes_no", "最後", "NO")
+        await mensetsu.drain_json_writers()      # 終了時は待たずに書き切る
+        assert writes == [20, 21]
+
+    asyncio.run(scenario())
+    rows = json.loads(path.read_text(encoding="utf-8"))
+    assert len(rows) == 21
+
+    reloaded = mensetsu.AnswerCache(ttl=60, file_path=str(path))
+    assert reloaded.get("yes_no", "最後") == "NO"
+    assert reloaded.stats()["entries"] == 21
+
+
+def test_put_outside_event_loop_writes_immediately(mensetsu, tmp_path):
+    path = tmp_path / "ai_answer_cache.json"
+    cache = _cache(mensetsu, ttl=60, file_path=str(path))
+    cache.put("yes_no", "はい", "YES")
+    assert len(json.loads(path.read_text(encoding="utf-8"))) == 1
@@ -0,0 +1,88 @@
+"""solve_assignments / run_batch_assignment の割り当て条件"""
+import asyncio
+
+
+def test_interviewer_without_schedule_is_never_assigned(mensetsu):
+    interviewers = [
+        mensetsu.AssignmentInterviewer(1, None),                 # 予定表に載っていない
+        mensetsu.AssignmentInterviewer(2, [(600, 720)], month_count=5),
+    ]
+    candidates = [mensetsu.AssignmentCandidate("a", [(600, 700)]), mensetsu.AssignmentCandidate("b", None)]
+    result = mensetsu.solve_assignments(candidates, interviewers, capacity=1)
+    assert 1 not in result.assigned.values()
+    assert len(result.assigned) == 1 and len(result.unassigned) == 1
+
+
+class _Member:
+    def __init__(self, uid, name):
+        self.id, self.display_name = uid, name
+
+
+class _Role:
+    members = [_Member(1, "たろう"), _Member(2, "はなこ")]
+
+
+class _Guild:
+    def get_role(self, _id):
+        return _Role()
+
+
+class _Bot:
+    def get_guild(self, _id):
+        return _Guild()
+
+    def get_channel(self, _id):
+        return None
+
+    def get_user(self, _id):
+        return None
+
+
+def _run(mensetsu, monkeypatch, schedule_text, progress, during_solve=None):
+    async def fake_schedule(_bot):
+        return schedule_text
+
+    solve = mensetsu.solve_assignments
+
+    def solve_and_mutate(*args):
+        result = solve(*args)
+        if during_solve:
+            during_solve()
+        return result
+
+    monkeypatch.setattr(mensetsu, "_fetch_schedule_text", fake_schedule)
+    monkeypatch.setattr(mensetsu, "solve_assignments", solve_and_mutate)
+    monkeypatch.setattr(mensetsu, "request_dashboard_update", lambda _bot: None)
+    monkeypatch.setattr(mensetsu.data_manager, "candidate_progress", progress)
+    return asyncio.run(mensetsu.run_batch_assignment(_Bot()))
+
+
+def test_empty_schedule_assigns_nobody(mensetsu, monkeypatch):
+    progress = {"k0": {"status": "記入済み", "channel_id": 100, "available_slots_text": "いつでも"}}
+    assert _run(mensetsu, monkeypatch, "", progress) == 0
+    assert "interviewer_id" not in progress["k0"]
+
+
+def test_candidate_changed_while_solving_is_skipped(mensetsu, monkeypatch):
+    progress = {
+        "k0": {"status": "記入済み", "channel_id": 100, "available_slots_text": "平日 21時以降"},
+        "k1": {"status": "記入済み", "channel_id": 101, "available_slots_text": "土曜 10-12"},
+    }
+
+    def manual_assign():
+        progress["k0"]["interviewer_id"] = 99
+        progress["k1"]["status"] = "辞退"
+
+    n = _run(mensetsu, monkeypatch, "たろう 平日 20-23\nはなこ 土日 終日", progress, manual_assign)
+    assert n == 0
+    assert progress["k0"]["interviewer_id"] == 99
+    assert "interviewer_id" not in progress["k1"]
+
+
+def test_batch_assigns_by_schedule(mensetsu, monkeypatch):
+    progress = {
+        "k0": {"status": "記入済み", "channel_id": 100, "available_slots_text": "平日 21時以降"},
+        "k1": {"status": "記入済み", "channel_id": 101, "available_slots_text": "土曜 10-12"},
+    }
+    assert _run(mensetsu, monkeypatch, "たろう 平日 20-23\nはなこ 土日 終日", progress) == 2
+    assert {cp["interviewer_id"] for cp in progress.values()} <= {1, 2}
@@ -0,0 +1,72 @@
+"""CandidateIndex と DataManager の索引付き参照"""
+import json
+import random
+
+
+def _manager(mensetsu, tmp_path, data):
+    path = tmp_path / "interview_records.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    dm = mensetsu.DataManager(str(path), storage_mode="json", flush_interval=0)
+    dm.load_data()
+    return dm
+
+
+def test_load_repairs_mapping_and_resolves_channels(mensetsu, tmp_path):
+    dm = _manager(mensetsu, tmp_path, {
+        "candidate_progress": {
+            "1-10": {"candidate_id": 10, "channel_id": 100, "voice_channel_id": 101, "source_guild_id": 1},
+            "2-11": {"candidate_id": 11, "channel_id": 200, "source_guild_id": 2},
+        },
+        "interview_channel_mapping": {"100": "1-10", "999": "gone"},
+    })
+    assert dm.progress_key_for_channel(101) == "1-10"        # 対応表に無かった VC も補われる
+    assert dm.progress_key_for_channel(200) == "2-11"
+    assert dm.progress_key_for_channel(999) is None           # 候補者が消えた対応は返さない
+    assert dm.channels_for("1-10") == {100, 101}
+    assert dm.progress_keys_for_candidate(10) == {"1-10"}
+    assert dm.index.guild_of == {10: 1, 11: 2}
+
+
+def test_mutations_keep_index_in_sync(mensetsu, tmp_path):
+    dm = _manager(mensetsu, tmp_path, {})
+    dm.put_candidate("1-10", {"candidate_id": 10, "channel_id": 100})
+    dm.link_channel(100, "1-10")
+    dm.put_candidate("1-10", {"candidate_id": 10, "channel_id": 100, "voice_channel_id": 101})
+    assert dm.channels_for("1-10") == {100, 101}
+
+    assert dm.unlink_channel(100) == "1-10"
+    assert dm.channels_for("1-10") == {101}
+
+    dm.pop_candidate("1-10")
+    assert dm.progress_key_for_channel(101) is None
+    assert dm.progress_keys_for_candidate(10) == set()
+    assert dm.channels_for("1-10") == set()
+
+
+def test_index_matches_full_scan_after_random_updates(mensetsu):
+    rng = random.Random(0)
+    index = mensetsu.CandidateIndex()
+    progress = {}
+    for _ in range(2000):
+        key = f"1-{rng.randint(1, 50)}"
+        if key in progress and rng.random() < 0.3:
+            index.discard(key, progress.pop(key))
+            continue
+        if key in progress:
+            index.discard(key, progress[key])
+        cid = int(key.split("-")[1])
+        cp = {"candidate_id": cid, "channel_id": 1000 + cid}
+        if rng.random() < 0.5:
+            cp["voice_channel_id"] = 2000 + cid
+        progress[key] = cp
+        index.add(key, cp)
+
+    expected = {}
+    for key, cp in progress.items():
+        for ch in (cp.get("channel_id"), cp.get("voice_channel_id")):
+            if ch:
+                expected[ch] = key
+    assert index.by_channel == expected
+    assert {cid: keys for cid, keys in index.by_candidate.items()} == {
+        cp["candidate_id"]: {key} for key, cp in progress.items()
+    }
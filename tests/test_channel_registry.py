@@ -0,0 +1,79 @@
+"""チャンネル所有の登録表（link_channel / unlink_channel / channels_for）とチャンネル削除時の無効化"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def dm(mensetsu, tmp_path, monkeypatch):
+    manager = mensetsu.DataManager(str(tmp_path / "interview_records.json"), storage_mode="json", flush_interval=0)
+    monkeypatch.setattr(mensetsu, "data_manager", manager)
+    monkeypatch.setattr(mensetsu, "request_dashboard_update", lambda bot: None)
+    manager.put_candidate("1-10", {"candidate_id": 10, "channel_id": 500, "voice_channel_id": 501})
+    manager.link_channel(500, "1-10")
+    manager.link_channel(501, "1-10")
+    manager.put_candidate("1-11", {"candidate_id": 11, "channel_id": 600})
+    manager.link_channel(600, "1-11")
+    return manager
+
+
+def _cog(mensetsu, channels=()):
+    by_id = {ch.id: ch for ch in channels}
+    return mensetsu.EventCog(SimpleNamespace(get_channel=by_id.get))
+
+
+def test_registry_is_bidirectional(dm):
+    assert dm.channels_for("1-10") == {500, 501}
+    assert dm.progress_key_for_channel(501) == "1-10"
+    dm.link_channel(502, "1-10")
+    assert dm.channels_for("1-10") == {500, 501, 502}
+    assert dm.unlink_channel(502) == "1-10"
+    assert dm.unlink_channel(502) is None                 # 二重に外しても壊れない
+    assert dm.channels_for("1-10") == {500, 501}
+    dm.channels_for("1-10").add(999)                      # 返り値はコピー
+    assert dm.channels_for("1-10") == {500, 501}
+
+
+def test_deleting_voice_channel_keeps_candidate(mensetsu, dm):
+    asyncio.run(_cog(mensetsu).on_guild_channel_delete(SimpleNamespace(id=501)))
+    assert dm.channels_for("1-10") == {500}
+    assert dm.progress_key_for_channel(501) is None
+    assert "voice_channel_id" not in dm.candidate_progress["1-10"]
+    assert dm.progress_key_for_channel(500) == "1-10"
+
+
+def test_deleting_text_channel_drops_candidate(mensetsu, dm):
+    asyncio.run(_cog(mensetsu).on_guild_channel_delete(SimpleNamespace(id=500)))
+    assert "1-10" not in dm.candidate_progress
+    assert dm.progress_key_for_channel(500) is None
+    assert dm.progress_keys_for_candidate(10) == set()
+    assert dm.channels_for("1-11") == {600}               # ほかの候補者は巻き込まない
+
+
+def test_unrelated_channel_delete_is_ignored(mensetsu, dm):
+    before = dict(dm.interview_channel_mapping)
+    asyncio.run(_cog(mensetsu).on_guild_channel_delete(SimpleNamespace(id=12345)))
+    assert dm.interview_channel_mapping == before
+    assert set(dm.candidate_progress) == {"1-10", "1-11"}
+
+
+def test_candidate_cleanup_unlinks_before_deleting(mensetsu, dm, monkeypatch):
+    class Channel:
+        def __init__(self, channel_id):
+            self.id = channel_id
+            self.deleted = False
+
+        async def delete(self):
+            self.deleted = True
+            # 実際の Discord と同じく削除イベントが後から届く
+            await _cog(mensetsu).on_guild_channel_delete(self)
+
+    monkeypatch.setattr(mensetsu.discord, "TextChannel", Channel)
+    text, voice = Channel(500), Channel(501)
+    bot = SimpleNamespace(get_channel={500: text, 501: voice}.get)
+    asyncio.run(mensetsu.delete_candidate_channels(bot, SimpleNamespace(id=1), 10))
+    assert text.deleted and voice.deleted
+    assert dm.channels_for("1-10") == set()
+    assert "1-10" in dm.candidate_progress                # 進捗は呼び出し側が決める
+    assert "voice_channel_id" not in dm.candidate_progress["1-10"]
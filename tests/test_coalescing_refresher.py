@@ -0,0 +1,81 @@
+"""CoalescingRefresher の集約・遅延上限・範囲の和集合"""
+import asyncio
+
+
+def _refresher(mensetsu, renders, **kwargs):
+    async def render(context, scope):
+        renders.append((asyncio.get_running_loop().time(), context, scope))
+        if context == "boom":
+            raise RuntimeError("render failed")
+
+    kwargs.setdefault("delay", 0.05)
+    kwargs.setdefault("min_interval", 0.05)
+    kwargs.setdefault("max_staleness", 0.3)
+    return mensetsu.CoalescingRefresher("test", render, **kwargs)
+
+
+def test_burst_is_coalesced_into_one_render(mensetsu):
+    renders = []
+
+    async def scenario():
+        r = _refresher(mensetsu, renders)
+        for i in range(50):
+            r.request(i)
+        await asyncio.sleep(0.2)
+        return r
+
+    r = asyncio.run(scenario())
+    assert len(renders) == 1
+    assert renders[0][1] == 49                      # 最後に渡した context で描く
+    assert r.stats["requests"] == 50 and r.stats["renders"] == 1
+
+
+def test_sustained_requests_render_within_max_staleness(mensetsu):
+    renders = []
+
+    async def scenario():
+        r = _refresher(mensetsu, renders, delay=0.1, min_interval=0.05, max_staleness=0.25)
+        for _ in range(20):                          # 0.1 秒静かになることがない 0.6 秒間
+            r.request(None)
+            await asyncio.sleep(0.03)
+        await asyncio.sleep(0.3)
+        return r
+
+    r = asyncio.run(scenario())
+    assert len(renders) >= 2
+    assert r.stats["max_latency"] <= 0.25 + 0.05
+    gaps = [b[0] - a[0] for a, b in zip(renders, renders[1:])]
+    assert min(gaps) >= 0.05 - 0.005                 # min_interval を守る
+
+
+def test_scopes_are_merged_and_none_means_everything(mensetsu):
+    renders = []
+
+    async def scenario():
+        r = _refresher(mensetsu, renders)
+        r.request(None, ["2026-09"])
+        r.request(None, ["2026-10"])
+        await asyncio.sleep(0.15)
+        r.request(None, ["2026-09"])
+        r.request(None)
+        r.request(None, ["2026-10"])
+        await asyncio.sleep(0.15)
+
+    asyncio.run(scenario())
+    assert [scope for _, _, scope in renders] == [frozenset({"2026-09", "2026-10"}), None]
+
+
+def test_render_failure_does_not_stop_the_worker(mensetsu):
+    renders = []
+
+    async def scenario():
+        r = _refresher(mensetsu, renders)
+        r.request("boom")
+        await asyncio.sleep(0.15)
+        r.request("ok")
+        await asyncio.sleep(0.15)
+        return r
+
+    r = asyncio.run(scenario())
+    assert [context for _, context, _ in renders] == ["boom", "ok"]
+    assert r.stats["failures"] == 1
@@ -0,0 +1,126 @@
+"""DashboardModel / update_dashboard の差分更新"""
+import asyncio
+from datetime import datetime
+
+STATUSES = ["プロフィール未記入", "記入済み", "担当者待ち", "日程調整済み", "面接済み"]
+
+
+class _Obj:
+    def __init__(self, uid):
+        self.id = uid
+        self.mention = f"<#{uid}>"
+        self.display_name = f"u{uid}"
+
+
+class _PartialMessage:
+    def __init__(self, channel, message_id):
+        self.channel, self.id = channel, message_id
+
+    async def edit(self, **_kwargs):
+        self.channel.edits += 1
+
+    async def delete(self):
+        self.channel.deletes += 1
+
+
+class _DashboardChannel:
+    def __init__(self):
+        self.edits = self.sends = self.deletes = 0
+
+    def get_partial_message(self, message_id):
+        return _PartialMessage(self, message_id)
+
+    async def send(self, **_kwargs):
+        self.sends += 1
+        return _Obj(10_000 + self.sends)
+
+
+class _Bot:
+    def __init__(self, mensetsu, dashboard):
+        self.mensetsu, self.dashboard = mensetsu, dashboard
+
+    async def wait_until_ready(self):
+        pass
+
+    def get_channel(self, channel_id):
+        if channel_id == self.mensetsu.DASHBOARD_CHANNEL_ID:
+            return self.dashboard
+        return _Obj(channel_id) if channel_id else None
+
+    def get_user(self, user_id):
+        return _Obj(user_id)
+
+
+def _progress(n):
+    return {
+        f"k{i}": {
+            "status": STATUSES[i % len(STATUSES)], "channel_id": 1000 + i, "candidate_id": 5000 + i,
+            "interviewer_id": 7, "interview_time": "2026-12-31T20:00:00+09:00",
+        }
+        for i in range(n)
+    }
+
+
+def test_model_rebuilds_only_changed_rows_and_sections(mensetsu):
+    model = mensetsu.DashboardModel()
+    bot = _Bot(mensetsu, _DashboardChannel())
+    progress = _progress(50)
+    now = datetime.now(mensetsu.JST)
+
+    model.sync(bot, progress, now)
+    first = model.render()
+    assert model.stats["rows_rebuilt"] == 50
+
+    model.sync(bot, progress, now)
+    assert [p.digest for p in model.render()] == [p.digest for p in first]
+    assert model.stats["rows_rebuilt"] == 50
+    assert model.stats["sections_rendered"] == len(STATUSES)
+
+    progress["k1"]["status"] = "日程調整済み"       # 記入済み → 日程調整済み
+    model.sync(bot, progress, now)
+    model.render()
+    assert model.stats["rows_rebuilt"] == 51
+    assert model.stats["sections_rendered"] == len(STATUSES) + 2
+
+    del progress["k2"]
+    model.sync(bot, progress, now)
+    pages = model.render()
+    assert all("u5002" not in description for p in pages for _, _, description in p.sections)
+
+
+def test_update_dashboard_skips_unchanged_pages(mensetsu, monkeypatch):
+    dashboard = _DashboardChannel()
+    bot = _Bot(mensetsu, dashboard)
+    saves = []
+
+    async def fake_save():
+        saves.append(1)
+
+    monkeypatch.setattr(mensetsu, "dashboard_model", mensetsu.DashboardModel())
+    monkeypatch.setattr(mensetsu.data_manager, "candidate_progress", _progress(30))
+    monkeypatch.setattr(mensetsu.data_manager, "dashboard_message_id", None)
+    monkeypatch.setattr(mensetsu.data_manager, "dashboard_page_message_ids", [])
+    monkeypatch.setattr(mensetsu.data_manager, "save_data", fake_save)
+
+    async def scenario():
+        await mensetsu.update_dashboard(bot)
+        assert dashboard.sends == 1 and len(saves) == 1
+        await mensetsu.update_dashboard(bot)
+        assert dashboard.edits == 0 and len(saves) == 1       # 変化なしなら編集も保存もしない
+        mensetsu.data_manager.candidate_progress["k0"]["status"] = "記入済み"
+        await mensetsu.update_dashboard(bot)
+        assert dashboard.edits == 1 and dashboard.sends == 1
+
+    asyncio.run(scenario())
+
+
+def test_pages_stay_within_discord_limits(mensetsu):
+    model = mensetsu.DashboardModel()
+    model.sync(_Bot(mensetsu, _DashboardChannel()), _progress(1000), datetime.now(mensetsu.JST))
+    pages = model.render()
+    assert len(pages) > 1
+    for page in pages:
+        embeds = page.embeds(datetime.now(mensetsu.JST))
+        assert len(embeds) <= 10
+        assert all(len(e.description) <= 4096 for e in embeds)
+        assert sum(len(e.title) + len(e.description) + len(e.footer.text) for e in embeds) <= 6000
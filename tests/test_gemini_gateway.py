@@ -0,0 +1,88 @@
+"""GeminiGateway の再試行・全体の締め切り・サーキットブレーカー（FakeGeminiClient を使う）"""
+import asyncio
+
+import pytest
+
+
+def _gateway(mensetsu, client, **kwargs):
+    kwargs.setdefault("backoff_base", 0.01)
+    kwargs.setdefault("backoff_max", 0.01)
+    kwargs.setdefault("breaker", mensetsu.CircuitBreaker(threshold=3, cooldown=0.05))
+    return mensetsu.GeminiGateway(client, **kwargs)
+
+
+def _flaky(failures):
+    state = {"left": failures}
+
+    def responder(_prompt):
+        if state["left"] > 0:
+            state["left"] -= 1
+            raise RuntimeError("503 UNAVAILABLE")
+        return "YES"
+
+    return responder
+
+
+def test_retries_until_success(mensetsu):
+    client = mensetsu.FakeGeminiClient(_flaky(2), latency=0)
+    gw = _gateway(mensetsu, client, retries=2)
+    assert asyncio.run(gw.generate("p", max_output_tokens=4, label="t")) == "YES"
+    assert client.calls == 3
+    assert gw.metrics["t"].retries == 2
+    assert gw.breaker.state == "closed"
+
+
+def test_breaker_opens_then_half_open_probe_closes_it(mensetsu):
+    client = mensetsu.FakeGeminiClient(_flaky(3), latency=0)
+    gw = _gateway(mensetsu, client, retries=0)
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await gw.generate("p", max_output_tokens=4, label="t")
+        assert gw.breaker.state == "open"
+        with pytest.raises(mensetsu.GeminiUnavailable):
+            await gw.generate("p", max_output_tokens=4, label="t")
+        assert client.calls == 3            # 遮断中は呼ばない
+        await asyncio.sleep(0.06)
+        assert await gw.generate("p", max_output_tokens=4, label="t") == "YES"
+        assert gw.breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_releases_half_open(mensetsu):
+    client = mensetsu.FakeGeminiClient(latency=0.5)
+    gw = _gateway(mensetsu, client, retries=0)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        gw.breaker.state, gw.breaker.opened_at = "open", loop.time() - 1
+        probe = asyncio.create_task(gw.generate("YES?", max_output_tokens=4, label="t"))
+        await asyncio.sleep(0.05)
+        assert gw.breaker.state == "half_open"
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        client.latency = 0
+        # 次の呼び出しが新しい試験呼び出しとして通る
+        assert await gw.generate("YES?", max_output_tokens=4, label="t") == "YES"
+        assert gw.breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+def test_timeouts_respect_overall_deadline(mensetsu):
+    client = mensetsu.FakeGeminiClient(latency=5)
+    gw = _gateway(mensetsu, client, timeout=0.2, deadline=0.5, retries=10)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(asyncio.TimeoutError):
+            await gw.generate("p", max_output_tokens=4, label="t")
+        return loop.time() - started
+
+    elapsed = asyncio.run(scenario())
+    assert elapsed < 0.7
+    assert gw.timeouts >= 2
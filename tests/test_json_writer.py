@@ -0,0 +1,35 @@
+"""write_json_atomic / BackgroundJsonWriter"""
+import asyncio
+import json
+
+
+def _records(mensetsu):
+    return mensetsu.InterviewRecordStore([
+        {"date": "2026-09-01T10:00:00+09:00", "interviewer_id": 1, "interviewee_id": 2, "result": "PASS"},
+        {"date": "2026-09-02T10:00:00+09:00", "interviewer_id": 1, "interviewee_id": 3, "result": "manual_set",
+         "note": "旧形式の追加項目"},
+    ])
+
+
+def test_streamed_records_match_plain_dump(mensetsu, tmp_path):
+    path = tmp_path / "state.json"
+    for records in (_records(mensetsu), mensetsu.InterviewRecordStore([])):
+        data = {"interview_records": records, "candidate_progress": {"1-2": {"status": "記入済み"}}, "x": None}
+        mensetsu.write_json_atomic(str(path), data)
+        expected = dict(data, interview_records=records.to_list())
+        assert json.loads(path.read_text(encoding="utf-8")) == expected
+    assert not (tmp_path / "state.json.tmp").exists()
+
+
+def test_drain_waits_for_scheduled_writes(mensetsu, tmp_path):
+    path = tmp_path / "ban.json"
+    writer = mensetsu.BackgroundJsonWriter(str(path), "テスト")
+
+    async def scenario():
+        for i in range(5):
+            writer.schedule({"n": i})
+        await mensetsu.drain_json_writers()
+
+    asyncio.run(scenario())
+    assert json.loads(path.read_text(encoding="utf-8")) == {"n": 4}
+    assert writer in mensetsu._json_writers
@@ -0,0 +1,66 @@
+"""MembershipIndex の取り込み・参加/退出・サーバー離脱時の無効化"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+def _guild(guild_id, member_ids):
+    return SimpleNamespace(id=guild_id, members=[SimpleNamespace(id=uid) for uid in member_ids])
+
+
+@pytest.fixture
+def index(mensetsu):
+    idx = mensetsu.MembershipIndex()
+    idx.index_guild(_guild(1, [10, 11]))
+    idx.index_guild(_guild(2, [10, 12]))
+    return idx
+
+
+def test_index_and_join(index):
+    assert index.guilds_of(10) == {1, 2}
+    assert index.guilds_of(99) == frozenset()
+    index.add(99, 2)
+    assert index.guilds_of(99) == {2}
+
+
+def test_member_remove_invalidates_only_that_guild(index):
+    index.discard(10, 1)
+    assert index.guilds_of(10) == {2}
+    index.discard(10, 2)
+    assert index.guilds_of(10) == frozenset()
+    index.discard(10, 2)                        # 退出イベントが重複しても壊れない
+    assert index.guilds_of(11) == {1}
+
+
+def test_dropped_guild_falls_back_to_unindexed(index):
+    bot = SimpleNamespace(guilds=[_guild(1, []), _guild(2, []), _guild(3, [])])
+    # 3 は未取り込みなので、在籍が分からないメンバーでも候補に入れる
+    assert [g.id for g in index.candidate_guilds(bot, 11)] == [1, 3]
+
+    index.drop_guild(1)
+    assert 1 not in index.indexed
+    assert index.guilds_of(11) == frozenset() and index.guilds_of(10) == {2}
+    assert [g.id for g in index.candidate_guilds(bot, 11)] == [1, 3]   # 取り込み直すまで確認に回す
+
+
+def test_reindex_replaces_stale_members(index):
+    index.index_guild(_guild(1, [11, 13]))      # 取りこぼした退出があっても取り込み直しで正す
+    assert index.guilds_of(10) == {2}
+    assert index.guilds_of(13) == {1}
+
+
+def test_member_remove_event_updates_index(mensetsu, index, tmp_path, monkeypatch):
+    dm = mensetsu.DataManager(str(tmp_path / "interview_records.json"), storage_mode="json", flush_interval=0)
+    monkeypatch.setattr(mensetsu, "member_index", index)
+    monkeypatch.setattr(mensetsu, "data_manager", dm)
+    monkeypatch.setattr(mensetsu, "request_dashboard_update", lambda bot: None)
+    cog = mensetsu.EventCog(SimpleNamespace(get_channel=lambda cid: None))
+
+    async def scenario():
+        await cog.on_member_remove(SimpleNamespace(id=10, guild=SimpleNamespace(id=2)))
+        assert index.guilds_of(10) == {1}
+        await cog.on_guild_remove(SimpleNamespace(id=1))
+        assert index.guilds_of(10) == frozenset() and 1 not in index.indexed
+
+    asyncio.run(scenario())
@@ -0,0 +1,134 @@
+"""Gemini が使えないときのプロフィール判定保留と面接官推薦のフォールバック"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.mention = f"<#{channel_id}>"
+        self.sent = []
+
+    async def send(self, content):
+        self.sent.append(content)
+
+
+class FakeMessage:
+    def __init__(self, message_id, channel, content="プロフィール"):
+        self.id = message_id
+        self.channel = channel
+        self.content = content
+        self.replies = []
+
+    async def reply(self, content):
+        self.replies.append(content)
+
+
+@pytest.fixture
+def cog(mensetsu, monkeypatch):
+    remind = FakeChannel(mensetsu.INTERVIEWER_REMIND_CHANNEL_ID)
+    monkeypatch.setattr(mensetsu, "PROFILE_DEFER_RETRY_SEC", 0.01)
+    monkeypatch.setattr(mensetsu, "PROFILE_DEFER_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(mensetsu.discord, "TextChannel", FakeChannel)
+    monkeypatch.setattr(mensetsu, "request_dashboard_update", lambda bot: None)
+
+    async def no_save():
+        return None
+
+    monkeypatch.setattr(mensetsu.data_manager, "save_data", no_save)
+    bot = SimpleNamespace(get_channel=lambda cid: remind if cid == remind.id else None)
+    cog = mensetsu.MessageCog(bot)
+    cog.remind = remind
+    return cog
+
+
+def _verdicts(mensetsu, monkeypatch, codes):
+    codes = list(codes)
+
+    async def fake_evaluate(text, **_kwargs):
+        return mensetsu.ProfileVerdict(codes.pop(0) if codes else "MISSING", issues=["身長（未記入）"])
+
+    monkeypatch.setattr(mensetsu, "evaluate_profile_verdict", fake_evaluate)
+
+
+def _candidate(mensetsu, progress_key):
+    cp = {"candidate_id": 10, "channel_id": 500, "status": "プロフィール未記入"}
+    mensetsu.data_manager.candidate_progress[progress_key] = cp
+    return cp
+
+
+def test_breaker_open_defers_instead_of_repost(mensetsu, monkeypatch):
+    async def unavailable(*_a, **_k):
+        raise mensetsu.GeminiUnavailable("open")
+
+    monkeypatch.setattr(mensetsu, "evaluate_profile_locally", lambda *a, **k: None)
+    monkeypatch.setattr(mensetsu.ai_gateway, "generate", unavailable)
+    verdict = asyncio.run(mensetsu.evaluate_profile_verdict("何か"))
+    assert verdict.code == "DEFERRED"
+    assert verdict.render() != mensetsu.PROFILE_ERROR_MESSAGE
+    # Gemini 自身が内部コードを返しても採用しない
+    assert mensetsu._parse_verdict_json('{"code":"DEFERRED"}') is None
+
+
+def test_deferred_profile_is_reevaluated(mensetsu, monkeypatch, cog):
+    _verdicts(mensetsu, monkeypatch, ["DEFERRED", "MISSING"])
+    cp = _candidate(mensetsu, "1-10")
+    msg = FakeMessage(1, FakeChannel(500))
+
+    async def scenario():
+        await cog._process_profile(msg, cp, "1-10")
+        assert msg.replies == [mensetsu.PROFILE_DEFERRED_MESSAGE]
+        assert cp["status"] == "プロフィール未記入" and cp["profile_deferred"]["attempts"] == 1
+        assert "profile_eval" not in cp            # 保留は判定として覚えない
+        await asyncio.sleep(0.05)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        mensetsu.data_manager.candidate_progress.pop("1-10", None)
+    assert "profile_deferred" not in cp
+    assert cp["status"] == "要修正"
+    assert msg.replies[1].startswith(mensetsu.PROFILE_MISSING_HEADER)
+    assert cog.remind.sent == []
+
+
+def test_deferred_profile_goes_to_manual_review(mensetsu, monkeypatch, cog):
+    _verdicts(mensetsu, monkeypatch, ["DEFERRED"] * 5)
+    cp = _candidate(mensetsu, "1-11")
+    msg = FakeMessage(2, FakeChannel(501))
+
+    async def scenario():
+        await cog._process_profile(msg, cp, "1-11")
+        await asyncio.sleep(0.05)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        mensetsu.data_manager.candidate_progress.pop("1-11", None)
+    assert msg.replies == [mensetsu.PROFILE_DEFERRED_MESSAGE]     # 候補者への返信は 1 回だけ
+    assert cp["profile_deferred"]["attempts"] == 2 and cp["profile_deferred"]["manual_review"]
+    assert len(cog.remind.sent) == 1 and "<#501>" in cog.remind.sent[0]
+    assert cog._deferred_tasks == {}
+
+
+def test_recommendation_falls_back_to_least_loaded(mensetsu, monkeypatch):
+    members = [SimpleNamespace(id=i, display_name=name) for i, name in ((1, "c"), (2, "a"), (3, "b"), (4, "d"))]
+    role = SimpleNamespace(members=members)
+    guild = SimpleNamespace(get_role=lambda rid: role, get_member=lambda uid: None)
+    bot = SimpleNamespace(get_guild=lambda gid: guild)
+
+    async def unavailable(*_a, **_k):
+        raise mensetsu.GeminiUnavailable("open")
+
+    monkeypatch.setattr(mensetsu, "_count_by_interviewer_this_month", lambda: {1: 0, 2: 5, 3: 0, 4: 1})
+    monkeypatch.setattr(mensetsu, "recommend_interviewers_locally", lambda *a, **k: None)
+    monkeypatch.setattr(mensetsu.ai_gateway, "generate", unavailable)
+    assert asyncio.run(mensetsu._recommend_interviewer_with_gemini(bot, "予定表")) == [3, 1, 4]
+
+    async def garbage(*_a, **_k):
+        return "わかりません"
+
+    monkeypatch.setattr(mensetsu.ai_gateway, "generate", garbage)
+    assert asyncio.run(mensetsu._recommend_interviewer_with_gemini(bot, "予定表")) == [3, 1, 4]
@@ -0,0 +1,100 @@
+"""プロフィール編集の debounce と、内容ハッシュによる判定の再利用"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeMessage:
+    def __init__(self, message_id, content, author_id=10, channel_id=500):
+        self.id = message_id
+        self.content = content
+        self.author = SimpleNamespace(id=author_id, bot=False)
+        self.channel = SimpleNamespace(id=channel_id)
+        self.replies = []
+
+    async def reply(self, content):
+        self.replies.append(content)
+
+
+@pytest.fixture
+def cog(mensetsu, monkeypatch):
+    monkeypatch.setattr(mensetsu, "PROFILE_EDIT_DEBOUNCE_SEC", 0.05)
+    monkeypatch.setattr(mensetsu, "request_dashboard_update", lambda bot: None)
+
+    async def no_save():
+        return None
+
+    monkeypatch.setattr(mensetsu.data_manager, "save_data", no_save)
+    cp = {"candidate_id": 10, "channel_id": 500, "status": "要修正"}
+    monkeypatch.setitem(mensetsu.data_manager.candidate_progress, "1-10", cp)
+    monkeypatch.setitem(mensetsu.data_manager.interview_channel_mapping, 500, "1-10")
+    mensetsu.data_manager.index.link(500, "1-10")
+    yield mensetsu.MessageCog(SimpleNamespace(get_channel=lambda cid: None))
+    mensetsu.data_manager.index.unlink(500)
+
+
+@pytest.fixture
+def evaluations(mensetsu, monkeypatch):
+    """Gemini まで行った評価の本文を記録する（判定は常に MISSING）"""
+    seen = []
+
+    async def fake_generate(prompt, **_kwargs):
+        seen.append(prompt)
+        return '{"code":"MISSING","issues":["身長（未記入）"]}'
+
+    monkeypatch.setattr(mensetsu, "evaluate_profile_locally", lambda *a, **k: None)
+    monkeypatch.setattr(mensetsu.ai_gateway, "generate", fake_generate)
+    return seen
+
+
+def test_rapid_edits_produce_one_evaluation(mensetsu, cog, evaluations):
+    cp = mensetsu.data_manager.candidate_progress["1-10"]
+    cp["profile_message_id"] = 1
+
+    async def scenario():
+        for n in range(8):
+            await cog.on_message_edit(None, FakeMessage(1, f"年齢: 25\n身長: 版{n}"))
+            await asyncio.sleep(0.005)
+        assert evaluations == []                 # 編集が続いている間は評価しない
+        await asyncio.sleep(0.15)
+
+    asyncio.run(scenario())
+    assert len(evaluations) == 1
+    assert "版7" in evaluations[0]               # 最後の内容で評価する
+    assert cog._profile_edit_tasks == {}
+
+
+def test_unchanged_hash_skips_gemini(mensetsu, cog, evaluations):
+    cp = mensetsu.data_manager.candidate_progress["1-10"]
+    first = FakeMessage(2, "年齢: 25\n身長: 170")
+
+    async def scenario():
+        await cog._process_profile(first, cp, "1-10")
+        assert len(evaluations) == 1 and cp["profile_eval"]["code"] == "MISSING"
+
+        # 空白の違いだけの再投稿は前回の判定を再利用して同じ返答をする
+        again = FakeMessage(3, "年齢: 25   \n\n身長: 170")
+        await cog._process_profile(again, cp, "1-10")
+        assert len(evaluations) == 1
+        assert again.replies == first.replies
+
+        # 同じ内容への編集は返信もせずに終える
+        edited = FakeMessage(3, "年齢: 25\n身長: 170")
+        await cog._process_profile(edited, cp, "1-10", skip_if_unchanged=True)
+        assert len(evaluations) == 1 and edited.replies == []
+
+        # 内容が変われば Gemini に聞き直す
+        await cog._process_profile(FakeMessage(4, "年齢: 25\n身長: 171"), cp, "1-10")
+        assert len(evaluations) == 2
+
+    asyncio.run(scenario())
+
+
+def test_content_hash_depends_on_flags(mensetsu):
+    def h(text, inrate_cleared=False, move_cleared=False):
+        return mensetsu.profile_content_hash(text, inrate_cleared=inrate_cleared, move_cleared=move_cleared)
+
+    assert h("a  b\n") == h("a b")
+    assert h("a b") != h("a b", inrate_cleared=True)
+    assert h("a b") != h("a b", move_cleared=True)
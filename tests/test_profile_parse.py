@@ -0,0 +1,67 @@
+"""プロフィールのローカル判定（イン率の日数・お住まい）"""
+import pytest
+
+
+@pytest.mark.parametrize(
+    "value, days",
+    [
+        ("週3日", 3), ("週 4", 4), ("週5回くらい", 5), ("3日", 3), ("4", 4), ("毎日", 7),
+        ("週2〜3日", 2),
+        # 月単位・時間数・範囲外は Gemini に任せる
+        ("月10日", None), ("月に8回", None), ("毎月5日くらい", None),
+        ("週10時間", None), ("週 10 時間", None), ("1日2時間", None), ("10日", None),
+        ("土日", None), ("できるだけ", None),
+    ],
+)
+def test_parse_inrate_days(mensetsu, value, days):
+    assert mensetsu._parse_inrate_days(value) == days
+
+
+@pytest.mark.parametrize(
+    "residence, domestic",
+    [
+        ("東京都", True), ("大阪府大阪市", True), ("京都", True), ("日本", True), ("神奈川県横浜市", True),
+        ("東京と韓国", False), ("大阪/ソウル", False), ("東京(今は海外)", False), ("東京・大阪", False),
+        ("東京 大阪", False), ("Tokyo", False), ("韓国", False), ("来月から東京", False),
+        ("海外(東京に移住予定)", False),
+    ],
+)
+def test_is_domestic_residence(mensetsu, residence, domestic):
+    assert mensetsu._is_domestic_residence(residence) is domestic
+
+
+def test_monthly_inrate_is_escalated(mensetsu):
+    p = mensetsu.ParsedProfile(
+        fields={h: "あり" for h in mensetsu.PROFILE_HEADERS}, age=25, inrate_days=None
+    )
+    p.fields.update({"年齢": "25", "お住まい": "東京都", "イン率": "月10日"})
+    p.inrate_days = mensetsu._parse_inrate_days(p.fields["イン率"])
+    assert mensetsu._decide_profile(p, inrate_cleared=False, move_cleared=False) is None
+
+
+@pytest.mark.parametrize(
+    "value, age",
+    [
+        ("25", 25), ("25歳", 25), ("２５才", 25), ("19歳です", 19), (" 30 ", 30),
+        # 生年・元号・範囲・幅のある書き方は Gemini に任せる
+        ("2000年生まれ", None), ("平成12年", None), ("平成12年生まれ(25歳)", None),
+        ("20代", None), ("20〜25", None), ("25-26歳", None), ("今年で25", None), ("123", None),
+    ],
+)
+def test_parse_age(mensetsu, value, age):
+    assert mensetsu._parse_age(value) == age
+
+
+def test_birth_year_is_escalated_not_rejected(mensetsu):
+    p = mensetsu.ParsedProfile(fields={h: "あり" for h in mensetsu.PROFILE_HEADERS})
+    p.fields.update({"年齢": "2000年生まれ", "お住まい": "東京都", "イン率": "週3日"})
+    p.age = mensetsu._parse_age(p.fields["年齢"])
+    p.inrate_days = mensetsu._parse_inrate_days(p.fields["イン率"])
+    assert mensetsu._decide_profile(p, inrate_cleared=False, move_cleared=False) is None
+
+
+def test_every_verdict_code_has_a_transition(mensetsu):
+    # 確認待ちフラグは PROFILE_VERDICT_TRANSITIONS だけが決める
+    assert set(mensetsu.PROFILE_VERDICT_TRANSITIONS) == set(mensetsu.PROFILE_VERDICT_TEMPLATES)
+    assert mensetsu.PROFILE_VERDICT_TRANSITIONS["MOVE"][2] is True
+    assert mensetsu.PROFILE_VERDICT_TRANSITIONS["INRATE"][1] is True
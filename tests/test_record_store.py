@@ -0,0 +1,120 @@
+"""InterviewRecordStore と InterviewStatsIndex の追記・削除・再構築"""
+import json
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+
+def _records(mensetsu, n, seed=0):
+    rng = random.Random(seed)
+    base = datetime(2024, 11, 1, tzinfo=mensetsu.JST)
+    return [
+        {
+            "date": (base + timedelta(hours=rng.randint(0, 24 * 120))).isoformat(),
+            "interviewer_id": 10**17 + rng.randint(1, 5),
+            "interviewee_id": 10**17 + rng.randint(1, 40),
+            "result": rng.choice(["PASS", "FAIL", "BAN", "INTERVAL", "FAIL (遅延)"]),
+        }
+        for _ in range(n)
+    ]
+
+
+def _brute_cells(mensetsu, records, ym):
+    return Counter(
+        (r["interviewer_id"], r["result"]) for r in records if mensetsu._record_year_month(r) == ym
+    )
+
+
+def _brute_stats(mensetsu, records):
+    index = mensetsu.InterviewStatsIndex()
+    for rec in records:
+        index.add(rec)
+    return index
+
+
+def _same_stats(a, b):
+    months = a.months() | b.months()
+    return all(
+        a.counts_for_month(ym) == b.counts_for_month(ym) and a.result_counts(ym) == b.result_counts(ym)
+        for ym in months
+    )
+
+
+def _manager(mensetsu, tmp_path, records):
+    path = tmp_path / "interview_records.json"
+    path.write_text(json.dumps({"interview_records": records}, ensure_ascii=False), encoding="utf-8")
+    dm = mensetsu.DataManager(str(path), storage_mode="json", flush_interval=0)
+    dm.load_data()
+    return dm
+
+
+def test_append_round_trips_canonical_and_raw_rows(mensetsu):
+    records = _records(mensetsu, 50) + [
+        {"date": "2025-01-05T10:00:00+00:00", "interviewer_id": 7, "interviewee_id": 8, "result": "PASS"},
+        {"date": "2025-01-06T10:00:00+09:00", "interviewer_id": 7, "interviewee_id": "abc", "result": "manual_set"},
+        {"date": "壊れた日付", "interviewer_id": None, "interviewee_id": 9, "result": "PASS", "note": "x"},
+    ]
+    store = mensetsu.InterviewRecordStore()
+    for rec in records:
+        store.append(rec)
+    assert store == records
+    assert list(reversed(store)) == records[::-1]
+    assert store[-1] == records[-1] and store[3:6] == records[3:6]
+    assert store.copy() == records
+
+
+def test_month_cells_and_rows_match_brute_force(mensetsu):
+    records = _records(mensetsu, 600)
+    store = mensetsu.InterviewRecordStore(records)
+    months = sorted({mensetsu._record_year_month(r) for r in records})
+    assert sorted(store.months()) == months
+    for ym in months:
+        assert store.month_cells(ym) == _brute_cells(mensetsu, records, ym)
+        iid = 10**17 + 2
+        expected = [
+            i for i, r in enumerate(records)
+            if mensetsu._record_year_month(r) == ym and r["interviewer_id"] == iid and r["result"] == "PASS"
+        ]
+        assert store.rows(year_month=ym, interviewer_id=iid, result="PASS") == expected
+    assert store.rows(result="存在しない") == []
+    assert store.month_cells("1999-01") == Counter()
+
+
+def test_latest_interviewer_follows_appends(mensetsu):
+    records = _records(mensetsu, 200)
+    store = mensetsu.InterviewRecordStore(records)
+    expected = {r["interviewee_id"]: r["interviewer_id"] for r in records}
+    assert store.latest_interviewer_by_interviewee() == expected
+
+    store.append({"date": records[0]["date"], "interviewer_id": 1, "interviewee_id": records[0]["interviewee_id"],
+                  "result": "PASS"})
+    store.append({"date": records[0]["date"], "interviewer_id": 2, "interviewee_id": "文字列", "result": "PASS"})
+    assert store.latest_interviewer(records[0]["interviewee_id"]) == 1
+    assert store.latest_interviewer("文字列") == 2
+    assert store.copy().latest_interviewer("文字列") == 2
+
+
+def test_stats_rebuild_matches_from_scratch_count(mensetsu):
+    records = _records(mensetsu, 500, seed=1)
+    index = mensetsu.InterviewStatsIndex()
+    index.rebuild(mensetsu.InterviewRecordStore(records))
+    assert _same_stats(index, _brute_stats(mensetsu, records))
+
+
+def test_append_and_remove_keep_stats_in_sync(mensetsu, tmp_path):
+    records = _records(mensetsu, 300, seed=2)
+    dm = _manager(mensetsu, tmp_path, records[:200])
+    for rec in records[200:]:
+        dm.add_interview_record(rec)
+    assert dm.interview_records == records
+
+    ym = mensetsu._record_year_month(records[0])
+    drop = dm.interview_records.rows(year_month=ym, interviewer_id=records[0]["interviewer_id"])
+    assert dm.remove_interview_rows(drop) == len(drop)
+    kept = [r for i, r in enumerate(records) if i not in set(drop)]
+    assert dm.interview_records == kept
+    assert _same_stats(dm.stats_index, _brute_stats(mensetsu, kept))
+    assert dm.interview_records.month_cells(ym) == _brute_cells(mensetsu, kept, ym)
+
+    dm.interview_records = list(dm.interview_records)     # 再構築しても同じ
+    assert _same_stats(dm.stats_index, _brute_stats(mensetsu, kept))
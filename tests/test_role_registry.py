@@ -0,0 +1,102 @@
+"""RoleRegistry の名前→ID キャッシュと、ロールの作成・改名・削除での無効化"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+
+class Guild:
+    def __init__(self, guild_id, roles):
+        self.id = guild_id
+        self.roles = []
+        for role_id, name in roles:
+            self.add_role(role_id, name)
+
+    def add_role(self, role_id, name):
+        role = SimpleNamespace(id=role_id, name=name, guild=self)
+        self.roles.append(role)
+        return role
+
+    def remove_role(self, role):
+        self.roles.remove(role)
+
+    def get_role(self, role_id):
+        return next((r for r in self.roles if r.id == role_id), None)
+
+
+@pytest.fixture
+def guild():
+    return Guild(1, [(100, "面接手伝い"), (101, "候補者")])
+
+
+def test_name_scan_happens_once(mensetsu, guild):
+    reg = mensetsu.RoleRegistry()
+    assert reg.resolve(guild, "面接手伝い").id == 100
+    assert reg.resolve(guild, "面接手伝い").id == 100
+    assert reg.resolve(guild, "無いロール") is None
+    assert reg.resolve(guild, "無いロール") is None
+    assert (reg.lookups, reg.scans) == (4, 2)
+
+
+def test_rename_invalidates_old_and_new_names(mensetsu, guild):
+    reg = mensetsu.RoleRegistry()
+    helper = guild.get_role(100)
+    assert reg.resolve(guild, "面接手伝い") is helper
+    assert reg.resolve(guild, "面接補助") is None          # 見つからない組も覚えている
+
+    helper.name = "面接補助"
+    reg.invalidate(helper, "面接手伝い")
+    assert reg.resolve(guild, "面接補助") is helper
+    assert reg.resolve(guild, "面接手伝い") is None
+
+
+def test_delete_and_create_invalidate(mensetsu, guild, monkeypatch):
+    reg = mensetsu.RoleRegistry()
+    monkeypatch.setattr(mensetsu, "role_registry", reg)
+    cog = mensetsu.EventCog(None)
+    old = guild.get_role(101)
+    assert reg.resolve(guild, "候補者") is old
+
+    guild.remove_role(old)
+    asyncio.run(cog.on_guild_role_delete(old))
+    assert reg.resolve(guild, "候補者") is None
+    scans = reg.scans
+
+    new = guild.add_role(102, "候補者")
+    asyncio.run(cog.on_guild_role_create(new))           # 「見つからない」の記憶も捨てる
+    assert reg.resolve(guild, "候補者") is new
+    assert reg.scans == scans + 1
+
+
+def test_rename_event_through_cog(mensetsu, guild, monkeypatch):
+    reg = mensetsu.RoleRegistry()
+    monkeypatch.setattr(mensetsu, "role_registry", reg)
+    helper = guild.get_role(100)
+    assert reg.resolve(guild, "面接手伝い") is helper
+    assert reg.resolve(guild, "面接補助") is None
+
+    before = SimpleNamespace(id=100, name="面接手伝い", guild=guild)
+    helper.name = "面接補助"
+    asyncio.run(mensetsu.EventCog(None).on_guild_role_update(before, helper))
+    assert reg.resolve(guild, "面接補助") is helper
+    assert reg.resolve(guild, "面接手伝い") is None
+
+
+def test_stale_id_is_rescanned_without_event(mensetsu, guild):
+    reg = mensetsu.RoleRegistry()
+    helper = guild.get_role(100)
+    assert reg.resolve(guild, "面接手伝い") is helper
+    helper.name = "別の名前"                              # イベントを取りこぼした
+    assert reg.resolve(guild, "面接手伝い") is None
+    assert reg.scans == 2
+
+
+def test_found_ids_are_persisted(mensetsu, guild, tmp_path):
+    path = tmp_path / "role_cache.json"
+    reg = mensetsu.RoleRegistry(str(path))
+    reg.resolve(guild, "面接手伝い")
+    reg.resolve(guild, "無いロール")
+    assert json.loads(path.read_text(encoding="utf-8")) == [[1, "面接手伝い", 100]]
+    again = mensetsu.RoleRegistry(str(path))
+    assert again.resolve(guild, "面接手伝い").id == 100 and again.scans == 0
@@ -0,0 +1,44 @@
+"""予定表メッセージが見つからなかったときのキャッシュ"""
+import asyncio
+from types import SimpleNamespace
+
+import discord
+
+
+class _Channel:
+    def __init__(self, message=None):
+        self.message = message
+        self.fetches = 0
+        self.id = 555
+
+    async def fetch_message(self, _id):
+        self.fetches += 1
+        if self.message is None:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+        return self.message
+
+
+def test_missing_schedule_is_retried_after_ttl(mensetsu, monkeypatch):
+    channel = _Channel()
+    guild = SimpleNamespace(text_channels=[channel], get_channel=lambda _id: None)
+    bot = SimpleNamespace(get_guild=lambda _id: guild)
+    monkeypatch.setattr(mensetsu, "_schedule_cache", {"text": None, "retry_at": 0.0})
+    monkeypatch.setattr(mensetsu.data_manager, "schedule_channel_id", None)
+
+    async def no_save():
+        pass
+
+    monkeypatch.setattr(mensetsu.data_manager, "save_data", no_save)
+
+    async def scenario():
+        assert await mensetsu._fetch_schedule_text(bot) == ""
+        assert await mensetsu._fetch_schedule_text(bot) == ""
+        assert channel.fetches == 1                      # TTL 内は探し直さない
+        # 予定表が投稿された後、TTL が切れたら拾える
+        channel.message = SimpleNamespace(content="たろう 平日 20-23", embeds=[])
+        mensetsu._schedule_cache["retry_at"] = 0.0
+        assert await mensetsu._fetch_schedule_text(bot) == "たろう 平日 20-23"
+        assert await mensetsu._fetch_schedule_text(bot) == "たろう 平日 20-23"
+        assert channel.fetches == 2
+
+    asyncio.run(scenario())
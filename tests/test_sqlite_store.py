@@ -0,0 +1,114 @@
+"""SqliteStore: JSON からの移行、保存・ロードの往復、索引付き参照"""
+import asyncio
+import json
+
+import pytest
+
+
+RECORDS = [
+    {"date": "2025-03-01T10:00:00+09:00", "interviewer_id": 1, "interviewee_id": 100, "result": "PASS"},
+    {"date": "2025-03-02T10:00:00+09:00", "interviewer_id": 2, "interviewee_id": 101, "result": "FAIL"},
+    {"date": "2025-04-01T10:00:00+09:00", "interviewer_id": 1, "interviewee_id": 100, "result": "BAN"},
+    {"date": "2025-03-03T10:00:00+09:00", "interviewer_id": 2, "interviewee_id": "manual_set_x", "result": "manual_set"},
+]
+
+
+@pytest.fixture
+def sqlite_path(mensetsu, tmp_path, monkeypatch):
+    path = tmp_path / "interview_records.sqlite3"
+    monkeypatch.setattr(mensetsu, "SQLITE_DATA_FILE", str(path))
+    return path
+
+
+def _manager(mensetsu, tmp_path, data=None):
+    path = tmp_path / "interview_records.json"
+    if data is not None:
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return mensetsu.DataManager(str(path), storage_mode="sqlite", flush_interval=0)
+
+
+def _reload(mensetsu, tmp_path):
+    # JSON を消しても DB から同じ状態が読めること
+    (tmp_path / "interview_records.json").unlink(missing_ok=True)
+    return _manager(mensetsu, tmp_path)
+
+
+def test_migrates_legacy_list(mensetsu, tmp_path, sqlite_path):
+    dm = _manager(mensetsu, tmp_path, RECORDS)
+    assert dm.store.migrated
+    again = _reload(mensetsu, tmp_path)
+    assert again.interview_records == RECORDS
+    assert again.stats_index.counts_for_month("2025-03") == {1: 1, 2: 2}
+
+
+def test_migrates_legacy_dict(mensetsu, tmp_path, sqlite_path):
+    dm = _manager(mensetsu, tmp_path, {
+        "interview_records": RECORDS,
+        "candidate_progress": {"1-10": {"candidate_id": 10, "channel_id": 500, "voice_channel_id": 501}},
+        "interview_channel_mapping": {"500": "1-10"},
+        "memo_history": {"1-10": [{"interviewer_id": 1, "channel_id": 500, "result": "PASS"}]},
+        "interviewer_stats_message_ids": {"2025-03": 9},
+    })
+    assert dm.store.migrated
+    again = _reload(mensetsu, tmp_path)
+    assert again.interview_records == RECORDS
+    assert again.candidate_progress == dm.candidate_progress
+    assert again.interview_channel_mapping == dm.interview_channel_mapping == {500: "1-10", 501: "1-10"}
+    assert again.memo_history == dm.memo_history
+    assert again.interviewer_stats_message_ids == {"2025-03": 9}
+
+
+def test_save_load_round_trip(mensetsu, tmp_path, sqlite_path):
+    dm = _manager(mensetsu, tmp_path, {})
+    for rec in RECORDS:
+        dm.add_interview_record(rec)
+    dm.put_candidate("1-10", {"candidate_id": 10, "channel_id": 500, "status": "in_progress"})
+    dm.link_channel(500, "1-10")
+    dm.memo_history["1-10"] = [{"interviewer_id": 1, "result": "PASS"}]
+    asyncio.run(dm.save_data())
+
+    dm.pop_candidate("1-10")
+    dm.unlink_channel(500)
+    dm.remove_interview_rows(dm.interview_records.rows(result="FAIL"))
+    asyncio.run(dm.save_data())
+
+    again = _reload(mensetsu, tmp_path)
+    assert again.interview_records == [r for r in RECORDS if r["result"] != "FAIL"]
+    assert again.candidate_progress == {} and again.interview_channel_mapping == {}
+    assert again.memo_history == {"1-10": [{"interviewer_id": 1, "result": "PASS"}]}
+
+
+def test_lookups_use_sqlite_only_when_current(mensetsu, tmp_path, sqlite_path, monkeypatch):
+    dm = _manager(mensetsu, tmp_path, {
+        "interview_records": RECORDS,
+        "candidate_progress": {"1-10": {"candidate_id": 10, "channel_id": 500, "voice_channel_id": 501}},
+        "interview_channel_mapping": {"500": "1-10"},
+    })
+    dm = _reload(mensetsu, tmp_path)
+    asyncio.run(dm.flush())       # ロード時に補った VC の対応を書いてから DB を引く
+    calls = []
+    for name in ("records_for_interviewer_month", "records_for_interviewee", "progress_key_for_channel"):
+        original = getattr(dm.store, name)
+        monkeypatch.setattr(dm.store, name, lambda *a, _o=original, _n=name: calls.append(_n) or _o(*a))
+
+    assert dm.records_for_interviewer_month(2, "2025-03") == [RECORDS[1], RECORDS[3]]
+    assert dm.records_for_interviewee(100) == [RECORDS[0], RECORDS[2]]
+    assert dm.latest_interviewer(101) == 2
+    assert dm.progress_key_for_channel(501) == "1-10"     # VC からも引ける
+    assert dm.progress_key_for_channel(999) is None
+    assert len(calls) == 5
+
+    # 未保存の変更があるあいだはメモリ側で答える（DB にはまだ無い記録も見える）
+    calls.clear()
+    new = {"date": "2025-03-05T10:00:00+09:00", "interviewer_id": 3, "interviewee_id": 101, "result": "PASS"}
+    dm.add_interview_record(new)
+    dm.pop_candidate("1-10")
+    assert dm.latest_interviewer(101) == 3
+    assert dm.records_for_interviewer_month(3, "2025-03") == [new]
+    assert dm.progress_key_for_channel(500) is None
+    assert calls == []
+
+    asyncio.run(dm.flush())
+    assert dm.latest_interviewer(101) == 3
+    assert dm.progress_key_for_channel(500) is None
+    assert calls == ["records_for_interviewee", "progress_key_for_channel"]
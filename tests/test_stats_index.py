@@ -0,0 +1,81 @@
+"""InterviewStatsIndex の add / remove / rebuild が全件からの数え直しと一致すること"""
+import random
+from collections import Counter
+
+
+def _records(n, seed=0):
+    rng = random.Random(seed)
+    recs = []
+    for _ in range(n):
+        recs.append({
+            "date": f"2025-{rng.randint(1, 4):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00+09:00",
+            "interviewer_id": rng.choice([1, 2, 3, "4", None]),
+            "interviewee_id": rng.randint(100, 200),
+            "result": rng.choice(["PASS", "FAIL", "ban", "INTERVAL (遅延)", "manual_set"]),
+        })
+    recs.append({"date": "壊れた日付", "interviewer_id": 1, "interviewee_id": 1, "result": "PASS"})
+    return recs
+
+
+def _from_scratch(mensetsu, records):
+    """{ym: ({interviewer_id: 件数}, {RESULT: 件数})}"""
+    totals, results = {}, {}
+    for rec in records:
+        ym = mensetsu._record_year_month(rec)
+        iid = mensetsu._as_int(rec.get("interviewer_id"))
+        if ym is None or iid is None:
+            continue
+        totals.setdefault(ym, Counter())[iid] += 1
+        results.setdefault(ym, Counter())[str(rec["result"]).upper()] += 1
+    return {ym: (dict(totals[ym]), dict(results[ym])) for ym in totals}
+
+
+def _snapshot(index):
+    return {ym: (index.counts_for_month(ym), index.result_counts(ym)) for ym in index.months()}
+
+
+def test_add_matches_from_scratch(mensetsu):
+    records = _records(400)
+    index = mensetsu.InterviewStatsIndex()
+    for rec in records:
+        index.add(rec)
+    assert _snapshot(index) == _from_scratch(mensetsu, records)
+
+
+def test_remove_matches_from_scratch_and_drops_empty_months(mensetsu):
+    records = _records(400, seed=1)
+    index = mensetsu.InterviewStatsIndex()
+    for rec in records:
+        index.add(rec)
+    rng = random.Random(2)
+    removed = rng.sample(range(len(records)), 250)
+    for i in removed:
+        index.remove(records[i])
+    kept = [r for i, r in enumerate(records) if i not in set(removed)]
+    assert _snapshot(index) == _from_scratch(mensetsu, kept)
+
+    for rec in kept:
+        index.remove(rec)
+    assert index.months() == set()
+    index.remove(records[0])                    # 数えていない記録を消しても負にならない
+    assert index.months() == set()
+
+
+def test_rebuild_from_list_and_store_agree(mensetsu):
+    records = _records(400, seed=3)
+    expected = _from_scratch(mensetsu, records)
+    from_list, from_store = mensetsu.InterviewStatsIndex(), mensetsu.InterviewStatsIndex()
+    from_list.add({"date": "2025-01-01T00:00:00+09:00", "interviewer_id": 9, "result": "PASS"})
+    from_list.rebuild(records)                   # 以前の内容は捨てる
+    from_store.rebuild(mensetsu.InterviewRecordStore(records))
+    assert _snapshot(from_list) == expected
+    assert _snapshot(from_store) == expected
+
+
+def test_returned_counts_are_copies(mensetsu):
+    index = mensetsu.InterviewStatsIndex()
+    index.add({"date": "2025-03-01T00:00:00+09:00", "interviewer_id": 1, "result": "pass"})
+    index.counts_for_month("2025-03")[1] = 99
+    index.result_counts("2025-03")["PASS"] = 99
+    assert index.counts_for_month("2025-03") == {1: 1}
+    assert index.result_counts("2025-03") == {"PASS": 1}
@@ -0,0 +1,74 @@
+"""DataManager の write-behind: 保存要求の集約・shutdown() での書き出し・回数の集計"""
+import asyncio
+import json
+
+
+def _manager(mensetsu, tmp_path, flush_interval):
+    return mensetsu.DataManager(
+        str(tmp_path / "interview_records.json"), storage_mode="json", flush_interval=flush_interval
+    )
+
+
+def _saved_records(tmp_path):
+    path = tmp_path / "interview_records.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))["interview_records"]
+
+
+def _rec(i):
+    return {"date": f"2025-03-01T10:00:{i:02d}+09:00", "interviewer_id": 1, "interviewee_id": i, "result": "PASS"}
+
+
+def test_burst_of_saves_is_written_once(mensetsu, tmp_path):
+    dm = _manager(mensetsu, tmp_path, flush_interval=0.05)
+
+    async def scenario():
+        for i in range(10):
+            dm.add_interview_record(_rec(i))
+            await dm.save_data()
+        assert dm.save_writes == 0 and _saved_records(tmp_path) is None    # まだ書いていない
+        await asyncio.sleep(0.15)
+        assert dm.save_writes == 1
+        await dm.shutdown()
+
+    asyncio.run(scenario())
+    assert len(_saved_records(tmp_path)) == 10
+    assert (dm.save_requests, dm.save_writes, dm.coalesced_saves) == (10, 1, 9)
+    stats = dm.persistence_stats()
+    assert stats["coalesced"] == 9 and stats["dirty"] is False
+
+
+def test_shutdown_flushes_pending_changes(mensetsu, tmp_path):
+    dm = _manager(mensetsu, tmp_path, flush_interval=60)
+
+    async def scenario():
+        for i in range(3):
+            dm.add_interview_record(_rec(i))
+            await dm.save_data()
+        await dm.shutdown()                     # 60 秒待たずに書き出す
+
+    asyncio.run(scenario())
+    assert len(_saved_records(tmp_path)) == 3
+    assert dm.save_writes == 1 and dm._flusher is None
+    assert dm.persistence_stats()["dirty"] is False
+
+
+def test_flush_and_disabled_write_behind_write_immediately(mensetsu, tmp_path):
+    dm = _manager(mensetsu, tmp_path, flush_interval=60)
+
+    async def scenario():
+        dm.add_interview_record(_rec(0))
+        await dm.save_data()
+        await dm.flush()                        # 応答前に永続化が必要な箇所
+        assert len(_saved_records(tmp_path)) == 1
+        await dm.shutdown()                     # 書き出し済みなので書かない
+
+    asyncio.run(scenario())
+    assert (dm.save_requests, dm.save_writes) == (2, 1)
+
+    (tmp_path / "sync").mkdir()
+    sync = _manager(mensetsu, tmp_path / "sync", flush_interval=0)     # write-behind 無効
+    asyncio.run(sync.save_data())
+    asyncio.run(sync.save_data())
+    assert (sync.save_requests, sync.save_writes, sync.coalesced_saves) == (2, 2, 0)
@@ -0,0 +1,68 @@
+"""
+YES/NO 辞書判定（classify_yes_no_local）のラベル付きコーパスと精度チェック。
+
+辞書で決めた返答は 100% 正しいこと（外すくらいなら Gemini に回す）、
+質問の向きで意味が変わる返答は辞書で決めないことを確認する。
+"""
+import asyncio
+
+import pytest
+
+# (返答, 正解)。正解は PROFILE_INRATE_QUESTION / PROFILE_MOVE_QUESTION のどちらに
+# 答えても同じ向きになる返答だけを YES / NO とし、それ以外は None（Gemini 行き）
+CORPUS = [
+    ("はい", "YES"), ("はい！", "YES"), ("はい。大丈夫です", "YES"), ("はい、問題ありません", "YES"),
+    ("大丈夫です！", "YES"), ("だいじょうぶです", "YES"), ("OK", "YES"), ("ｏｋです", "YES"),
+    ("Yes", "YES"), ("yes!", "YES"), ("もちろんです", "YES"), ("もちろん！", "YES"),
+    ("可能です", "YES"), ("できます", "YES"), ("いけます", "YES"), ("了解です", "YES"),
+    ("承知しました", "YES"), ("👍", "YES"), ("⭕️", "YES"), ("はいー", "YES"), ("うん", "YES"),
+    ("はい 大丈夫です。", "YES"), ("問題ないです", "YES"), ("問題ありません", "YES"),
+    ("sure", "YES"), ("Of course", "YES"), ("はい、できます！", "YES"),
+    ("いいえ", "NO"), ("いいえ、無理です", "NO"), ("無理です", "NO"), ("むりです…", "NO"),
+    ("できません", "NO"), ("No", "NO"), ("nope", "NO"), ("❌", "NO"), ("🙅", "NO"),
+    ("いや、無理です", "NO"),
+    # 質問の向きで YES/NO が入れ替わる（在住確認なら NO、イン率確認なら YES）
+    ("ありません", None), ("ございません", None), ("ないです", None), ("ない", None),
+    ("あります", None), ("はい、ありません", None), ("いいえ、ありません", None),
+    ("予定はありません", None),
+    # 条件付き・曖昧
+    ("たぶん大丈夫です", None), ("はい、でも週2しか無理かも", None), ("わかりません", None),
+    ("検討中です", None), ("大丈夫ですか？", None), ("うーん", None), ("時期によります", None),
+    ("週3は厳しいです", None), ("ちょっと難しいです", None), ("maybe", None), ("?", None),
+    ("ありがとうございます", None), ("仕事次第です", None),
+    # 語尾を文字集合で削ると辞書語になってしまう英単語
+    ("now", None), ("know", None), ("nok", None), ("yesw", None),
+    # 終助詞・伸ばしはかなの後ろだけ落とす
+    ("大丈夫ですよ", "YES"), ("大丈夫ですよー", "YES"), ("了解ですw", "YES"), ("いいえー", "NO"),
+]
+
+
+def test_lexicon_precision(mensetsu):
+    decided = [(text, label, mensetsu.classify_yes_no_local(text)) for text, label in CORPUS]
+    wrong = [(text, label, got) for text, label, got in decided if got is not None and got != label]
+    assert wrong == []
+    # 明らかな返答は Gemini に回さずに済んでいること
+    hits = sum(1 for _, label, got in decided if label is not None and got == label)
+    assert hits / sum(1 for _, label in CORPUS if label is not None) >= 0.9
+
+
+@pytest.mark.parametrize("text", ["ありません", "問題ありません", "はい、問題ありません"])
+def test_inrate_answer_is_never_local_no(mensetsu, text):
+    # PROFILE_INRATE_QUESTION（問題はございませんでしょうか？）への返答で
+    # 辞書が NO を返すと、同意した候補者が不合格になってしまう
+    assert mensetsu.classify_yes_no_local(text) != "NO"
+
+
+def test_polar_answer_reaches_model_with_question(mensetsu, monkeypatch):
+    prompts = []
+
+    async def fake_generate(prompt, **kwargs):
+        prompts.append(prompt)
+        return "YES"
+
+    monkeypatch.setattr(mensetsu.ai_gateway, "generate", fake_generate)
+    result = asyncio.run(
+        mensetsu.classify_yes_no_ai("ありません", question=mensetsu.PROFILE_INRATE_QUESTION)
+    )
+    assert result == "YES"
+    assert len(prompts) == 1 and mensetsu.PROFILE_INRATE_QUESTION in prompts[0]